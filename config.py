@@ -4,6 +4,9 @@ import json
 import os
 from decimal import Decimal
 from pathlib import Path
+from typing import ClassVar
+
+from models.vendor import VendorType
 
 
 class Config:
@@ -18,8 +21,177 @@ class Config:
 
     # Processing
     MAX_WORKERS = 4
+
+    # CPU budget split between workers and the intra-op threads each worker's
+    # Docling models (torch, OCR engines) may use; 0 means all cores / an even
+    # share of the budget. See utils.resource_budget.
+    CPU_BUDGET = 0
+    MODEL_THREADS = 0
     BATCH_SIZE = 50
 
+    # Conversion cache (stored under CACHE_DIR, keyed by PDF content hash)
+    USE_CONVERSION_CACHE = True
+
+    # OCR page cache (stored under CACHE_DIR/ocr, keyed by rendered page image
+    # hash and OCR engine options), so repeated letterheads, cover sheets and
+    # re-sent pages are only OCR'd once
+    USE_OCR_CACHE = True
+
+    # Docling pipeline profiles, selected per vendor before conversion.
+    # - ocr: "auto" probes each PDF's embedded text layer and only runs OCR on
+    #   documents without one; "always" / "never" force a single pipeline
+    # - ocr_engine: Docling OCR engine for the OCR variant (default OCR_ENGINE)
+    # - force_full_page_ocr: OCR whole pages, not only bitmaps (default True)
+    # - table_mode: "accurate" or "fast" TableFormer model
+    # - layout_model: optional spec name from docling.datamodel.layout_model_specs
+    PIPELINE_PROFILES: ClassVar[dict[str, dict]] = {
+        "default": {
+            "ocr": "auto",
+            "do_table_structure": True,
+            "table_mode": "accurate",
+            "images_scale": 1.0,
+            "layout_model": None,
+        },
+        "scanned": {
+            "ocr": "always",
+            "do_table_structure": True,
+            "table_mode": "accurate",
+            "images_scale": 1.0,
+            "layout_model": None,
+        },
+        "simple": {
+            "ocr": "auto",
+            "do_table_structure": True,
+            "table_mode": "fast",
+            "images_scale": 1.0,
+            "layout_model": None,
+        },
+    }
+    DEFAULT_PIPELINE_PROFILE = "default"
+    VENDOR_PIPELINE_PROFILES: ClassVar[dict[VendorType, str]] = {
+        VendorType.ABOX: "scanned",
+        VendorType.AMANDA_ANDREWS: "simple",
+        VendorType.STOLZLE_LAUSITZ: "simple",
+    }
+
+    # Global OCR override: "always" / "never" apply to every profile,
+    # "auto" defers to each profile's "ocr" setting
+    OCR_MODE = "auto"
+    TEXT_LAYER_MIN_CHARS = 20  # per page, for the text layer to count as usable
+
+    # Metadata index (CACHE_DIR/metadata_index.json): page count, size,
+    # text-layer presence and producer of every PDF, read with pypdfium2 from
+    # the bytes read ahead for conversion (or by scripts/scan_bills.py). Used
+    # to choose OCR variants without probing and to schedule the most
+    # expensive files first, with cost estimated from these per-page
+    # conversion times.
+    USE_METADATA_INDEX = True
+    ESTIMATED_SECONDS_PER_PAGE: ClassVar[dict[str, float]] = {"ocr": 4.0, "text": 1.0}
+
+    # OCR engine for profiles that don't set ocr_engine: "auto" lets Docling
+    # choose, or one of processors.ocr_engines.OCR_ENGINES. Engines that are
+    # not installed fall back to "auto". scripts/calibrate_ocr.py times the
+    # installed engines on this machine and saves the winner as the
+    # environment's "ocr_engine".
+    OCR_ENGINE = "auto"
+
+    # Recovery of pages that OCR returns (near-)empty: failing pages are
+    # re-converted, bypassing the OCR page cache, with each attempt's profile
+    # overrides in turn until they read or the time budget runs out. OCR
+    # engines render pages at their own fixed resolution (images_scale does
+    # not change what they see), so attempts switch the engine (ocr_engine is
+    # a Docling OCR kind: auto, easyocr, tesseract, tesserocr, rapidocr,
+    # ocrmac); attempts repeating the profile's engine or naming one that is
+    # not installed are skipped.
+    OCR_EMPTY_PAGE_MIN_CHARS = 20
+    OCR_RETRY_ATTEMPTS: ClassVar[list[dict]] = [
+        {"ocr_engine": "tesseract"},
+        {"ocr_engine": "easyocr"},
+    ]
+    OCR_RETRY_BUDGET_SECONDS = 60
+
+    # Load Docling models (and convert a synthetic page) before the first
+    # real bill, so start-up cost is paid, and timed, separately
+    WARMUP_MODELS = True
+
+    # Batch execution backend: "thread" (shared converter), "process"
+    # (process pool with a warm converter per worker) or "stream" (Docling
+    # bulk conversion feeding extraction threads)
+    EXECUTION_BACKEND = "thread"
+
+    # Docling bulk conversion ("stream" backend)
+    DOC_BATCH_SIZE = 4  # documents processed together
+    PAGE_BATCH_SIZE = 8  # pages per model batch
+    STREAM_CHUNK_BATCHES = 4  # doc batches read ahead from the input stream
+
+    # In-memory document cache budget (approximate, in serialized MB)
+    DOCUMENT_CACHE_MAX_MB = 512
+
+    # Reduce converted documents to compact records (markdown, table grids,
+    # page count and text provenance) and drop the DoclingDocument right away
+    COMPACT_DOCUMENTS = True
+
+    # Render markdown for extraction without Docling's table alignment
+    # padding (see processors.compact_markdown), so extractor regexes scan
+    # far shorter strings
+    COMPACT_MARKDOWN = True
+
+    # Read-ahead of source PDFs: up to PREFETCH_FILES files are read (and
+    # hashed) ahead of the workers by PREFETCH_WORKERS threads, so
+    # "online-only" files on a cloud-synced SOURCE_DIR download in parallel.
+    # 0 disables it. Each file is read once: its bytes are held until its
+    # conversion takes them, so about PREFETCH_FILES files beyond those the
+    # workers have started (each under MAX_FILE_SIZE_MB) are held at a time.
+    PREFETCH_FILES = 8
+    PREFETCH_WORKERS = 4
+
+    # Per-document conversion limits (None disables a limit). Files that
+    # exceed one are quarantined and skipped by later runs until they change.
+    MAX_CONVERSION_SECONDS = 300
+    MAX_PAGES = 40
+    MAX_FILE_SIZE_MB = 50
+
+    # Page-parallel conversion of long PDFs: documents with at least
+    # PAGE_SPLIT_MIN_PAGES pages (None disables) are converted in ranges of
+    # PAGE_SPLIT_CHUNK_PAGES pages on PAGE_SPLIT_WORKERS threads per worker
+    # and merged with their original page numbers. Range threads count
+    # against CPU_BUDGET: 0 means the cores left over once every worker has
+    # its MODEL_THREADS, and 1 converts long documents whole. All ranges of a
+    # document share one MAX_CONVERSION_SECONDS.
+    PAGE_SPLIT_MIN_PAGES = 8
+    PAGE_SPLIT_CHUNK_PAGES = 4
+    PAGE_SPLIT_WORKERS = 0
+
+    # Boilerplate pages: for vendors with an entry in
+    # VENDOR_BOILERPLATE_PATTERNS, trailing pages whose embedded text matches
+    # one of the vendor's boilerplate patterns and none of
+    # INVOICE_DATA_PATTERNS are not converted. Skipping is opt-in per vendor
+    # (DEFAULT_BOILERPLATE_PATTERNS is a starting list to opt in with), since
+    # a dropped page that did carry totals loses them silently. Patterns are
+    # case-insensitive regexes. The first page and pages without a text
+    # layer (scans) are always converted.
+    SKIP_BOILERPLATE_PAGES = True
+    DEFAULT_BOILERPLATE_PATTERNS: ClassVar[list[str]] = [
+        r"terms\s+(and|&)\s+conditions",
+        r"conditions\s+of\s+sale",
+        r"remittance\s+advice",
+        r"detach\s+and\s+return",
+    ]
+    VENDOR_BOILERPLATE_PATTERNS: ClassVar[dict[VendorType, list[str]]] = {}
+    # Any field an extractor reads keeps a page
+    INVOICE_DATA_PATTERNS: ClassVar[list[str]] = [
+        r"\b(qty|quantity)\b",
+        r"\bunit\s+price\b",
+        r"\bsub[\s-]*total\b",
+        r"\btotal\b",
+        r"\bbalance\s+due\b",
+        r"\bamount\s+due\b",
+        r"\b(sales\s+)?tax\b",
+        r"\bfreight\b",
+        r"\binvoice\s*(no\b|number|#|date)",
+        r"\bp\.?\s?o\.?\s*(no\b|number|#|/rel)",
+    ]
+
     # Validation
     MIN_CONFIDENCE_THRESHOLD = 0.6
     REQUIRE_MANUAL_REVIEW_BELOW = 0.8
@@ -87,6 +259,9 @@ class Config:
         cls.SOURCE_DIR = Path(env_settings["source_dir"])
         cls.OUTPUT_DIR = Path(env_settings.get("output_dir", cls.OUTPUT_DIR))
         cls.MAX_WORKERS = env_settings.get("max_workers", cls.MAX_WORKERS)
+        cls.CPU_BUDGET = env_settings.get("cpu_budget", cls.CPU_BUDGET)
+        cls.MODEL_THREADS = env_settings.get("model_threads", cls.MODEL_THREADS)
+        cls.OCR_ENGINE = env_settings.get("ocr_engine", cls.OCR_ENGINE)
         cls.CURRENT_ENVIRONMENT = env_name
 
         # Still allow environment variable overrides
@@ -103,6 +278,10 @@ class Config:
             cls.OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR"))
         if os.getenv("MAX_WORKERS"):
             cls.MAX_WORKERS = int(os.getenv("MAX_WORKERS"))
+        if os.getenv("CPU_BUDGET"):
+            cls.CPU_BUDGET = int(os.getenv("CPU_BUDGET"))
+        if os.getenv("MODEL_THREADS"):
+            cls.MODEL_THREADS = int(os.getenv("MODEL_THREADS"))
         if os.getenv("LOG_LEVEL"):
             cls.LOG_LEVEL = os.getenv("LOG_LEVEL")
         if os.getenv("INCLUDE_DUPLICATES"):
@@ -111,6 +290,54 @@ class Config:
             )
         if os.getenv("DEDUPLICATE_STRATEGY"):
             cls.DEDUPLICATE_STRATEGY = os.getenv("DEDUPLICATE_STRATEGY")
+        if os.getenv("EXECUTION_BACKEND"):
+            cls.EXECUTION_BACKEND = os.getenv("EXECUTION_BACKEND")
+        if os.getenv("OCR_MODE"):
+            cls.OCR_MODE = os.getenv("OCR_MODE")
+        if os.getenv("OCR_ENGINE"):
+            cls.OCR_ENGINE = os.getenv("OCR_ENGINE")
+        if os.getenv("DOCUMENT_CACHE_MAX_MB"):
+            cls.DOCUMENT_CACHE_MAX_MB = int(os.getenv("DOCUMENT_CACHE_MAX_MB"))
+        if os.getenv("COMPACT_DOCUMENTS"):
+            cls.COMPACT_DOCUMENTS = (
+                os.getenv("COMPACT_DOCUMENTS", "true").lower() == "true"
+            )
+        if os.getenv("PREFETCH_FILES"):
+            cls.PREFETCH_FILES = int(os.getenv("PREFETCH_FILES"))
+        if os.getenv("PREFETCH_WORKERS"):
+            cls.PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS"))
+        if os.getenv("COMPACT_MARKDOWN"):
+            cls.COMPACT_MARKDOWN = (
+                os.getenv("COMPACT_MARKDOWN", "true").lower() == "true"
+            )
+        if os.getenv("MAX_CONVERSION_SECONDS"):
+            cls.MAX_CONVERSION_SECONDS = float(os.getenv("MAX_CONVERSION_SECONDS"))
+        if os.getenv("MAX_PAGES"):
+            cls.MAX_PAGES = int(os.getenv("MAX_PAGES"))
+        if os.getenv("MAX_FILE_SIZE_MB"):
+            cls.MAX_FILE_SIZE_MB = float(os.getenv("MAX_FILE_SIZE_MB"))
+        if os.getenv("SKIP_BOILERPLATE_PAGES"):
+            cls.SKIP_BOILERPLATE_PAGES = (
+                os.getenv("SKIP_BOILERPLATE_PAGES", "true").lower() == "true"
+            )
+        if os.getenv("PAGE_SPLIT_MIN_PAGES"):
+            cls.PAGE_SPLIT_MIN_PAGES = int(os.getenv("PAGE_SPLIT_MIN_PAGES"))
+        if os.getenv("PAGE_SPLIT_WORKERS"):
+            cls.PAGE_SPLIT_WORKERS = int(os.getenv("PAGE_SPLIT_WORKERS"))
+        if os.getenv("OCR_RETRY_BUDGET_SECONDS"):
+            cls.OCR_RETRY_BUDGET_SECONDS = float(os.getenv("OCR_RETRY_BUDGET_SECONDS"))
+        if os.getenv("USE_CONVERSION_CACHE"):
+            cls.USE_CONVERSION_CACHE = (
+                os.getenv("USE_CONVERSION_CACHE", "true").lower() == "true"
+            )
+        if os.getenv("WARMUP_MODELS"):
+            cls.WARMUP_MODELS = os.getenv("WARMUP_MODELS", "true").lower() == "true"
+        if os.getenv("USE_OCR_CACHE"):
+            cls.USE_OCR_CACHE = os.getenv("USE_OCR_CACHE", "true").lower() == "true"
+        if os.getenv("USE_METADATA_INDEX"):
+            cls.USE_METADATA_INDEX = (
+                os.getenv("USE_METADATA_INDEX", "true").lower() == "true"
+            )
 
     @classmethod
     def load_from_env(cls):
@@ -131,6 +358,54 @@ class Config:
             "DEDUPLICATE_STRATEGY", cls.DEDUPLICATE_STRATEGY
         )
 
+    @classmethod
+    def update_environment(
+        cls,
+        settings: dict,
+        env_name: str | None = None,
+        config_file: str = "environments.json",
+    ) -> str:
+        """
+        Save settings into an environment in environments.json.
+
+        Args:
+            settings: Keys and values to set (e.g. {"ocr_engine": "rapidocr"})
+            env_name: Environment to update (defaults to the current
+                environment, then INVOICE_ENV, then the file's default)
+            config_file: Path to the environments configuration file.
+
+        Returns:
+            Name of the updated environment
+
+        Raises:
+            FileNotFoundError: If environments.json doesn't exist.
+            ValueError: If the environment doesn't exist in config.
+        """
+        config_path = Path(config_file)
+
+        if not config_path.exists():
+            raise FileNotFoundError(
+                f"Environment configuration file not found: {config_file}"
+            )
+
+        with open(config_path) as f:
+            env_config = json.load(f)
+
+        if env_name is None:
+            env_name = cls.CURRENT_ENVIRONMENT or os.getenv(
+                "INVOICE_ENV", env_config.get("default")
+            )
+
+        if env_name not in env_config["environments"]:
+            raise ValueError(f"Environment '{env_name}' not found in {config_file}.")
+
+        env_config["environments"][env_name].update(settings)
+        with open(config_path, "w") as f:
+            json.dump(env_config, f, indent=2)
+            f.write("\n")
+
+        return env_name
+
     @classmethod
     def list_environments(cls, config_file: str = "environments.json") -> dict:
         """
@@ -159,12 +434,71 @@ class Config:
             for name, settings in env_config["environments"].items()
         }
 
+    @classmethod
+    def export_settings(cls) -> dict:
+        """
+        Snapshot all settings (upper-case class attributes).
+
+        Used to hand the loaded configuration to worker processes, which
+        re-import this module with defaults when started with "spawn".
+
+        Returns:
+            Dict mapping setting names to values
+        """
+        return {
+            name: value
+            for name, value in vars(cls).items()
+            if name.isupper() and not callable(value)
+        }
+
+    @classmethod
+    def apply_settings(cls, settings: dict):
+        """
+        Apply a settings snapshot from export_settings().
+
+        Args:
+            settings: Dict mapping setting names to values
+        """
+        for name, value in settings.items():
+            setattr(cls, name, value)
+
     @classmethod
     def ensure_directories(cls):
         """Create necessary directories if they don't exist."""
         cls.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         cls.CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+    @classmethod
+    def get_pipeline_profile(cls, vendor_type: VendorType) -> str:
+        """
+        Get the Docling pipeline profile name for a vendor.
+
+        Args:
+            vendor_type: VendorType enum value
+
+        Returns:
+            Profile name (key of PIPELINE_PROFILES)
+        """
+        return cls.VENDOR_PIPELINE_PROFILES.get(
+            vendor_type, cls.DEFAULT_PIPELINE_PROFILE
+        )
+
+    @classmethod
+    def get_boilerplate_patterns(cls, vendor_type: VendorType) -> list[str]:
+        """
+        Get the patterns marking a vendor's boilerplate pages.
+
+        Args:
+            vendor_type: VendorType enum value
+
+        Returns:
+            Case-insensitive regexes (empty if the vendor's pages are never
+            skipped, which is the default)
+        """
+        if not cls.SKIP_BOILERPLATE_PAGES:
+            return []
+        return cls.VENDOR_BOILERPLATE_PATTERNS.get(vendor_type, [])
+
     @classmethod
     def get_vendor_directory(cls, vendor_type) -> Path:
         """
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Optional
 
 from models.invoice import Invoice
+from models.table_grid import TableGrid
 from models.vendor import VendorType
 
 logger = logging.getLogger(__name__)
@@ -163,6 +164,50 @@ class BaseExtractor(ABC):
             logger.warning(f"Search failed for '{search_term}': {e}")
             return None
 
+    def _get_tables(self, doc_key: str) -> list[TableGrid]:
+        """
+        Get the document's tables as row/column grids.
+
+        Args:
+            doc_key: Document key
+
+        Returns:
+            List of TableGrid (empty if the tables cannot be read)
+        """
+        try:
+            return self.doc_processor.get_tables(doc_key)
+        except ValueError as e:
+            logger.warning(f"Failed to get tables for {doc_key}: {e}")
+            return []
+
+    def _find_table_rows(
+        self, doc_key: str, *terms: str
+    ) -> tuple[list[str], list[list[str]]] | None:
+        """
+        Find a table by its header row and collect the rows that follow it.
+
+        Tables split across pages come out of Docling as several tables, so
+        the rows of every later table are included too; callers stop at the
+        row that ends their table (e.g. the totals).
+
+        Args:
+            doc_key: Document key
+            terms: Texts that must all appear in the header row
+
+        Returns:
+            Tuple of (header cell texts, rows after the header in document
+            order), or None if no table has such a row
+        """
+        tables = self._get_tables(doc_key)
+        for position, table in enumerate(tables):
+            header_index = table.find_row(*terms)
+            if header_index is not None:
+                rows = table.rows[header_index + 1 :]
+                for continuation in tables[position + 1 :]:
+                    rows.extend(continuation.rows)
+                return table.rows[header_index], rows
+        return None
+
     def _extract_table_data(self, markdown: str, table_marker: str) -> list[dict]:
         """
         Extract table data from markdown.
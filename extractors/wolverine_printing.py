@@ -42,7 +42,7 @@ class WolverinePrintingExtractor(BaseExtractor):
             self._extract_invoice_metadata(markdown, invoice)
 
             # Extract line items from main table
-            self._extract_line_items(markdown, invoice)
+            self._extract_line_items(doc_key, markdown, invoice)
 
             # Extract totals from table footer
             self._extract_totals(markdown, invoice)
@@ -96,8 +96,51 @@ class WolverinePrintingExtractor(BaseExtractor):
         else:
             logger.debug(f"PO number not found in {invoice.source_file}")
 
-    def _extract_line_items(self, markdown: str, invoice: Invoice) -> None:
-        """Extract line items from the main table."""
+    def _extract_line_items(
+        self, doc_key: str, markdown: str, invoice: Invoice
+    ) -> None:
+        """Extract line items from the main table's cells, or its markdown."""
+        found = self._find_table_rows(doc_key, "Quantity Ordered", "Description")
+        if found is None:
+            self._extract_line_items_from_markdown(markdown, invoice)
+            return
+
+        header, rows = found
+        headers = [h for h in header if h]
+        for row in rows:
+            # Same row filters as the markdown path, applied to cell texts
+            parts = [p for p in row if p]
+            row_text = " ".join(parts)
+
+            if (
+                "Sales:" in row_text
+                or "Non-Taxable:" in row_text
+                or "Total:" in row_text
+            ):
+                break
+            if "Terms:" in row_text or "Invoice Number:" in row_text:
+                break
+            # Continuation pages may repeat the header
+            if "Quantity Ordered" in row_text and "Description" in row_text:
+                continue
+            if len(parts) < 3:
+                continue
+
+            if any(
+                keyword in row_text.lower()
+                for keyword in ["ups to", "freight", "shipped =", "net freight"]
+            ):
+                logger.debug(f"Skipping freight/shipping row: {row_text[:50]}")
+                continue
+
+            item = self._parse_item_row(parts, headers)
+            if item and item.amount and item.amount > 0:
+                invoice.line_items.append(item)
+
+    def _extract_line_items_from_markdown(
+        self, markdown: str, invoice: Invoice
+    ) -> None:
+        """Extract line items by parsing the main table's markdown rendering."""
         # Find the table with line items
         # Headers: Quantity Ordered | Quantity Shipped | Order Number or Job | Description | Unit Price | Unit of Measure | Amount
 
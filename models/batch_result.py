@@ -15,10 +15,12 @@ class ProcessingStatus(str, Enum):
 
     SUCCESS = "success"
     FAILED_CONVERSION = "failed_conversion"
+    FAILED_OCR = "failed_ocr"
     FAILED_DETECTION = "failed_detection"
     FAILED_EXTRACTION = "failed_extraction"
     VENDOR_NOT_SUPPORTED = "vendor_not_supported"
     SKIPPED = "skipped"
+    QUARANTINED = "quarantined"
 
 
 class InvoiceResult(BaseModel):
@@ -33,6 +35,8 @@ class InvoiceResult(BaseModel):
     error_message: Optional[str] = None
     processing_time_seconds: Optional[float] = None
     doc_key: Optional[str] = None
+    limit_exceeded: str | None = None  # wall_time, page_count or file_size
+    duplicate_of: str | None = None  # byte-identical file this was copied from
 
 
 class BatchStatistics(BaseModel):
@@ -41,10 +45,13 @@ class BatchStatistics(BaseModel):
     total_files: int
     successful: int
     failed_conversion: int = 0
+    failed_ocr: int = 0
     failed_detection: int = 0
     failed_extraction: int = 0
     vendor_not_supported: int = 0
     skipped: int = 0
+    quarantined: int = 0
+    duplicates: int = 0  # byte-identical copies, counted under their status
 
     # Vendor breakdown
     by_vendor: dict[str, int] = Field(default_factory=dict)
@@ -53,6 +60,21 @@ class BatchStatistics(BaseModel):
     total_processing_time_seconds: float
     average_time_per_file_seconds: float
 
+    # Reading source PDFs: time processing was blocked waiting on the
+    # filesystem, and total read time across the read-ahead threads
+    source_wait_seconds: float = 0.0
+    source_read_seconds: float = 0.0
+
+    # Persistent conversion cache
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    # OCR page cache
+    ocr_cache_hits: int = 0
+    ocr_cache_misses: int = 0
+    ocr_seconds: float = 0.0
+    ocr_seconds_saved: float = 0.0
+
     @property
     def success_rate(self) -> float:
         """Calculate success rate as percentage."""
@@ -60,14 +82,32 @@ class BatchStatistics(BaseModel):
             return 0.0
         return (self.successful / self.total_files) * 100
 
+    @property
+    def cache_hit_rate(self) -> float:
+        """Calculate conversion cache hit rate as percentage."""
+        lookups = self.cache_hits + self.cache_misses
+        if lookups == 0:
+            return 0.0
+        return (self.cache_hits / lookups) * 100
+
+    @property
+    def ocr_cache_hit_rate(self) -> float:
+        """Calculate OCR page cache hit rate as percentage."""
+        lookups = self.ocr_cache_hits + self.ocr_cache_misses
+        if lookups == 0:
+            return 0.0
+        return (self.ocr_cache_hits / lookups) * 100
+
     @property
     def failed_total(self) -> int:
         """Total number of failed invoices."""
         return (
             self.failed_conversion
+            + self.failed_ocr
             + self.failed_detection
             + self.failed_extraction
             + self.vendor_not_supported
+            + self.quarantined
         )
 
 
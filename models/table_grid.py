@@ -0,0 +1,171 @@
+"""Compact row/column view of tables recognized by Docling."""
+
+import re
+
+from pydantic import BaseModel, Field
+
+_NUMERIC_CELL = re.compile(r"^[\s$€£(]*-?[\d.,]+\)?\s*%?$")
+
+
+class GridCell(BaseModel):
+    """A table cell with its position and provenance."""
+
+    text: str
+    row: int
+    col: int
+    row_span: int = 1
+    col_span: int = 1
+    is_header: bool = False
+    page_no: int | None = None
+    bbox: tuple[float, float, float, float] | None = None  # l, t, r, b
+
+
+class TableGrid(BaseModel):
+    """
+    A table as a rectangular grid of cell texts.
+
+    Spanning cells repeat their text in every grid position they cover, so
+    rows always have num_cols entries (matching Docling's markdown export).
+    The first header_rows rows are column headers.
+    """
+
+    index: int  # position among the document's tables
+    page_no: int | None = None
+    num_rows: int = 0
+    num_cols: int = 0
+    rows: list[list[str]] = Field(default_factory=list)
+    header_rows: int = 0
+    cells: list[GridCell] = Field(default_factory=list)
+
+    @classmethod
+    def from_table_item(cls, table, index: int) -> "TableGrid":
+        """
+        Build a grid from a Docling TableItem.
+
+        Header rows are the leading rows Docling marked as column headers;
+        if none are marked, a first row of text labels above a row with
+        numbers is taken as the header.
+
+        Args:
+            table: Docling TableItem
+            index: Position of the table in DoclingDocument.tables
+
+        Returns:
+            TableGrid for the table
+        """
+        prov = table.prov[0] if table.prov else None
+        page_no = prov.page_no if prov else None
+
+        rows = [[cell.text.strip() for cell in row] for row in table.data.grid]
+        cells = [
+            GridCell(
+                text=cell.text.strip(),
+                row=cell.start_row_offset_idx,
+                col=cell.start_col_offset_idx,
+                row_span=cell.end_row_offset_idx - cell.start_row_offset_idx,
+                col_span=cell.end_col_offset_idx - cell.start_col_offset_idx,
+                is_header=cell.column_header or cell.row_header,
+                page_no=page_no,
+                bbox=(cell.bbox.l, cell.bbox.t, cell.bbox.r, cell.bbox.b)
+                if cell.bbox
+                else None,
+            )
+            for cell in table.data.table_cells
+        ]
+
+        header_rows = 0
+        for row in table.data.grid:
+            if row and all(cell.column_header or not cell.text.strip() for cell in row):
+                header_rows += 1
+            else:
+                break
+        if header_rows == len(rows):
+            header_rows = 0
+        if header_rows == 0 and cls._looks_like_header(rows):
+            header_rows = 1
+
+        return cls(
+            index=index,
+            page_no=page_no,
+            num_rows=table.data.num_rows,
+            num_cols=table.data.num_cols,
+            rows=rows,
+            header_rows=header_rows,
+            cells=cells,
+        )
+
+    @staticmethod
+    def _looks_like_header(rows: list[list[str]]) -> bool:
+        """Check whether the first row is text labels over numeric data."""
+        if len(rows) < 2:
+            return False
+
+        first = [text for text in rows[0] if text]
+        if not first or any(_NUMERIC_CELL.match(text) for text in first):
+            return False
+
+        return any(_NUMERIC_CELL.match(text) for row in rows[1:] for text in row)
+
+    @property
+    def headers(self) -> list[str]:
+        """Column names (multi-row headers joined with spaces, deduplicated)."""
+        if self.header_rows == 0:
+            return [""] * self.num_cols
+
+        headers = []
+        for col in range(self.num_cols):
+            parts: list[str] = []
+            for row in self.rows[: self.header_rows]:
+                if row[col] and row[col] not in parts:
+                    parts.append(row[col])
+            headers.append(" ".join(parts))
+        return headers
+
+    @property
+    def body(self) -> list[list[str]]:
+        """Rows below the header."""
+        return self.rows[self.header_rows :]
+
+    def find_row(self, *terms: str) -> int | None:
+        """
+        Find the first row containing every term (case-insensitive).
+
+        Args:
+            terms: Texts that must each appear in some cell of the row
+
+        Returns:
+            Row index, or None if no row matches
+        """
+        lowered_terms = [term.lower() for term in terms]
+        for i, row in enumerate(self.rows):
+            row_text = " | ".join(row).lower()
+            if all(term in row_text for term in lowered_terms):
+                return i
+        return None
+
+    def find_column(self, *names: str) -> int | None:
+        """
+        Find the first column whose header contains any of the names.
+
+        Args:
+            names: Header texts to look for (case-insensitive substrings)
+
+        Returns:
+            Column index, or None if no header matches
+        """
+        lowered_names = [name.lower() for name in names]
+        for col, header in enumerate(self.headers):
+            if any(name in header.lower() for name in lowered_names):
+                return col
+        return None
+
+    def records(self) -> list[dict[str, str]]:
+        """Body rows as dicts keyed by column header."""
+        headers = self.headers
+        return [dict(zip(headers, row)) for row in self.body]
+
+    def estimate_size(self) -> int:
+        """Estimate the memory footprint of the grid in bytes."""
+        return sum(len(text) for row in self.rows for text in row) + 64 * len(
+            self.cells
+        )
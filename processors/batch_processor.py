@@ -2,10 +2,20 @@
 
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Optional
 
 from tqdm import tqdm
 
@@ -19,6 +29,9 @@ from models.batch_result import (
 )
 from models.vendor import VendorType
 from processors.document_processor import DocumentProcessor
+from processors.ocr_recovery import OcrFailedError
+from processors.prefetch import Prefetcher
+from processors.quarantine import ConversionLimitExceeded, QuarantineList
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -30,24 +43,50 @@ class BatchProcessor:
     def __init__(
         self,
         document_processor: Optional[DocumentProcessor] = None,
-        num_workers: int = 4,
+        num_workers: int | None = None,
         output_dir: Optional[Path] = None,
+        backend: str | None = None,
     ):
         """
         Initialize batch processor.
 
         Args:
             document_processor: Document processor instance (creates new if None)
-            num_workers: Number of parallel workers for processing
+            num_workers: Number of parallel workers for processing (defaults
+                to Config.MAX_WORKERS, as split by utils.resource_budget)
             output_dir: Base output directory (defaults to Config.OUTPUT_DIR)
+            backend: "thread" to convert in a thread pool sharing one
+                DocumentProcessor, "process" to convert in a process pool
+                with a warm converter per worker, or "stream" to feed
+                extraction from Docling's bulk conversion (defaults to
+                Config.EXECUTION_BACKEND)
         """
+        backend = backend or Config.EXECUTION_BACKEND
+        if backend not in ("thread", "process", "stream"):
+            raise ValueError(f"Unknown execution backend: {backend}")
+
         self.document_processor = document_processor or DocumentProcessor()
         self.factory = ExtractorFactory(self.document_processor)
-        self.num_workers = num_workers
+        self.num_workers = num_workers or Config.MAX_WORKERS
+        self.backend = backend
         self.output_dir = output_dir or Config.OUTPUT_DIR
         self.run_dir: Optional[Path] = None  # Set when processing starts
+        self.quarantine = QuarantineList(Config.CACHE_DIR / "quarantine.json")
+        self._worker_cache_stats = {"hits": 0, "misses": 0}
+        self._worker_ocr_stats = {
+            "hits": 0,
+            "misses": 0,
+            "ocr_seconds": 0.0,
+            "saved_seconds": 0.0,
+        }
+
+        # Content hash -> first file seen with it, and results by file path,
+        # kept across process_directory calls so copies in other vendor
+        # directories are matched too
+        self._first_path_by_hash: dict[str, Path] = {}
+        self._results_by_path: dict[str, InvoiceResult] = {}
         logger.info(
-            f"BatchProcessor initialized with {num_workers} workers, "
+            f"BatchProcessor initialized with {self.num_workers} {backend} workers, "
             f"{len(self.factory.get_supported_vendors())} supported vendors"
         )
 
@@ -64,6 +103,20 @@ class BatchProcessor:
         logger.info(f"Created run directory: {run_dir}")
         return run_dir
 
+    def warmup(self) -> dict[str, float]:
+        """
+        Load Docling models before processing (see DocumentProcessor.warmup).
+
+        Process-pool workers warm up their own converters as they start, so
+        this does nothing for the "process" backend.
+
+        Returns:
+            Dict mapping pipeline keys to warm-up seconds
+        """
+        if self.backend == "process":
+            return {}
+        return self.document_processor.warmup()
+
     def process_directory(
         self,
         directory: Path,
@@ -104,6 +157,36 @@ class BatchProcessor:
             f"Starting batch processing of {len(pdf_files)} files from {directory}"
         )
 
+        # Skip files quarantined by earlier runs (unless they have changed)
+        # before anything reads them: they are the huge scans that are the
+        # slowest to download from a cloud-synced folder
+        quarantined = []
+        to_process = []
+        for pdf_path in pdf_files:
+            result = self._check_quarantine(pdf_path)
+            if result is not None:
+                quarantined.append(result)
+            else:
+                to_process.append(pdf_path)
+        pdf_files = to_process
+
+        # Schedule the most expensive files first (new and changed files have
+        # no estimate yet, so they go first; the read-ahead indexes them)
+        pdf_files = self._order_by_cost(pdf_files)
+
+        read_seconds_before = self.document_processor.get_source_read_seconds()
+
+        # Files are read (and hashed) Config.PREFETCH_FILES ahead of the
+        # workers, in processing order
+        prefetcher = Prefetcher(
+            self.document_processor.load_source,
+            window=Config.PREFETCH_FILES,
+            workers=Config.PREFETCH_WORKERS,
+        )
+
+        cache_stats_before = self._get_cache_stats()
+        ocr_stats_before = self._get_ocr_cache_stats()
+
         # Initialize batch result
         batch_result = BatchResult(
             started_at=datetime.now(),
@@ -112,39 +195,77 @@ class BatchProcessor:
         )
 
         # Process files in parallel with progress bar
-        with tqdm(total=len(pdf_files), desc="Processing invoices") as pbar:
-            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-                # Submit all tasks
-                future_to_file = {
-                    executor.submit(self._process_single_file, pdf_path): pdf_path
-                    for pdf_path in pdf_files
-                }
-
-                # Collect results as they complete
-                for future in as_completed(future_to_file):
-                    result = future.result()
-                    batch_result.results.append(result)
-
-                    # Update progress bar with status
-                    status_emoji = (
-                        "✅" if result.status == ProcessingStatus.SUCCESS else "❌"
-                    )
-                    pbar.set_postfix_str(
-                        f"{status_emoji} {result.filename[:40]}... ({result.status.value})"
-                    )
-                    pbar.update(1)
-
-                    # Call progress callback if provided
-                    if progress_callback:
-                        progress_callback(result)
+        total_files = len(quarantined) + len(pdf_files)
+        with tqdm(total=total_files, desc="Processing invoices") as pbar:
+            for result in chain(
+                quarantined, self._iter_with_duplicates(pdf_files, prefetcher)
+            ):
+                batch_result.results.append(result)
+
+                # Update progress bar with status
+                status_emoji = (
+                    "✅" if result.status == ProcessingStatus.SUCCESS else "❌"
+                )
+                pbar.set_postfix_str(
+                    f"{status_emoji} {result.filename[:40]}... ({result.status.value})"
+                )
+                pbar.update(1)
+
+                # Call progress callback if provided
+                if progress_callback:
+                    progress_callback(result)
 
         # Finalize batch result
         batch_result.completed_at = datetime.now()
         batch_result.statistics = self._calculate_statistics(batch_result)
 
+        cache_stats_after = self._get_cache_stats()
+        batch_result.statistics.cache_hits = (
+            cache_stats_after["hits"] - cache_stats_before["hits"]
+        )
+        batch_result.statistics.cache_misses = (
+            cache_stats_after["misses"] - cache_stats_before["misses"]
+        )
+
+        ocr_stats_after = self._get_ocr_cache_stats()
+        ocr_delta = {
+            key: ocr_stats_after[key] - ocr_stats_before[key] for key in ocr_stats_after
+        }
+        batch_result.statistics.ocr_cache_hits = int(ocr_delta["hits"])
+        batch_result.statistics.ocr_cache_misses = int(ocr_delta["misses"])
+        batch_result.statistics.ocr_seconds = ocr_delta["ocr_seconds"]
+        batch_result.statistics.ocr_seconds_saved = ocr_delta["saved_seconds"]
+
+        # Reads during conversion are files the read-ahead could not read, so
+        # workers waited on them too
+        conversion_read_seconds = (
+            self.document_processor.get_source_read_seconds() - read_seconds_before
+        )
+        batch_result.statistics.source_wait_seconds = (
+            prefetcher.wait_seconds + conversion_read_seconds
+        )
+        batch_result.statistics.source_read_seconds = (
+            prefetcher.load_seconds + conversion_read_seconds
+        )
+
         # Save batch result to run directory
         self._save_batch_result(batch_result)
 
+        if self.document_processor.metadata_index is not None:
+            self.document_processor.metadata_index.save()
+
+        # Drop files read ahead but never converted (e.g. after an error)
+        self.document_processor.release_sources()
+
+        doc_cache_stats = self.document_processor.get_cache_stats()
+        logger.info(
+            f"Document cache: {doc_cache_stats['entries']} documents, "
+            f"{doc_cache_stats['size_bytes'] / (1024 * 1024):.1f}/"
+            f"{doc_cache_stats['max_bytes'] / (1024 * 1024):.0f} MB, "
+            f"{doc_cache_stats['hits']} hits, {doc_cache_stats['misses']} misses, "
+            f"{doc_cache_stats['evictions']} evictions"
+        )
+
         logger.info(
             f"Batch processing complete: {batch_result.statistics.successful}/{batch_result.statistics.total_files} successful "
             f"({batch_result.statistics.success_rate:.1f}% success rate)"
@@ -152,6 +273,267 @@ class BatchProcessor:
 
         return batch_result
 
+    def _order_by_cost(self, pdf_files: list[Path]) -> list[Path]:
+        """
+        Order files most expensive first, so long conversions start early.
+
+        Costs come from DocumentProcessor.estimate_seconds. Files with no
+        estimate (not in the metadata index) are treated as most expensive,
+        and ties keep their original order.
+
+        Args:
+            pdf_files: Files to convert
+
+        Returns:
+            The same files, most expensive first
+        """
+        estimates = {
+            pdf_path: self.document_processor.estimate_seconds(pdf_path)
+            for pdf_path in pdf_files
+        }
+        known = [seconds for seconds in estimates.values() if seconds is not None]
+        if not known:
+            return pdf_files
+
+        logger.info(
+            f"Estimated conversion time: {sum(known):.0f}s for {len(known)} of "
+            f"{len(pdf_files)} files"
+        )
+
+        def cost(pdf_path: Path) -> float:
+            seconds = estimates[pdf_path]
+            return float("inf") if seconds is None else seconds
+
+        return sorted(pdf_files, key=cost, reverse=True)
+
+    def _iter_with_duplicates(
+        self, pdf_files: list[Path], prefetcher: Prefetcher
+    ) -> Iterator[InvoiceResult]:
+        """
+        Process each unique file once, yielding its result followed by copies.
+
+        Files are read through the prefetcher as the workers ask for them, so
+        reads (and, on a cloud-synced folder, downloads) overlap conversion.
+        Each file is hashed as it is read; a byte-identical copy of a file
+        seen before (in this or an earlier process_directory call) is not
+        converted but reuses the original's result.
+
+        Args:
+            pdf_files: Files to process, in processing order
+            prefetcher: Prefetcher reading files for the document processor
+
+        Yields:
+            InvoiceResult for every file, copies included
+        """
+        # Copies whose original is still being processed, by original path,
+        # and results for copies whose original was already done
+        waiting: dict[str, list[Path]] = {}
+        ready: deque[InvoiceResult] = deque()
+
+        def unique_files() -> Iterator[Path]:
+            for pdf_path, source, error in prefetcher.iter(pdf_files):
+                if isinstance(error, (OSError, ConversionLimitExceeded)):
+                    # Conversion reads the file again and reports the error
+                    logger.warning(f"Could not hash {pdf_path.name}: {error}")
+                    yield pdf_path
+                    continue
+                if error is not None:
+                    raise error
+
+                original = self._first_path_by_hash.setdefault(source.sha256, pdf_path)
+                if original == pdf_path:
+                    yield pdf_path
+                    continue
+
+                logger.info(f"{pdf_path} is a byte-identical copy of {original}")
+                self.document_processor.take_source(pdf_path)
+                earlier_result = self._results_by_path.get(str(original))
+                if earlier_result is not None:
+                    ready.extend(self._fan_out(earlier_result, [pdf_path]))
+                else:
+                    waiting.setdefault(str(original), []).append(pdf_path)
+
+        for result in self._iter_results(unique_files()):
+            self._results_by_path[result.file_path] = result
+            copy_results = self._fan_out(result, waiting.pop(result.file_path, []))
+            yield result
+            yield from copy_results
+            while ready:
+                yield ready.popleft()
+
+        while ready:
+            yield ready.popleft()
+
+    def _fan_out(
+        self, result: InvoiceResult, copies: list[Path]
+    ) -> list[InvoiceResult]:
+        """
+        Build results for byte-identical copies of a processed file.
+
+        The original invoice lists every copy in duplicate_files; each copy
+        gets its own invoice marked as a duplicate of the original.
+
+        Args:
+            result: Result for the original file
+            copies: Paths of the copies
+
+        Returns:
+            One InvoiceResult per copy
+        """
+        copy_results = []
+        for copy_path in copies:
+            invoice = None
+            if result.invoice is not None:
+                result.invoice.duplicate_files.append(str(copy_path))
+                invoice = result.invoice.model_copy(
+                    update={
+                        "source_file": copy_path.name,
+                        "is_duplicate": True,
+                        "duplicate_of": result.file_path,
+                        "duplicate_files": [],
+                    },
+                    deep=True,
+                )
+
+            copy_results.append(
+                result.model_copy(
+                    update={
+                        "filename": copy_path.name,
+                        "file_path": str(copy_path),
+                        "invoice": invoice,
+                        "processing_time_seconds": 0.0,
+                        "duplicate_of": result.file_path,
+                    }
+                )
+            )
+        return copy_results
+
+    def _iter_results(self, pdf_files: Iterable[Path]) -> Iterator[InvoiceResult]:
+        """
+        Process files with the configured backend, yielding each result.
+
+        pdf_files is consumed lazily: the next file is only taken when a
+        worker is free to start it, so the read-ahead stays ahead of the
+        workers rather than of the whole batch.
+        """
+        if self.backend == "process":
+            yield from self._run_process_pool(pdf_files)
+        elif self.backend == "stream":
+            yield from self._run_stream(pdf_files)
+        else:
+            yield from self._run_thread_pool(pdf_files)
+
+    def _iter_completed(
+        self, pdf_files: Iterable[Path], submit: Callable[[Path], Future]
+    ) -> Iterator[tuple[Path, Future]]:
+        """
+        Submit files as workers free up, yielding futures as they complete.
+
+        At most num_workers files are submitted but unfinished, so the next
+        file is only taken from pdf_files when a worker can start it.
+
+        Args:
+            pdf_files: Files to process (consumed lazily)
+            submit: Submits one file to the executor
+
+        Yields:
+            Tuples of (file, completed future)
+        """
+        upcoming = iter(pdf_files)
+        future_to_file: dict[Future, Path] = {}
+        while True:
+            if len(future_to_file) >= self.num_workers:
+                done, _ = wait(future_to_file, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future_to_file.pop(future), future
+
+            pdf_path = next(upcoming, None)
+            if pdf_path is None:
+                break
+            future_to_file[submit(pdf_path)] = pdf_path
+
+        for future in as_completed(list(future_to_file)):
+            yield future_to_file.pop(future), future
+
+    def _run_thread_pool(self, pdf_files: Iterable[Path]) -> Iterator[InvoiceResult]:
+        """Convert and extract each file in a thread pool."""
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            for _, future in self._iter_completed(
+                pdf_files,
+                lambda pdf_path: executor.submit(self._process_single_file, pdf_path),
+            ):
+                yield future.result()
+
+    def _run_process_pool(self, pdf_files: Iterable[Path]) -> Iterator[InvoiceResult]:
+        """
+        Convert files in a process pool and extract in this process.
+
+        Workers return compact payloads (markdown and table grids), which are
+        registered with this process's DocumentProcessor before extraction.
+        """
+        from processors.conversion_worker import convert_to_payload, init_worker
+
+        with ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=init_worker,
+            initargs=(Config.export_settings(),),
+        ) as executor:
+
+            def submit(pdf_path: Path) -> Future:
+                return executor.submit(
+                    convert_to_payload,
+                    str(pdf_path),
+                    self.document_processor.take_source(pdf_path),
+                )
+
+            for pdf_path, future in self._iter_completed(pdf_files, submit):
+                try:
+                    payload = future.result()
+                # Whatever a worker raised is reported against its file
+                except Exception as e:  # noqa: BLE001
+                    yield self._conversion_error_result(pdf_path, e)
+                    continue
+
+                if self.document_processor.conversion_cache is not None:
+                    key = "hits" if payload.cache_hit else "misses"
+                    self._worker_cache_stats[key] += 1
+                for key, value in payload.ocr_cache_stats.items():
+                    self._worker_ocr_stats[key] += value
+
+                self.document_processor.add_payload(payload)
+                result = self._process_single_file(pdf_path)
+                result.processing_time_seconds = (
+                    result.processing_time_seconds or 0
+                ) + payload.conversion_seconds
+                yield result
+
+    def _run_stream(self, pdf_files: Iterable[Path]) -> Iterator[InvoiceResult]:
+        """
+        Bulk-convert files and extract each one as soon as it is converted.
+
+        Conversion runs in this thread via DocumentProcessor.convert_documents;
+        extraction of finished documents is handed to a thread pool.
+        """
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = []
+
+            for pdf_path, doc_key, error in self.document_processor.convert_documents(
+                pdf_files
+            ):
+                if doc_key is None:
+                    yield self._conversion_error_result(pdf_path, error)
+                    continue
+
+                futures.append(executor.submit(self._process_single_file, pdf_path))
+
+                # Yield extraction results that are already done
+                for future in [f for f in futures if f.done()]:
+                    futures.remove(future)
+                    yield future.result()
+
+            for future in as_completed(futures):
+                yield future.result()
+
     def _process_single_file(self, pdf_path: Path) -> InvoiceResult:
         """
         Process a single PDF invoice.
@@ -220,6 +602,9 @@ class BatchProcessor:
                 doc_key=doc_key,
             )
 
+        except (ConversionLimitExceeded, OcrFailedError) as e:
+            return self._conversion_error_result(pdf_path, e, start_time)
+
         except Exception as e:
             logger.error(f"Failed to process {filename}: {str(e)}", exc_info=True)
 
@@ -239,6 +624,105 @@ class BatchProcessor:
                 processing_time_seconds=time.time() - start_time,
             )
 
+    def _check_quarantine(self, pdf_path: Path) -> InvoiceResult | None:
+        """
+        Get a QUARANTINED result for a file quarantined by an earlier run.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            InvoiceResult if the file is quarantined and unchanged, else None
+        """
+        entry = self.quarantine.get(pdf_path)
+        if entry is None:
+            return None
+
+        logger.info(f"Skipping quarantined file {pdf_path.name}: {entry['detail']}")
+        return InvoiceResult(
+            filename=pdf_path.name,
+            file_path=str(pdf_path),
+            status=ProcessingStatus.QUARANTINED,
+            error_message=f"Quarantined: {entry['detail']}",
+            limit_exceeded=entry["limit"],
+        )
+
+    def _conversion_error_result(
+        self, pdf_path: Path, error: Exception, start_time: float | None = None
+    ) -> InvoiceResult:
+        """
+        Build the result for a file whose conversion failed.
+
+        Args:
+            pdf_path: Path to PDF file
+            error: Exception raised (or yielded) by the conversion
+            start_time: When processing of the file started, if known
+
+        Returns:
+            InvoiceResult with QUARANTINED, FAILED_OCR or FAILED_CONVERSION status
+        """
+        if isinstance(error, ConversionLimitExceeded):
+            return self._quarantine_file(pdf_path, error, start_time)
+
+        if isinstance(error, OcrFailedError):
+            # Known-empty document: extractors are never invoked
+            logger.warning(f"OCR failed for {pdf_path.name}: {error}")
+            status = ProcessingStatus.FAILED_OCR
+        else:
+            logger.error(f"Failed to convert {pdf_path.name}: {error}")
+            status = ProcessingStatus.FAILED_CONVERSION
+
+        return InvoiceResult(
+            filename=pdf_path.name,
+            file_path=str(pdf_path),
+            status=status,
+            error_message=str(error),
+            processing_time_seconds=time.time() - start_time if start_time else None,
+        )
+
+    def _quarantine_file(
+        self,
+        pdf_path: Path,
+        error: ConversionLimitExceeded,
+        start_time: float | None = None,
+    ) -> InvoiceResult:
+        """
+        Quarantine a file that exceeded a conversion limit.
+
+        Args:
+            pdf_path: Path to PDF file
+            error: The limit violation
+            start_time: When processing of the file started, if known
+
+        Returns:
+            InvoiceResult with QUARANTINED status
+        """
+        self.quarantine.add(pdf_path, error.limit, error.detail)
+        return InvoiceResult(
+            filename=pdf_path.name,
+            file_path=str(pdf_path),
+            status=ProcessingStatus.QUARANTINED,
+            error_message=error.detail,
+            processing_time_seconds=time.time() - start_time if start_time else None,
+            limit_exceeded=error.limit,
+        )
+
+    def _get_cache_stats(self) -> dict[str, int]:
+        """Get conversion cache counters, including those from worker processes."""
+        stats = dict(self._worker_cache_stats)
+        cache = self.document_processor.conversion_cache
+        if cache is not None:
+            for key, count in cache.get_stats().items():
+                stats[key] += count
+        return stats
+
+    def _get_ocr_cache_stats(self) -> dict[str, float]:
+        """Get OCR page cache counters, including those from worker processes."""
+        stats = dict(self._worker_ocr_stats)
+        for key, value in self.document_processor.get_ocr_cache_stats().items():
+            stats[key] += value
+        return stats
+
     def _save_batch_result(self, batch_result: BatchResult) -> None:
         """
         Save batch result to JSON file in run directory.
@@ -264,10 +748,13 @@ class BatchProcessor:
             total_files=len(batch_result.results),
             successful=0,
             failed_conversion=0,
+            failed_ocr=0,
             failed_detection=0,
             failed_extraction=0,
             vendor_not_supported=0,
             skipped=0,
+            quarantined=0,
+            duplicates=0,
             total_processing_time_seconds=batch_result.duration_seconds or 0,
             average_time_per_file_seconds=0,
         )
@@ -278,6 +765,8 @@ class BatchProcessor:
                 stats.successful += 1
             elif result.status == ProcessingStatus.FAILED_CONVERSION:
                 stats.failed_conversion += 1
+            elif result.status == ProcessingStatus.FAILED_OCR:
+                stats.failed_ocr += 1
             elif result.status == ProcessingStatus.FAILED_DETECTION:
                 stats.failed_detection += 1
             elif result.status == ProcessingStatus.FAILED_EXTRACTION:
@@ -286,6 +775,11 @@ class BatchProcessor:
                 stats.vendor_not_supported += 1
             elif result.status == ProcessingStatus.SKIPPED:
                 stats.skipped += 1
+            elif result.status == ProcessingStatus.QUARANTINED:
+                stats.quarantined += 1
+
+            if result.duplicate_of:
+                stats.duplicates += 1
 
             # Count by vendor
             if result.vendor_type:
@@ -323,6 +817,8 @@ class BatchProcessor:
         print(f"Total Files Processed: {stats.total_files}")
         print(f"Successful:           {stats.successful} ({stats.success_rate:.1f}%)")
         print(f"Failed:               {stats.failed_total}")
+        if stats.duplicates:
+            print(f"Duplicates:           {stats.duplicates} (converted once)")
         print()
 
         # Breakdown by failure type
@@ -331,12 +827,16 @@ class BatchProcessor:
             print("-" * 80)
             if stats.failed_conversion:
                 print(f"  Document Conversion:    {stats.failed_conversion}")
+            if stats.failed_ocr:
+                print(f"  OCR (no usable text):   {stats.failed_ocr}")
             if stats.failed_detection:
                 print(f"  Vendor Detection:       {stats.failed_detection}")
             if stats.failed_extraction:
                 print(f"  Data Extraction:        {stats.failed_extraction}")
             if stats.vendor_not_supported:
                 print(f"  Vendor Not Supported:   {stats.vendor_not_supported}")
+            if stats.quarantined:
+                print(f"  Quarantined (limits):   {stats.quarantined}")
             print()
 
         # Breakdown by vendor
@@ -355,8 +855,34 @@ class BatchProcessor:
         print("-" * 80)
         print(f"  Total Time:      {stats.total_processing_time_seconds:.2f} seconds")
         print(f"  Average per File: {stats.average_time_per_file_seconds:.2f} seconds")
+        if stats.source_read_seconds:
+            print(f"  Waiting on Files: {stats.source_wait_seconds:.2f} seconds")
+            print(
+                f"  Reading Files:    {stats.source_read_seconds:.2f} seconds "
+                f"(read ahead in parallel)"
+            )
         print()
 
+        # Conversion cache
+        if stats.cache_hits or stats.cache_misses:
+            print("Conversion Cache:")
+            print("-" * 80)
+            print(f"  Hits:            {stats.cache_hits}")
+            print(f"  Misses:          {stats.cache_misses}")
+            print(f"  Hit Rate:        {stats.cache_hit_rate:.1f}%")
+            print()
+
+        # OCR page cache
+        if stats.ocr_cache_hits or stats.ocr_cache_misses:
+            print("OCR Page Cache:")
+            print("-" * 80)
+            print(f"  Hits:            {stats.ocr_cache_hits}")
+            print(f"  Misses:          {stats.ocr_cache_misses}")
+            print(f"  Hit Rate:        {stats.ocr_cache_hit_rate:.1f}%")
+            print(f"  OCR Time:        {stats.ocr_seconds:.2f} seconds")
+            print(f"  OCR Time Saved:  {stats.ocr_seconds_saved:.2f} seconds")
+            print()
+
         # Failed files (if any)
         failed_results = batch_result.get_failed_results()
         if failed_results and len(failed_results) <= 20:
@@ -0,0 +1,41 @@
+"""Compact rendering of Docling markdown for the extraction hot path."""
+
+import re
+
+# Pipes that delimit table cells (Docling escapes pipes inside cell text)
+_CELL_DELIMITER = re.compile(r"(?<!\\)\|")
+_SEPARATOR_CELL = re.compile(r"^:?-+:?$")
+
+
+def _compact_row(line: str) -> str:
+    """Render one table row with single-space cell padding."""
+    cells = [cell.strip() for cell in _CELL_DELIMITER.split(line)[1:-1]]
+    if cells and all(_SEPARATOR_CELL.match(cell) for cell in cells):
+        return "|" + "|".join("---" for _ in cells) + "|"
+    return "| " + " | ".join(cells) + " |"
+
+
+def compact_markdown(markdown: str) -> str:
+    """
+    Strip alignment padding from Docling markdown.
+
+    Docling pads every table cell to its column's width, so wide tables turn
+    into long runs of spaces. This keeps the structure extractors rely on
+    (one row per line, every cell between pipes including empty ones, and a
+    "---" separator row under each header) and the text itself, trimming
+    only the padding around cells and at the end of lines.
+
+    Args:
+        markdown: Markdown from DoclingDocument.export_to_markdown()
+
+    Returns:
+        Equivalent markdown without alignment padding
+    """
+    lines = []
+    for line in markdown.split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("|") and stripped.endswith("|") and len(stripped) > 1:
+            lines.append(_compact_row(stripped))
+        else:
+            lines.append(line.rstrip())
+    return "\n".join(lines)
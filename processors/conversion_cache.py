@@ -0,0 +1,323 @@
+"""Persistent, content-addressed cache of converted Docling documents."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tarfile
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+from importlib import metadata
+from io import BytesIO
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Cache keys are "<SHA-256 of the PDF>-<pipeline fingerprint>"
+CACHE_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}-[0-9a-f]{16}$")
+BUNDLE_MANIFEST = "manifest.json"
+
+
+def hash_file(file_path: str | Path) -> str:
+    """
+    Compute the SHA-256 content hash of a file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def docling_version() -> str:
+    """Installed Docling version ("unknown" if Docling is not installed)."""
+    try:
+        return metadata.version("docling")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def pipeline_fingerprint(pipeline_options) -> str:
+    """
+    Fingerprint a pipeline configuration together with the Docling version.
+
+    Two conversions share a fingerprint only if they would produce the same
+    document, so a change to the options or a Docling upgrade invalidates
+    previously cached entries.
+
+    Args:
+        pipeline_options: Pydantic pipeline options (e.g. PdfPipelineOptions)
+
+    Returns:
+        Short hex fingerprint
+    """
+    # Neither the model location, the thread count nor the timeout changes a
+    # completed conversion (timed-out conversions are never cached). Nested
+    # options are serialized by their concrete class so e.g. OCR engines are
+    # told apart.
+    options_json = pipeline_options.model_dump_json(
+        exclude={
+            "artifacts_path": True,
+            "document_timeout": True,
+            "ocr_options": True,
+            "accelerator_options": {"num_threads"},
+        },
+        serialize_as_any=True,
+    )
+
+    # The OCR page cache returns what its wrapped engine would, so fingerprint
+    # the wrapped engine; cached and uncached conversions then share entries
+    ocr_options = getattr(pipeline_options, "ocr_options", None)
+    ocr_options = getattr(ocr_options, "inner", ocr_options)
+    ocr_json = (
+        f"{ocr_options.kind}:{ocr_options.model_dump_json(serialize_as_any=True)}"
+        if ocr_options is not None
+        else ""
+    )
+
+    payload = f"{docling_version()}\n{options_json}\n{ocr_json}".encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def partial_fingerprint(fingerprint: str, page_count: int) -> str:
+    """
+    Fingerprint a conversion of only the first pages of a document.
+
+    Args:
+        fingerprint: Fingerprint of the pipeline from pipeline_fingerprint()
+        page_count: Number of leading pages converted
+
+    Returns:
+        Short hex fingerprint, distinct from the whole-document one
+    """
+    payload = f"{fingerprint}\npages 1-{page_count}".encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def match_fingerprints(
+    fingerprints: dict[str, str], max_pages: int
+) -> dict[str, list[str]]:
+    """
+    Map cache key fingerprints back to the pipelines that produce them.
+
+    A partial_fingerprint() can't be reversed, so one is derived for every
+    leading-page count up to max_pages.
+
+    Args:
+        fingerprints: Pipeline keys mapped to their fingerprints
+        max_pages: Largest leading-page count to derive fingerprints for
+
+    Returns:
+        Dict mapping fingerprints to pipeline keys (with " (leading pages)"
+        appended for conversions of only the first pages)
+    """
+    pipelines: dict[str, list[str]] = {}
+    for pipeline, fingerprint in fingerprints.items():
+        pipelines.setdefault(fingerprint, []).append(pipeline)
+        for page_count in range(1, max_pages + 1):
+            pipelines.setdefault(
+                partial_fingerprint(fingerprint, page_count), []
+            ).append(f"{pipeline} (leading pages)")
+    return pipelines
+
+
+class ConversionCache:
+    """On-disk cache of converted documents keyed by content hash and fingerprint."""
+
+    def __init__(self, cache_dir: str | Path):
+        """
+        Initialize the conversion cache.
+
+        Args:
+            cache_dir: Directory where cached conversions are stored
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def make_key(self, content_hash: str, fingerprint: str) -> str:
+        """Build a cache key from a content hash and pipeline fingerprint."""
+        return f"{content_hash}-{fingerprint}"
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the on-disk path for a cache key (sharded by hash prefix)."""
+        return self.cache_dir / key[:2] / f"{key}.json.gz"
+
+    def get(self, key: str) -> dict | None:
+        """
+        Load a cached conversion.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Serialized document dict, or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with gzip.open(entry_path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self._record(hit=False)
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            self._record(hit=False)
+            return None
+
+        self._record(hit=True)
+        return data
+
+    def put(self, key: str, data: dict) -> None:
+        """
+        Store a conversion in the cache.
+
+        The entry is written to a temporary file and renamed into place so
+        concurrent readers never see a partially written entry.
+
+        Args:
+            key: Cache key from make_key()
+            data: Serialized document dict
+        """
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_path.with_name(
+            f"{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, entry_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry {entry_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def keys_for(self, content_hash: str) -> list[str]:
+        """
+        Find the cached conversions of a file under any pipeline.
+
+        Args:
+            content_hash: SHA-256 of the PDF
+
+        Returns:
+            Cache keys, one per pipeline fingerprint the file was converted with
+        """
+        return sorted(
+            path.name.removesuffix(".json.gz")
+            for path in (self.cache_dir / content_hash[:2]).glob(
+                f"{content_hash}-*.json.gz"
+            )
+        )
+
+    def export_bundle(
+        self, bundle_path: str | Path, content_hashes: Iterable[str]
+    ) -> int:
+        """
+        Write the cached conversions of a set of files to a single bundle.
+
+        The bundle is a tar of the (already gzipped) entries plus a manifest,
+        keyed by content hash and fingerprint, so it can be imported on any
+        machine regardless of where the PDFs live there.
+
+        Args:
+            bundle_path: Bundle file to write
+            content_hashes: SHA-256 hashes of the PDFs to export
+
+        Returns:
+            Number of entries exported
+        """
+        keys = sorted({key for h in content_hashes for key in self.keys_for(h)})
+        manifest = json.dumps(
+            {
+                "docling_version": docling_version(),
+                "created_at": datetime.now().isoformat(),
+                "keys": keys,
+            },
+            indent=2,
+        ).encode("utf-8")
+
+        bundle_path = Path(bundle_path)
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        with tarfile.open(bundle_path, "w") as bundle:
+            info = tarfile.TarInfo(BUNDLE_MANIFEST)
+            info.size = len(manifest)
+            bundle.addfile(info, BytesIO(manifest))
+            for key in keys:
+                bundle.add(self._entry_path(key), arcname=f"{key}.json.gz")
+
+        logger.info(f"Exported {len(keys)} cached conversions to {bundle_path}")
+        return len(keys)
+
+    def import_bundle(self, bundle_path: str | Path) -> tuple[int, dict]:
+        """
+        Add the conversions in a bundle to this cache.
+
+        Entries already present are kept, and members that are not cache
+        entries are ignored.
+
+        Args:
+            bundle_path: Bundle written by export_bundle()
+
+        Returns:
+            Tuple of (number of entries added, bundle manifest)
+        """
+        added = 0
+        manifest = {}
+        with tarfile.open(bundle_path, "r") as bundle:
+            for member in bundle:
+                if not member.isfile():
+                    continue
+                if member.name == BUNDLE_MANIFEST:
+                    manifest = json.load(bundle.extractfile(member))
+                    continue
+
+                key = member.name.removesuffix(".json.gz")
+                if not CACHE_KEY_PATTERN.match(key):
+                    logger.warning(f"Ignoring unexpected bundle member {member.name}")
+                    continue
+
+                entry_path = self._entry_path(key)
+                if entry_path.exists():
+                    continue
+
+                entry_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(bundle.extractfile(member).read())
+                os.replace(tmp_path, entry_path)
+                added += 1
+
+        if manifest.get("docling_version", docling_version()) != docling_version():
+            logger.warning(
+                f"Bundle was created with Docling {manifest['docling_version']} "
+                f"but {docling_version()} is installed; its entries will not match"
+            )
+        logger.info(f"Imported {added} cached conversions from {bundle_path}")
+        return added, manifest
+
+    def _record(self, hit: bool) -> None:
+        """Update hit/miss counters."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Get hit/miss counts since this cache was created."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
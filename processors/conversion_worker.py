@@ -0,0 +1,75 @@
+"""Process-pool worker entry points for document conversion."""
+
+import logging
+import time
+
+from config import Config
+from processors.document_payload import DocumentPayload
+from processors.document_processor import DocumentProcessor
+from processors.ingest import SourceFile
+from utils.resource_budget import apply_thread_limits
+
+logger = logging.getLogger(__name__)
+
+_worker_processor: DocumentProcessor | None = None
+
+
+def init_worker(settings: dict) -> None:
+    """
+    Initialize a worker process.
+
+    Builds the worker's DocumentProcessor once, so Docling models are loaded
+    once per worker (up front with Config.WARMUP_MODELS) and stay warm for
+    every document it converts.
+
+    Args:
+        settings: Config snapshot from Config.export_settings() in the parent,
+            so workers see the loaded environment even under "spawn"
+    """
+    global _worker_processor
+
+    Config.apply_settings(settings)
+    if Config.MODEL_THREADS:
+        apply_thread_limits(Config.MODEL_THREADS)
+    _worker_processor = DocumentProcessor()
+    if Config.WARMUP_MODELS:
+        _worker_processor.warmup()
+    logger.debug("Conversion worker initialized")
+
+
+def convert_to_payload(
+    pdf_path: str, source: SourceFile | None = None
+) -> DocumentPayload:
+    """
+    Convert a PDF in a worker process and return its compact payload.
+
+    Args:
+        pdf_path: Path to the PDF file
+        source: The file already read by the parent process (read here if None)
+
+    Returns:
+        DocumentPayload with markdown and table grids
+    """
+    if _worker_processor is None:
+        raise RuntimeError("Conversion worker not initialized")
+    if source is not None:
+        _worker_processor.add_source(source)
+
+    cache = _worker_processor.conversion_cache
+    hits_before = cache.get_stats()["hits"] if cache else 0
+    ocr_stats_before = _worker_processor.get_ocr_cache_stats()
+
+    start_time = time.time()
+    doc_key = _worker_processor.convert_document(pdf_path)
+    payload = _worker_processor.get_payload(doc_key)
+    payload.conversion_seconds = time.time() - start_time
+    payload.cache_hit = bool(cache) and cache.get_stats()["hits"] > hits_before
+    payload.ocr_cache_stats = {
+        key: value - ocr_stats_before[key]
+        for key, value in _worker_processor.get_ocr_cache_stats().items()
+    }
+
+    # The parent keeps the payload; the worker has no further use for it
+    _worker_processor.document_cache.discard(doc_key)
+
+    return payload
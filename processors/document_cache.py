@@ -0,0 +1,132 @@
+"""Memory-bounded LRU cache for converted documents."""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentCache:
+    """
+    Least-recently-used cache keyed by doc_key with a byte budget.
+
+    Entry sizes are supplied by the caller, so the budget is only as accurate
+    as the size estimate. The most recently inserted entry is always kept,
+    even if it alone exceeds the budget.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Approximate memory budget for all cached entries
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get an entry and mark it as most recently used.
+
+        Args:
+            key: Document key
+
+        Returns:
+            Cached value, or None if not present
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any, size_bytes: int) -> None:
+        """
+        Insert or replace an entry, evicting least-recently-used entries as needed.
+
+        Args:
+            key: Document key
+            value: Value to cache
+            size_bytes: Estimated memory footprint of the value
+        """
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+
+            self._entries[key] = (value, size_bytes)
+            self.size_bytes += size_bytes
+            self._evict_over_budget()
+
+    def _evict_over_budget(self) -> None:
+        """Evict least-recently-used entries until within budget (lock held)."""
+        while self.size_bytes > self.max_bytes and len(self._entries) > 1:
+            evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted_size
+            self.evictions += 1
+            logger.debug(f"Evicted {evicted_key} from document cache")
+
+    def update_size(self, key: str, size_bytes: int) -> None:
+        """
+        Update the size of an existing entry (e.g. after memoizing derived data).
+
+        Args:
+            key: Document key
+            size_bytes: New estimated memory footprint of the entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+
+            self._entries[key] = (entry[0], size_bytes)
+            self._entries.move_to_end(key)
+            self.size_bytes += size_bytes - entry[1]
+            self._evict_over_budget()
+
+    def discard(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries (counters are preserved)."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        """Check membership without affecting recency or counters."""
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get size and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,104 @@
+"""Compact, picklable representation of a converted document."""
+
+from pydantic import BaseModel, Field
+
+from models.table_grid import TableGrid
+
+
+class DocumentPayload(BaseModel):
+    """
+    The subset of a converted document that extractors need.
+
+    Used to ship conversion results between processes without pickling the
+    full DoclingDocument object graph, and to keep converted documents in
+    memory as compact records. Text items keep their provenance in flat
+    parallel arrays (one entry per text, four bbox values per text) rather
+    than one object per item.
+    """
+
+    doc_key: str
+    markdown: str
+    tables: list[TableGrid] = Field(default_factory=list)
+    page_count: int = 0
+    conversion_seconds: float = 0.0
+    cache_hit: bool = False
+    # OCR page cache counters accumulated while converting this document
+    ocr_cache_stats: dict[str, float] = Field(default_factory=dict)
+
+    # Text items in reading order, with their label, page (0 if unknown) and
+    # bounding box (l, t, r, b flattened; zeros if unknown)
+    texts: list[str] = Field(default_factory=list)
+    text_labels: list[str] = Field(default_factory=list)
+    text_pages: list[int] = Field(default_factory=list)
+    text_bboxes: list[float] = Field(default_factory=list)
+
+    @classmethod
+    def from_document(
+        cls,
+        doc_key: str,
+        document,
+        markdown: str,
+        tables: list[TableGrid] | None = None,
+    ) -> "DocumentPayload":
+        """
+        Build a payload from a DoclingDocument.
+
+        Args:
+            doc_key: Document key (file path) from conversion
+            document: Converted DoclingDocument
+            markdown: Full markdown export of the document
+            tables: Table grids already built for the document (built from
+                document.tables if None)
+
+        Returns:
+            DocumentPayload with markdown, table grids and text provenance
+        """
+        if tables is None:
+            tables = [
+                TableGrid.from_table_item(table, i)
+                for i, table in enumerate(document.tables)
+            ]
+
+        texts, labels, pages, bboxes = [], [], [], []
+        for item in document.texts:
+            texts.append(item.text)
+            labels.append(str(item.label.value))
+            if item.prov:
+                prov = item.prov[0]
+                pages.append(prov.page_no)
+                bboxes.extend((prov.bbox.l, prov.bbox.t, prov.bbox.r, prov.bbox.b))
+            else:
+                pages.append(0)
+                bboxes.extend((0.0, 0.0, 0.0, 0.0))
+
+        return cls(
+            doc_key=doc_key,
+            markdown=markdown,
+            tables=tables,
+            page_count=len(document.pages),
+            texts=texts,
+            text_labels=labels,
+            text_pages=pages,
+            text_bboxes=bboxes,
+        )
+
+    def text_bbox(self, index: int) -> tuple[float, float, float, float]:
+        """Bounding box (l, t, r, b) of the text item at index."""
+        start = index * 4
+        return tuple(self.text_bboxes[start : start + 4])
+
+    def texts_on_page(self, page_no: int) -> list[str]:
+        """Texts of the items on a page, in reading order."""
+        return [
+            text for text, page in zip(self.texts, self.text_pages) if page == page_no
+        ]
+
+    def estimate_size(self) -> int:
+        """Estimate the memory footprint of the payload in bytes."""
+        return (
+            len(self.markdown)
+            + sum(table.estimate_size() for table in self.tables)
+            + sum(len(text) for text in self.texts)
+            + 16 * len(self.texts)
+            + 8 * len(self.text_bboxes)
+        )
@@ -1,45 +1,586 @@
 """Document processing and vendor detection using Docling."""
 
 import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling_core.types.doc import DoclingDocument
+from pydantic import ValidationError
 
+from config import Config
+from models.table_grid import TableGrid
 from models.vendor import VENDOR_PATTERNS, VendorType
+from processors.compact_markdown import compact_markdown
+from processors.conversion_cache import (
+    ConversionCache,
+    partial_fingerprint,
+    pipeline_fingerprint,
+)
+from processors.document_cache import DocumentCache
+from processors.document_payload import DocumentPayload
+from processors.ingest import SourceFile, read_source
+from processors.metadata_index import MetadataIndex
+from processors.ocr_engines import available_ocr_engines
+from processors.ocr_recovery import (
+    OcrFailedError,
+    contiguous_runs,
+    find_empty_pages,
+    replace_pages,
+)
+from processors.page_classifier import content_page_count
+from processors.page_split import merge_page_ranges, split_page_ranges
+from processors.quarantine import ConversionLimitExceeded
+from processors.text_layer import (
+    PDF_READ_ERRORS,
+    PdfTextLayer,
+    count_pages,
+    extract_first_page_text,
+    extract_page_texts,
+    probe_text_layer,
+)
+
+if TYPE_CHECKING:
+    # Docling (and the torch models behind it) is imported on first
+    # conversion, so scripts that never convert a PDF don't pay for it
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import DocumentConverter
 
 logger = logging.getLogger(__name__)
 
+# OCR conversion cache entries store their near-empty pages under this key,
+# next to the document dict, so a cache hit doesn't recount every page's text
+OCR_CHECK_KEY = "ocr_check"
+
+# Text of the synthetic one-page invoice converted by warmup()
+WARMUP_TEXT = [
+    "INVOICE 1001",
+    "Date: 01/01/2025",
+    "Qty  Description  Amount",
+    "1  Warm-up item  10.00",
+    "Total  10.00",
+]
+
+
+def _make_warmup_pdf(lines: list[str]) -> bytes:
+    """Build a minimal one-page PDF with a text line per entry in lines."""
+    text = "\n".join(
+        f"1 0 0 1 72 {720 - 24 * i} Tm ({line}) Tj" for i, line in enumerate(lines)
+    )
+    content = f"BT /F1 14 Tf {text} ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>"
+        ),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+    return pdf
+
+
+class _CachedDocument:
+    """A cached document plus views derived from it, evicted together."""
+
+    __slots__ = (
+        "document",
+        "lines",
+        "lowered_lines",
+        "markdown",
+        "size_bytes",
+        "tables",
+    )
+
+    def __init__(self, document, size_bytes: int, markdown: str | None = None):
+        self.document = document
+        self.size_bytes = size_bytes
+        self.markdown = markdown
+        self.lines: list[str] | None = None
+        self.lowered_lines: list[str] | None = None
+        self.tables: list[TableGrid] | None = None
+
 
 class DocumentProcessor:
     """Handles document conversion and vendor detection using Docling."""
 
-    def __init__(self):
-        """Initialize the document processor."""
-        self.document_cache = {}
+    def __init__(
+        self,
+        use_conversion_cache: bool | None = None,
+        cache_max_mb: int | None = None,
+        compact_documents: bool | None = None,
+    ):
+        """
+        Initialize the document processor.
 
-        # Configure pipeline with OCR enabled for scanned images
-        # Force full page OCR to handle image-only PDFs like ABox invoices
-        from docling.datamodel.pipeline_options import OcrAutoOptions
+        Args:
+            use_conversion_cache: Persist conversions under Config.CACHE_DIR
+                (defaults to Config.USE_CONVERSION_CACHE)
+            cache_max_mb: Memory budget for converted documents kept in
+                memory (defaults to Config.DOCUMENT_CACHE_MAX_MB)
+            compact_documents: Keep converted documents as compact records
+                instead of full DoclingDocuments (defaults to
+                Config.COMPACT_DOCUMENTS)
+        """
+        if cache_max_mb is None:
+            cache_max_mb = Config.DOCUMENT_CACHE_MAX_MB
+        self.document_cache = DocumentCache(max_bytes=cache_max_mb * 1024 * 1024)
+
+        if compact_documents is None:
+            compact_documents = Config.COMPACT_DOCUMENTS
+        self.compact_documents = compact_documents
+
+        if use_conversion_cache is None:
+            use_conversion_cache = Config.USE_CONVERSION_CACHE
+        self.conversion_cache: ConversionCache | None = (
+            ConversionCache(Config.CACHE_DIR / "conversions")
+            if use_conversion_cache
+            else None
+        )
+
+        # PDFs read ahead of conversion (and hashed for duplicate detection),
+        # held until their conversion takes them so each file is read from
+        # the source mount only once. Callers bound how far ahead they read.
+        self._read_ahead: dict[str, SourceFile] = {}
+        self._read_ahead_lock = threading.Lock()
+        self._source_read_seconds = 0.0  # reads in conversion (not read ahead)
+        self._source_read_lock = threading.Lock()
+
+        # Pre-scanned page counts and text-layer presence, used to pick OCR
+        # variants without probing and to estimate conversion cost
+        self.metadata_index: MetadataIndex | None = (
+            MetadataIndex(Config.CACHE_DIR / "metadata_index.json")
+            if Config.USE_METADATA_INDEX
+            else None
+        )
+
+        # One converter per pipeline profile (and per OCR variant for
+        # profiles that choose OCR from a text-layer probe), the first-page
+        # probe converter and OCR retry converters (keyed by
+        # profile and attempt). All are built on first use, and Docling loads
+        # each pipeline's models on its first conversion (or in warmup()),
+        # after which they stay warm. Fingerprints only need the options, so
+        # disk cache hits never build a converter.
+        self._converters: dict[str, DocumentConverter] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._probe_converter: DocumentConverter | None = None
+        self._retry_converters: dict[tuple[str, int], DocumentConverter] = {}
+        self._lazy_converter_lock = threading.Lock()
+
+    @staticmethod
+    def _ocr_mode(settings: dict) -> str:
+        """Effective OCR mode for a profile ("auto", "always" or "never")."""
+        if Config.OCR_MODE in ("always", "never"):
+            return Config.OCR_MODE
+        return settings.get("ocr", "auto")
+
+    def _profile_variants(self, settings: dict) -> list[str]:
+        """OCR variants ("ocr" and/or "text") a profile needs converters for."""
+        ocr_mode = self._ocr_mode(settings)
+        if ocr_mode == "always":
+            return ["ocr"]
+        if ocr_mode == "never":
+            return ["text"]
+        return ["ocr", "text"]
+
+    def _pipeline_settings(self, pipeline: str) -> tuple[dict, bool]:
+        """
+        Resolve a pipeline key to its profile settings and OCR flag.
+
+        Raises:
+            ValueError: If the profile or variant is not configured
+        """
+        profile, _, variant = pipeline.partition("/")
+        if profile not in Config.PIPELINE_PROFILES:
+            raise ValueError(f"Unknown pipeline profile: {profile}")
+
+        settings = Config.PIPELINE_PROFILES[profile]
+        if variant not in self._profile_variants(settings):
+            raise ValueError(f"Unknown pipeline: {pipeline}")
+        return settings, variant == "ocr"
+
+    def _get_fingerprint(self, pipeline: str) -> str:
+        """Get the conversion cache fingerprint of a pipeline."""
+        fingerprint = self._fingerprints.get(pipeline)
+        if fingerprint is None:
+            settings, do_ocr = self._pipeline_settings(pipeline)
+            fingerprint = pipeline_fingerprint(
+                self._build_pipeline_options(settings, do_ocr=do_ocr)
+            )
+            self._fingerprints[pipeline] = fingerprint
+        return fingerprint
+
+    def get_pipeline_fingerprints(self) -> dict[str, str]:
+        """Conversion cache fingerprints of every configured pipeline, by key."""
+        return {
+            f"{profile}/{variant}": self._get_fingerprint(f"{profile}/{variant}")
+            for profile, settings in Config.PIPELINE_PROFILES.items()
+            for variant in self._profile_variants(settings)
+        }
+
+    def _get_converter(self, pipeline: str) -> "DocumentConverter":
+        """Get (building on first use) the converter for a pipeline."""
+        with self._lazy_converter_lock:
+            converter = self._converters.get(pipeline)
+            if converter is None:
+                settings, do_ocr = self._pipeline_settings(pipeline)
+                converter = self._make_converter(
+                    self._build_pipeline_options(settings, do_ocr=do_ocr)
+                )
+                self._converters[pipeline] = converter
+            return converter
+
+    @staticmethod
+    def _make_converter(pipeline_options: "PdfPipelineOptions") -> "DocumentConverter":
+        """Build a PDF DocumentConverter (models load on first conversion)."""
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+
+        return DocumentConverter(
+            format_options={"pdf": PdfFormatOption(pipeline_options=pipeline_options)}
+        )
+
+    @staticmethod
+    def _build_pipeline_options(
+        settings: dict, do_ocr: bool, ocr_cache: bool = True
+    ) -> "PdfPipelineOptions":
+        """
+        Build Docling pipeline options for a profile.
+
+        Args:
+            settings: Profile settings from Config.PIPELINE_PROFILES
+            do_ocr: Whether this variant runs (forced full-page) OCR
+            ocr_cache: Go through the OCR page cache (if Config.USE_OCR_CACHE)
+
+        Returns:
+            Configured PdfPipelineOptions
+        """
+        from docling.datamodel.pipeline_options import (
+            LayoutOptions,
+            PdfPipelineOptions,
+            TableFormerMode,
+            TableStructureOptions,
+        )
 
         pipeline_options = PdfPipelineOptions()
-        pipeline_options.do_ocr = True
-        pipeline_options.ocr_options = OcrAutoOptions(
-            lang=["en"], force_full_page_ocr=True
+
+        # OCR variant forces full page OCR (unless the profile turns it off)
+        # to handle image-only PDFs like ABox invoices; the text variant
+        # relies on the embedded text layer
+        pipeline_options.do_ocr = do_ocr
+        if do_ocr:
+            pipeline_options.ocr_options = DocumentProcessor._build_ocr_options(
+                settings.get("ocr_engine", Config.OCR_ENGINE),
+                force_full_page=settings.get("force_full_page_ocr", True),
+                ocr_cache=ocr_cache,
+            )
+
+        pipeline_options.do_table_structure = settings.get("do_table_structure", True)
+        pipeline_options.table_structure_options = TableStructureOptions(
+            mode=TableFormerMode.FAST
+            if settings.get("table_mode") == "fast"
+            else TableFormerMode.ACCURATE
         )
 
-        self.converter = DocumentConverter(
-            format_options={
-                "pdf": PdfFormatOption(pipeline_options=pipeline_options)
-            }
+        pipeline_options.images_scale = settings.get("images_scale", 1.0)
+
+        # Per-worker share of the CPU budget (utils.resource_budget)
+        if Config.MODEL_THREADS:
+            from docling.datamodel.accelerator_options import AcceleratorOptions
+
+            pipeline_options.accelerator_options = AcceleratorOptions(
+                num_threads=Config.MODEL_THREADS
+            )
+
+        # Docling stops between page batches once the timeout is exceeded
+        pipeline_options.document_timeout = Config.MAX_CONVERSION_SECONDS
+
+        layout_model = settings.get("layout_model")
+        if layout_model:
+            from docling.datamodel import layout_model_specs
+
+            pipeline_options.layout_options = LayoutOptions(
+                model_spec=getattr(layout_model_specs, layout_model)
+            )
+
+        return pipeline_options
+
+    @staticmethod
+    def _build_ocr_options(
+        engine: str, force_full_page: bool = True, ocr_cache: bool = True
+    ):
+        """
+        Build OCR options for a Docling OCR engine.
+
+        An engine that is not installed on this machine falls back to
+        "auto". With Config.USE_OCR_CACHE the engine is wrapped by the OCR
+        page cache, which only runs it on pages not seen before.
+
+        Args:
+            engine: Docling OCR kind ("auto", "easyocr", "tesseract",
+                "tesserocr", "rapidocr" or "ocrmac")
+            force_full_page: OCR whole pages rather than only bitmap regions
+            ocr_cache: Wrap the engine in the OCR page cache (if
+                Config.USE_OCR_CACHE); False always runs the engine
+
+        Returns:
+            OcrOptions subclass instance for the engine (or CachedOcrOptions
+            wrapping it)
+        """
+        from docling.datamodel.pipeline_options import (
+            EasyOcrOptions,
+            OcrAutoOptions,
+            OcrMacOptions,
+            RapidOcrOptions,
+            TesseractCliOcrOptions,
+            TesseractOcrOptions,
+        )
+
+        from processors.ocr_cache import CachedOcrOptions
+
+        # Each engine names English differently; RapidOCR's default covers it
+        engines = {
+            "auto": (OcrAutoOptions, ["en"]),
+            "easyocr": (EasyOcrOptions, ["en"]),
+            "tesseract": (TesseractCliOcrOptions, ["eng"]),
+            "tesserocr": (TesseractOcrOptions, ["eng"]),
+            "rapidocr": (RapidOcrOptions, None),
+            "ocrmac": (OcrMacOptions, ["en-US"]),
+        }
+        if engine not in engines:
+            raise ValueError(f"Unknown OCR engine: {engine}")
+        if engine != "auto" and engine not in available_ocr_engines():
+            logger.warning(f"OCR engine {engine} is not installed, using auto")
+            engine = "auto"
+
+        options_class, lang = engines[engine]
+        if lang is None:
+            options = options_class(force_full_page_ocr=force_full_page)
+        else:
+            options = options_class(lang=lang, force_full_page_ocr=force_full_page)
+
+        if ocr_cache and Config.USE_OCR_CACHE:
+            return CachedOcrOptions.wrap(options, Config.CACHE_DIR / "ocr")
+        return options
+
+    def _select_pipeline(
+        self, source: SourceFile, profile: str, pdf: PdfTextLayer | None = None
+    ) -> str:
+        """
+        Choose the converter for a document within a pipeline profile.
+
+        Args:
+            source: PDF read into memory
+            profile: Pipeline profile name
+            pdf: The PDF already opened for this document's checks, if any
+
+        Returns:
+            Pipeline key ("<profile>/ocr" or "<profile>/text")
+        """
+        if profile not in Config.PIPELINE_PROFILES:
+            raise ValueError(f"Unknown pipeline profile: {profile}")
+
+        variants = self._profile_variants(Config.PIPELINE_PROFILES[profile])
+        if len(variants) == 1:
+            return f"{profile}/{variants[0]}"
+
+        if self.metadata_index is not None:
+            metadata = self.metadata_index.get(
+                source.path, size=source.size, mtime=source.mtime
+            )
+            if metadata is not None:
+                has_text = metadata.has_text_layer(Config.TEXT_LAYER_MIN_CHARS)
+                return f"{profile}/{'text' if has_text else 'ocr'}"
+
+        try:
+            if pdf is not None:
+                probe = pdf.probe(Config.TEXT_LAYER_MIN_CHARS)
+            else:
+                probe = probe_text_layer(
+                    source.data, min_chars_per_page=Config.TEXT_LAYER_MIN_CHARS
+                )
+        except PDF_READ_ERRORS as e:
+            logger.warning(f"Text-layer probe failed for {source.path}, using OCR: {e}")
+            return f"{profile}/ocr"
+
+        variant = "text" if probe.has_text_layer else "ocr"
+        logger.debug(
+            f"Text layer on {probe.pages_with_text}/{probe.page_count} pages, "
+            f"using {profile}/{variant} pipeline: {source.path}"
         )
+        return f"{profile}/{variant}"
+
+    def get_pipeline_profile(self, pdf_path: str | Path) -> str:
+        """
+        Get the pipeline profile for a PDF based on its vendor directory.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Pipeline profile name from Config.PIPELINE_PROFILES
+        """
+        from models.vendor import detect_vendor_from_path
+
+        return Config.get_pipeline_profile(detect_vendor_from_path(str(pdf_path)))
+
+    def estimate_seconds(self, pdf_path: str | Path) -> float | None:
+        """
+        Estimate how long converting a PDF will take, without reading it.
+
+        Based on the page count and text-layer presence recorded in the
+        metadata index and the pipeline the file's profile would pick.
 
-    def convert_document(self, pdf_path: str | Path) -> str:
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Estimated seconds (Config.ESTIMATED_SECONDS_PER_PAGE per page), or
+            None if the file is not in the index
+        """
+        if self.metadata_index is None:
+            return None
+        metadata = self.metadata_index.get(pdf_path)
+        if metadata is None:
+            return None
+
+        variants = self._profile_variants(
+            Config.PIPELINE_PROFILES[self.get_pipeline_profile(pdf_path)]
+        )
+        if len(variants) == 1:
+            variant = variants[0]
+        else:
+            has_text = metadata.has_text_layer(Config.TEXT_LAYER_MIN_CHARS)
+            variant = "text" if has_text else "ocr"
+        return metadata.page_count * Config.ESTIMATED_SECONDS_PER_PAGE[variant]
+
+    def probe_first_page(self, pdf_path: str | Path) -> str:
+        """
+        Get first-page markdown for vendor identification.
+
+        Much cheaper than convert_document: born-digital PDFs are read straight
+        from the embedded text layer without running Docling, and scanned PDFs
+        are converted on the first page only, with table structure disabled.
+        That conversion still runs the layout model and full-resolution OCR on
+        the page. The result is not cached and does not produce a doc_key.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Markdown (or plain text) of the first page
+        """
+        source = read_source(pdf_path)
+
+        try:
+            text = extract_first_page_text(source.data)
+            if len("".join(text.split())) >= Config.TEXT_LAYER_MIN_CHARS:
+                logger.debug(f"Probed first page from text layer: {source.path}")
+                return text
+        except PDF_READ_ERRORS as e:
+            logger.debug(f"Text-layer read failed for {source.path}: {e}")
+
+        logger.debug(f"Probing first page with OCR: {source.path}")
+        result = self._get_probe_converter().convert(
+            source.to_stream(), page_range=(1, 1)
+        )
+        return self._export_markdown(result.document)
+
+    def _get_probe_converter(self) -> "DocumentConverter":
+        """Get (building on first use) the first-page OCR probe converter."""
+        with self._lazy_converter_lock:
+            if self._probe_converter is None:
+                self._probe_converter = self._make_converter(
+                    self._build_pipeline_options(
+                        {"do_table_structure": False}, do_ocr=True
+                    )
+                )
+            return self._probe_converter
+
+    def warmup(
+        self, profiles: Iterable[str] | None = None, convert_sample: bool = True
+    ) -> dict[str, float]:
+        """
+        Load Docling models ahead of the first real conversion.
+
+        Builds each pipeline's converter, loads its models and (optionally)
+        converts a synthetic one-page invoice so lazily initialized model
+        state is also set up. The sample bypasses every cache, including the
+        OCR page cache, so OCR engines run on it every time.
+
+        Args:
+            profiles: Pipeline profiles to warm up (defaults to all of
+                Config.PIPELINE_PROFILES)
+            convert_sample: Also convert the synthetic page
+
+        Returns:
+            Dict mapping pipeline keys to warm-up seconds
+        """
+        from docling.datamodel.base_models import DocumentStream, InputFormat
+
+        from processors.ocr_cache import UNCACHED_DOCUMENT_NAME
+
+        if profiles is None:
+            profiles = Config.PIPELINE_PROFILES
+        sample = _make_warmup_pdf(WARMUP_TEXT)
+
+        timings = {}
+        for profile in profiles:
+            if profile not in Config.PIPELINE_PROFILES:
+                raise ValueError(f"Unknown pipeline profile: {profile}")
+            for variant in self._profile_variants(Config.PIPELINE_PROFILES[profile]):
+                pipeline = f"{profile}/{variant}"
+                start_time = time.time()
+                converter = self._get_converter(pipeline)
+                converter.initialize_pipeline(InputFormat.PDF)
+                if convert_sample:
+                    converter.convert(
+                        DocumentStream(
+                            name=UNCACHED_DOCUMENT_NAME, stream=BytesIO(sample)
+                        )
+                    )
+                timings[pipeline] = time.time() - start_time
+                logger.info(
+                    f"Warmed up {pipeline} pipeline in {timings[pipeline]:.1f}s"
+                )
+
+        return timings
+
+    def convert_document(
+        self,
+        pdf_path: str | Path,
+        profile: str | None = None,
+        compact: bool | None = None,
+    ) -> str:
         """
         Convert a PDF document using Docling.
 
         Args:
             pdf_path: Path to the PDF file
+            profile: Pipeline profile name (defaults to the vendor's profile,
+                detected from the Bills/<Vendor>/ directory)
+            compact: Reduce the document to a compact record (markdown, table
+                grids, page count and flat text provenance) and drop the
+                DoclingDocument (defaults to self.compact_documents)
 
         Returns:
             Document key (file path) for accessing the converted document
@@ -51,20 +592,894 @@ class DocumentProcessor:
             logger.debug(f"Using cached document for {pdf_path_str}")
             return pdf_path_str
 
-        # Convert document using Docling
-        logger.info(f"Converting document: {pdf_path_str}")
-        try:
-            result = self.converter.convert(pdf_path_str)
+        self._convert(pdf_path_str, profile, compact)
+        return pdf_path_str
+
+    def _convert(
+        self,
+        pdf_path_str: str,
+        profile: str | None = None,
+        compact: bool | None = None,
+    ) -> _CachedDocument:
+        """
+        Convert a document (or load it from the conversion cache) and cache it.
 
-            # Store the converted document in cache
-            self.document_cache[pdf_path_str] = result.document
+        Args:
+            pdf_path_str: Resolved path to the PDF file
+            profile: Pipeline profile name (defaults to the vendor's profile)
+            compact: Keep a compact record instead of the DoclingDocument
+                (defaults to self.compact_documents)
+
+        Returns:
+            The cache entry for the converted document
+        """
+        source = self._read_source(pdf_path_str)
+        pipeline, last_page, cache_key, entry = self._load_cached(
+            source, profile, compact
+        )
+        if entry is not None:
+            return entry
+
+        # Convert document using Docling (from memory, not the source mount)
+        logger.info(f"Converting document ({pipeline} pipeline): {pdf_path_str}")
+        try:
+            document = self._convert_source(source, pipeline, last_page)
+            entry = self._store_converted(
+                source, pipeline, document, cache_key, compact
+            )
             logger.debug(f"Document converted successfully: {pdf_path_str}")
-            return pdf_path_str
+            return entry
 
+        except (ConversionLimitExceeded, OcrFailedError):
+            raise
         except Exception as e:
             logger.error(f"Failed to convert document {pdf_path_str}: {e}")
             raise
 
+    def _convert_source(
+        self, source: SourceFile, pipeline: str, last_page: int | None = None
+    ) -> DoclingDocument:
+        """
+        Run a pipeline on a PDF, splitting long documents into page ranges.
+
+        Ranges are converted in parallel on Config.PAGE_SPLIT_WORKERS threads
+        and merged back into one document numbered like a whole-file
+        conversion, so one long statement doesn't keep a single worker busy
+        long after the rest of a batch is done. All ranges share one
+        Config.MAX_CONVERSION_SECONDS deadline: ranges not started by then are
+        skipped, and a document that finishes past it still fails.
+
+        Args:
+            source: PDF read into memory
+            pipeline: Pipeline key
+            last_page: Convert only pages 1..last_page (None for all pages)
+
+        Returns:
+            Converted document
+
+        Raises:
+            ConversionLimitExceeded: If any conversion hit the document timeout
+        """
+        converter = self._get_converter(pipeline)
+        page_ranges = self._page_ranges(source, last_page)
+        deadline = None
+        if Config.MAX_CONVERSION_SECONDS is not None:
+            deadline = time.monotonic() + Config.MAX_CONVERSION_SECONDS
+
+        def check_deadline() -> None:
+            if deadline is not None and time.monotonic() > deadline:
+                raise ConversionLimitExceeded(
+                    "wall_time",
+                    f"Conversion exceeded limit of {Config.MAX_CONVERSION_SECONDS}s "
+                    f"(across {len(page_ranges)} page ranges)",
+                )
+
+        def convert_range(page_range: tuple[int, int] | None) -> DoclingDocument:
+            if page_range is None:
+                result = converter.convert(source.to_stream())
+            else:
+                check_deadline()
+                result = converter.convert(source.to_stream(), page_range=page_range)
+            self._check_timed_out(source.path, result)
+            return result.document
+
+        if len(page_ranges) == 1:
+            return convert_range(page_ranges[0])
+
+        logger.info(
+            f"Converting {len(page_ranges)} page ranges in parallel: {source.path}"
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=min(Config.PAGE_SPLIT_WORKERS, len(page_ranges))
+        )
+        try:
+            documents = list(executor.map(convert_range, page_ranges))
+        finally:
+            # A failed range fails the document; don't start the rest
+            executor.shutdown(cancel_futures=True)
+        check_deadline()
+        return merge_page_ranges(documents)
+
+    @staticmethod
+    def _page_ranges(
+        source: SourceFile, last_page: int | None = None
+    ) -> list[tuple[int, int] | None]:
+        """
+        Page ranges to convert a PDF in ([None] for a whole-file conversion).
+
+        Args:
+            source: PDF read into memory
+            last_page: Convert only pages 1..last_page (None for all pages)
+
+        Returns:
+            Inclusive (first page, last page) ranges, or [None]
+        """
+        whole = [None] if last_page is None else [(1, last_page)]
+        if Config.PAGE_SPLIT_MIN_PAGES is None or Config.PAGE_SPLIT_WORKERS <= 1:
+            return whole
+
+        page_count = last_page if last_page is not None else source.page_count
+        if page_count is None:
+            try:
+                page_count = count_pages(source.data)
+            except PDF_READ_ERRORS as e:
+                logger.debug(f"Page count failed for {source.path}: {e}")
+                return whole
+
+        if page_count < max(Config.PAGE_SPLIT_MIN_PAGES, 2):
+            return whole
+        return split_page_ranges(page_count, Config.PAGE_SPLIT_CHUNK_PAGES)
+
+    @staticmethod
+    def _select_pages(
+        source: SourceFile, pdf: PdfTextLayer | None = None
+    ) -> int | None:
+        """
+        Find the trailing boilerplate pages of a PDF from its text layer.
+
+        Args:
+            source: PDF read into memory
+            pdf: The PDF already opened for this document's checks, if any
+
+        Returns:
+            Last page to convert, or None to convert the whole document
+        """
+        from models.vendor import detect_vendor_from_path
+
+        patterns = Config.get_boilerplate_patterns(detect_vendor_from_path(source.path))
+        if not patterns:
+            return None
+
+        try:
+            if pdf is not None:
+                page_texts = pdf.page_texts()
+            else:
+                page_texts = extract_page_texts(source.data)
+        except PDF_READ_ERRORS as e:
+            logger.debug(f"Page classification failed for {source.path}: {e}")
+            return None
+
+        last_page = content_page_count(
+            page_texts,
+            patterns,
+            Config.INVOICE_DATA_PATTERNS,
+            min_chars=Config.TEXT_LAYER_MIN_CHARS,
+        )
+        if last_page == len(page_texts):
+            return None
+
+        logger.info(
+            f"Skipping boilerplate pages {last_page + 1}-{len(page_texts)}: "
+            f"{source.path}"
+        )
+        return last_page
+
+    def load_source(self, pdf_path: str | Path) -> SourceFile:
+        """
+        Read a PDF into memory (once) ahead of its conversion.
+
+        The bytes are held until the document's conversion takes them (or
+        take_source() / release_sources() drops them), so hashing for
+        duplicate detection and conversion share a single read. Nothing is
+        evicted: callers bound how many files they read ahead. New or
+        changed files are added to the metadata index from the same bytes.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            SourceFile with the file's bytes and SHA-256
+
+        Raises:
+            ConversionLimitExceeded: If the file exceeds Config.MAX_FILE_SIZE_MB
+            OSError: If the file cannot be read
+        """
+        pdf_path_str = str(Path(pdf_path).resolve())
+        with self._read_ahead_lock:
+            source = self._read_ahead.get(pdf_path_str)
+        if source is None:
+            source = read_source(pdf_path_str, max_size_mb=Config.MAX_FILE_SIZE_MB)
+            self.add_source(source)
+            # Index new files from these bytes rather than a second read
+            if self.metadata_index is not None:
+                self.metadata_index.record(source)
+        return source
+
+    def add_source(self, source: SourceFile) -> None:
+        """Keep a PDF read elsewhere (e.g. by the parent process) for conversion."""
+        with self._read_ahead_lock:
+            self._read_ahead[source.path] = source
+
+    def take_source(self, pdf_path: str | Path) -> SourceFile | None:
+        """Remove and return a PDF read ahead by load_source(), if held."""
+        pdf_path_str = str(Path(pdf_path).resolve())
+        with self._read_ahead_lock:
+            return self._read_ahead.pop(pdf_path_str, None)
+
+    def release_sources(self) -> None:
+        """Drop every PDF read ahead but not converted (e.g. after a batch)."""
+        with self._read_ahead_lock:
+            self._read_ahead.clear()
+
+    def _read_source(self, pdf_path_str: str) -> SourceFile:
+        """Take a read-ahead PDF, or read it now (conversion consumes it)."""
+        source = self.take_source(pdf_path_str)
+        if source is None:
+            start_time = time.time()
+            try:
+                source = read_source(pdf_path_str, max_size_mb=Config.MAX_FILE_SIZE_MB)
+            finally:
+                with self._source_read_lock:
+                    self._source_read_seconds += time.time() - start_time
+        return source
+
+    def get_source_read_seconds(self) -> float:
+        """Seconds conversions spent reading PDFs that were not read ahead."""
+        with self._source_read_lock:
+            return self._source_read_seconds
+
+    @staticmethod
+    def check_limits(source: SourceFile, pdf: PdfTextLayer | None = None) -> None:
+        """
+        Check a PDF against the configured file size and page count limits.
+
+        Both checks run on the in-memory bytes before any Docling work.
+
+        Args:
+            source: PDF read into memory
+            pdf: The PDF already opened for this document's checks, if any
+
+        Raises:
+            ConversionLimitExceeded: If the file exceeds Config.MAX_FILE_SIZE_MB
+                or Config.MAX_PAGES
+        """
+        if Config.MAX_FILE_SIZE_MB is not None:
+            size_mb = source.size / (1024 * 1024)
+            if size_mb > Config.MAX_FILE_SIZE_MB:
+                raise ConversionLimitExceeded(
+                    "file_size",
+                    f"File size {size_mb:.1f} MB exceeds limit of "
+                    f"{Config.MAX_FILE_SIZE_MB} MB",
+                )
+
+        if Config.MAX_PAGES is not None:
+            if source.page_count is not None:
+                page_count = source.page_count
+            elif pdf is not None:
+                page_count = pdf.page_count
+            else:
+                page_count = count_pages(source.data)
+            if page_count > Config.MAX_PAGES:
+                raise ConversionLimitExceeded(
+                    "page_count",
+                    f"Page count {page_count} exceeds limit of {Config.MAX_PAGES}",
+                )
+
+    @staticmethod
+    def _check_timed_out(pdf_path_str: str, result) -> None:
+        """
+        Raise if Docling stopped a conversion at the document timeout.
+
+        Docling reports a timeout as PARTIAL_SUCCESS without errors (pages
+        that fail to parse add an error), and keeps only the pages it got to.
+
+        Args:
+            pdf_path_str: Resolved path to the PDF file
+            result: Docling ConversionResult
+
+        Raises:
+            ConversionLimitExceeded: If the conversion timed out
+        """
+        from docling.datamodel.base_models import ConversionStatus
+
+        if (
+            Config.MAX_CONVERSION_SECONDS is not None
+            and result.status == ConversionStatus.PARTIAL_SUCCESS
+            and not result.errors
+        ):
+            raise ConversionLimitExceeded(
+                "wall_time",
+                f"Conversion exceeded limit of {Config.MAX_CONVERSION_SECONDS}s "
+                f"(stopped after {len(result.pages)} pages)",
+            )
+
+    def _load_cached(
+        self,
+        source: SourceFile,
+        profile: str | None = None,
+        compact: bool | None = None,
+    ) -> tuple[str, int | None, str | None, _CachedDocument | None]:
+        """
+        Select a pipeline and pages for a document and try the persistent cache.
+
+        Args:
+            source: PDF read into memory
+            profile: Pipeline profile name (defaults to the vendor's profile)
+            compact: Keep a compact record instead of the DoclingDocument
+                (defaults to self.compact_documents)
+
+        Returns:
+            Tuple of (pipeline key, last page to convert or None for all
+            pages, conversion cache key or None, cache entry if the document
+            was loaded from the conversion cache)
+
+        Raises:
+            ConversionLimitExceeded: If the file exceeds a size or page limit
+            OcrFailedError: If the cached conversion is known to be empty
+        """
+        pdf_path_str = source.path
+        # One parse of the PDF serves every check; it is only opened if one
+        # of them needs it
+        with PdfTextLayer(source.data) as pdf:
+            self.check_limits(source, pdf)
+
+            if profile is None:
+                profile = self.get_pipeline_profile(pdf_path_str)
+            pipeline = self._select_pipeline(source, profile, pdf)
+            last_page = self._select_pages(source, pdf)
+            if pdf.is_open:
+                source.page_count = pdf.page_count
+
+        # Check the persistent cache before running the Docling pipeline
+        cache_key = None
+        if self.conversion_cache is not None:
+            fingerprint = self._get_fingerprint(pipeline)
+            if last_page is not None:
+                fingerprint = partial_fingerprint(fingerprint, last_page)
+            cache_key = self.conversion_cache.make_key(source.sha256, fingerprint)
+            cached = self.conversion_cache.get(cache_key)
+            document = None
+            ocr_check = {}
+            if cached is not None:
+                ocr_check = cached.pop(OCR_CHECK_KEY, {})
+                try:
+                    document = DoclingDocument.model_validate(cached)
+                except ValidationError as e:
+                    logger.warning(
+                        f"Ignoring incompatible cache entry for {pdf_path_str}: {e}"
+                    )
+
+            if document is not None:
+                # Cached OCR output already went through page retries, and
+                # its empty pages were stored with it (older entries, or ones
+                # checked at another threshold, are recounted)
+                if self._is_ocr_pipeline(pipeline):
+                    if ocr_check.get("min_chars") == Config.OCR_EMPTY_PAGE_MIN_CHARS:
+                        empty_pages = ocr_check["empty_pages"]
+                    else:
+                        empty_pages = find_empty_pages(
+                            document, Config.OCR_EMPTY_PAGE_MIN_CHARS
+                        )
+                    self._check_ocr_output(pdf_path_str, document, empty_pages)
+                entry = self._cache_document(pdf_path_str, document, compact)
+                logger.debug(f"Loaded conversion from disk cache: {pdf_path_str}")
+                return pipeline, last_page, cache_key, entry
+
+        return pipeline, last_page, cache_key, None
+
+    def _store_converted(
+        self,
+        source: SourceFile,
+        pipeline: str,
+        document: DoclingDocument,
+        cache_key: str | None,
+        compact: bool | None = None,
+    ) -> _CachedDocument:
+        """
+        Store a freshly converted document in the memory and disk caches.
+
+        OCR output is checked first: near-empty pages are re-OCR'd, and a
+        document with no readable page is cached on disk (so later runs fail
+        fast) but not in memory.
+
+        Raises:
+            OcrFailedError: If OCR produced no usable text on any page
+        """
+        empty_pages: list[int] = []
+        if self._is_ocr_pipeline(pipeline):
+            document, empty_pages = self._recover_empty_pages(
+                source, pipeline, document
+            )
+
+        if cache_key is not None:
+            data = document.export_to_dict()
+            if self._is_ocr_pipeline(pipeline):
+                data[OCR_CHECK_KEY] = {
+                    "min_chars": Config.OCR_EMPTY_PAGE_MIN_CHARS,
+                    "empty_pages": empty_pages,
+                }
+            self.conversion_cache.put(cache_key, data)
+
+        self._check_ocr_output(source.path, document, empty_pages)
+        return self._cache_document(source.path, document, compact)
+
+    @staticmethod
+    def _is_ocr_pipeline(pipeline: str) -> bool:
+        """Check whether a pipeline key refers to an OCR variant."""
+        return pipeline.endswith("/ocr")
+
+    @staticmethod
+    def _check_ocr_output(
+        pdf_path_str: str, document: DoclingDocument, empty_pages: list[int]
+    ) -> None:
+        """
+        Raise if OCR left every page of a document near-empty.
+
+        Args:
+            pdf_path_str: Resolved path to the PDF file
+            document: Converted document
+            empty_pages: Pages still below Config.OCR_EMPTY_PAGE_MIN_CHARS
+
+        Raises:
+            OcrFailedError: If no page has usable text
+        """
+        if empty_pages and len(empty_pages) >= len(document.pages):
+            raise OcrFailedError(
+                f"OCR produced no usable text on any of {len(document.pages)} "
+                f"pages: {pdf_path_str}"
+            )
+        if empty_pages:
+            logger.warning(
+                f"OCR produced no usable text on pages {empty_pages}: {pdf_path_str}"
+            )
+
+    def _recover_empty_pages(
+        self, source: SourceFile, pipeline: str, document: DoclingDocument
+    ) -> tuple[DoclingDocument, list[int]]:
+        """
+        Re-OCR only the pages that came back near-empty.
+
+        Runs of empty pages are re-converted with each usable attempt of
+        Config.OCR_RETRY_ATTEMPTS in turn (other OCR engines; see
+        _retry_attempts) until they read or Config.OCR_RETRY_BUDGET_SECONDS
+        is spent. Retries bypass the OCR page cache, which would replay the
+        empty result. Recovered pages are spliced into the original document.
+
+        Args:
+            source: PDF read into memory
+            pipeline: Pipeline key the document was converted with
+            document: Original conversion
+
+        Returns:
+            Tuple of (document with recovered pages, pages still empty)
+        """
+        pdf_path_str = source.path
+        min_chars = Config.OCR_EMPTY_PAGE_MIN_CHARS
+        empty_pages = find_empty_pages(document, min_chars)
+        profile = pipeline.split("/")[0]
+        attempts = self._retry_attempts(profile)
+        if not empty_pages or not attempts:
+            return document, empty_pages
+
+        logger.info(
+            f"OCR returned near-empty text on pages {empty_pages}, "
+            f"retrying: {pdf_path_str}"
+        )
+        deadline = time.monotonic() + Config.OCR_RETRY_BUDGET_SECONDS
+        replacements: dict[int, DoclingDocument] = {}
+
+        for attempt_index, attempt in attempts:
+            converter = self._get_retry_converter(profile, attempt_index)
+            for start, end in contiguous_runs(empty_pages):
+                if time.monotonic() >= deadline:
+                    break
+                try:
+                    result = converter.convert(
+                        source.to_stream(), page_range=(start, end)
+                    )
+                # Any engine failure moves on to the next attempt
+                except Exception as e:  # noqa: BLE001
+                    logger.warning(
+                        f"OCR retry {attempt} failed on pages {start}-{end} "
+                        f"of {pdf_path_str}: {e}"
+                    )
+                    continue
+
+                still_empty = set(find_empty_pages(result.document, min_chars))
+                for page_no in result.document.pages:
+                    if page_no not in still_empty:
+                        replacements[page_no] = result.document
+
+            empty_pages = [p for p in empty_pages if p not in replacements]
+            if not empty_pages:
+                break
+            if time.monotonic() >= deadline:
+                logger.warning(f"OCR retry budget exhausted: {pdf_path_str}")
+                break
+
+        if replacements:
+            logger.info(
+                f"Recovered {len(replacements)} pages with OCR retries: {pdf_path_str}"
+            )
+            document = replace_pages(document, replacements)
+
+        return document, empty_pages
+
+    @staticmethod
+    def _retry_attempts(profile: str) -> list[tuple[int, dict]]:
+        """
+        OCR retry attempts that can read differently than the first pass.
+
+        OCR engines render pages at their own fixed resolution, so only a
+        different engine changes what a retry sees. Attempts that would run
+        the profile's own engine again, or an engine that is not installed,
+        are skipped.
+
+        Args:
+            profile: Pipeline profile name
+
+        Returns:
+            List of (index into Config.OCR_RETRY_ATTEMPTS, attempt overrides)
+        """
+        engine = Config.PIPELINE_PROFILES[profile].get("ocr_engine", Config.OCR_ENGINE)
+        attempts = []
+        for attempt_index, attempt in enumerate(Config.OCR_RETRY_ATTEMPTS):
+            retry_engine = attempt.get("ocr_engine", engine)
+            if retry_engine == engine:
+                logger.debug(f"Skipping OCR retry {attempt}: same engine")
+            elif retry_engine != "auto" and retry_engine not in available_ocr_engines():
+                logger.debug(f"Skipping OCR retry {attempt}: engine not installed")
+            else:
+                attempts.append((attempt_index, attempt))
+        return attempts
+
+    def _get_retry_converter(
+        self, profile: str, attempt_index: int
+    ) -> "DocumentConverter":
+        """Get (building on first use) the converter for an OCR retry attempt."""
+        key = (profile, attempt_index)
+        with self._lazy_converter_lock:
+            converter = self._retry_converters.get(key)
+            if converter is None:
+                settings = {
+                    **Config.PIPELINE_PROFILES[profile],
+                    **Config.OCR_RETRY_ATTEMPTS[attempt_index],
+                }
+                pipeline_options = self._build_pipeline_options(
+                    settings, do_ocr=True, ocr_cache=False
+                )
+                pipeline_options.document_timeout = Config.OCR_RETRY_BUDGET_SECONDS
+                converter = self._make_converter(pipeline_options)
+                self._retry_converters[key] = converter
+            return converter
+
+    def convert_documents(
+        self,
+        pdf_paths: Iterable[str | Path],
+        doc_batch_size: int | None = None,
+        page_batch_size: int | None = None,
+    ) -> Iterator[tuple[Path, str | None, Exception | None]]:
+        """
+        Convert a stream of PDFs with Docling's multi-document API.
+
+        Paths are consumed in chunks; within a chunk, documents already in the
+        memory or disk cache are yielded immediately and the rest are grouped
+        by pipeline and handed to convert_all(), so Docling can batch pages
+        across documents. Results are yielded as each document finishes.
+        Each file is read once and handed to Docling as an in-memory stream.
+
+        Args:
+            pdf_paths: Iterable of PDF paths (may be a lazy generator)
+            doc_batch_size: Documents Docling processes together
+                (defaults to Config.DOC_BATCH_SIZE)
+            page_batch_size: Pages Docling runs through each model together
+                (defaults to Config.PAGE_BATCH_SIZE)
+
+        Yields:
+            Tuples of (pdf_path, doc_key or None, exception or None); the
+            exception is a ConversionLimitExceeded if the file hit a limit
+            and an OcrFailedError if OCR found no text
+        """
+        from docling.datamodel.settings import settings
+
+        # Docling's batch sizes are process-wide; they're restored once the
+        # stream is exhausted or closed
+        perf = settings.perf
+        saved_batch_sizes = (perf.doc_batch_size, perf.page_batch_size)
+        perf.doc_batch_size = doc_batch_size or Config.DOC_BATCH_SIZE
+        perf.page_batch_size = page_batch_size or Config.PAGE_BATCH_SIZE
+        try:
+            yield from self._convert_chunks(
+                pdf_paths, perf.doc_batch_size * Config.STREAM_CHUNK_BATCHES
+            )
+        finally:
+            perf.doc_batch_size, perf.page_batch_size = saved_batch_sizes
+
+    def _convert_chunks(
+        self, pdf_paths: Iterable[str | Path], chunk_size: int
+    ) -> Iterator[tuple[Path, str | None, Exception | None]]:
+        """
+        Convert a stream of PDFs chunk by chunk (see convert_documents).
+
+        Args:
+            pdf_paths: Iterable of PDF paths (may be a lazy generator)
+            chunk_size: Paths read from the stream per chunk
+
+        Yields:
+            Tuples of (pdf_path, doc_key or None, exception or None)
+        """
+        from docling.datamodel.base_models import ConversionStatus
+
+        pdf_paths = iter(pdf_paths)
+        while chunk := list(islice(pdf_paths, chunk_size)):
+            # Group uncached documents by pipeline (one converter per call)
+            pending: dict[str, list[tuple[Path, SourceFile, str | None]]] = {}
+            for pdf_path in chunk:
+                pdf_path = Path(pdf_path)
+                pdf_path_str = str(pdf_path.resolve())
+                if pdf_path_str in self.document_cache:
+                    yield pdf_path, pdf_path_str, None
+                    continue
+
+                try:
+                    source = self._read_source(pdf_path_str)
+                    pipeline, last_page, cache_key, entry = self._load_cached(source)
+                except (ConversionLimitExceeded, OcrFailedError) as e:
+                    yield pdf_path, None, e
+                    continue
+                # A file that can't be read fails alone; the stream goes on
+                except Exception as e:  # noqa: BLE001
+                    logger.error(f"Failed to prepare {pdf_path_str}: {e}")
+                    error = RuntimeError(f"Failed to convert document: {e}")
+                    yield pdf_path, None, error
+                    continue
+
+                if entry is not None:
+                    yield pdf_path, pdf_path_str, None
+                elif self._page_ranges(source, last_page) != [None]:
+                    # Long documents are converted in parallel page ranges,
+                    # and documents with boilerplate pages in a shorter one
+                    try:
+                        document = self._convert_source(source, pipeline, last_page)
+                        self._store_converted(source, pipeline, document, cache_key)
+                    except (ConversionLimitExceeded, OcrFailedError) as e:
+                        yield pdf_path, None, e
+                        continue
+                    except Exception as e:  # noqa: BLE001
+                        logger.error(f"Failed to convert {pdf_path_str}: {e}")
+                        error = RuntimeError(f"Failed to convert document: {e}")
+                        yield pdf_path, None, error
+                        continue
+                    yield pdf_path, pdf_path_str, None
+                else:
+                    pending.setdefault(pipeline, []).append(
+                        (pdf_path, source, cache_key)
+                    )
+
+            for pipeline, documents in pending.items():
+                logger.info(
+                    f"Bulk converting {len(documents)} documents ({pipeline} pipeline)"
+                )
+                results = self._get_converter(pipeline).convert_all(
+                    [source.to_stream() for _, source, _ in documents],
+                    raises_on_error=False,
+                )
+                # Docling yields results in input order (streams carry only
+                # a file name, which may repeat across directories)
+                for (pdf_path, source, cache_key), result in zip(documents, results):
+                    pdf_path_str = source.path
+
+                    if result.status not in (
+                        ConversionStatus.SUCCESS,
+                        ConversionStatus.PARTIAL_SUCCESS,
+                    ):
+                        errors = "; ".join(err.error_message for err in result.errors)
+                        message = (
+                            f"Failed to convert document ({result.status.value}): "
+                            f"{errors}"
+                        )
+                        logger.error(f"{message} [{pdf_path_str}]")
+                        yield pdf_path, None, RuntimeError(message)
+                        continue
+
+                    try:
+                        self._check_timed_out(pdf_path_str, result)
+                        self._store_converted(
+                            source, pipeline, result.document, cache_key
+                        )
+                    except (ConversionLimitExceeded, OcrFailedError) as e:
+                        yield pdf_path, None, e
+                        continue
+
+                    yield pdf_path, pdf_path_str, None
+
+    def _cache_document(
+        self, doc_key: str, document: DoclingDocument, compact: bool | None = None
+    ) -> _CachedDocument:
+        """
+        Add a converted document to the in-memory LRU cache.
+
+        A compact document is reduced to a DocumentPayload right away, so the
+        DoclingDocument object graph can be garbage-collected.
+
+        Args:
+            doc_key: Document key (file path) from conversion
+            document: Converted document
+            compact: Cache a compact record (defaults to self.compact_documents)
+
+        Returns:
+            The cache entry for the document
+        """
+        if compact is None:
+            compact = self.compact_documents
+        if compact:
+            payload = DocumentPayload.from_document(
+                doc_key, document, self._export_markdown(document)
+            )
+            entry = _CachedDocument(
+                payload, payload.estimate_size(), markdown=payload.markdown
+            )
+            entry.tables = payload.tables
+        else:
+            entry = _CachedDocument(document, self._estimate_size(document))
+        self.document_cache.put(doc_key, entry, entry.size_bytes)
+        return entry
+
+    @staticmethod
+    def _estimate_size(document: DoclingDocument) -> int:
+        """
+        Estimate the memory footprint of a document.
+
+        Uses the serialized JSON length as a proxy; the in-memory object graph
+        is larger, so Config.DOCUMENT_CACHE_MAX_MB should be set accordingly.
+        """
+        return len(document.model_dump_json())
+
+    def _get_entry(self, doc_key: str) -> _CachedDocument:
+        """
+        Get a cache entry, re-materializing the document if it was evicted.
+
+        Args:
+            doc_key: Document key (file path) from conversion
+
+        Returns:
+            The cache entry for the document
+
+        Raises:
+            ValueError: If the document was never converted and cannot be found
+        """
+        entry = self.document_cache.get(doc_key)
+        if entry is not None:
+            return entry
+
+        if not Path(doc_key).exists():
+            raise ValueError(f"Document {doc_key} not found in cache")
+
+        logger.debug(f"Re-materializing evicted document: {doc_key}")
+        return self._convert(doc_key)
+
+    def _get_document(self, doc_key: str) -> DoclingDocument | DocumentPayload:
+        """
+        Get a converted document, re-materializing it if it was evicted.
+
+        Args:
+            doc_key: Document key (file path) from conversion
+
+        Returns:
+            The converted document, or its payload if it was converted in a
+            worker process
+        """
+        return self._get_entry(doc_key).document
+
+    @staticmethod
+    def _export_markdown(document: DoclingDocument) -> str:
+        """Export a document to markdown (compacted if Config.COMPACT_MARKDOWN)."""
+        markdown = document.export_to_markdown()
+        if Config.COMPACT_MARKDOWN:
+            markdown = compact_markdown(markdown)
+        return markdown
+
+    def _get_markdown(self, doc_key: str) -> tuple[_CachedDocument, str]:
+        """
+        Get a document's full markdown, exporting it at most once per cache entry.
+
+        Args:
+            doc_key: Document key (file path) from conversion
+
+        Returns:
+            Tuple of (cache entry, full markdown)
+        """
+        entry = self._get_entry(doc_key)
+        if entry.markdown is None:
+            entry.markdown = self._export_markdown(entry.document)
+            entry.size_bytes += len(entry.markdown)
+            self.document_cache.update_size(doc_key, entry.size_bytes)
+        return entry, entry.markdown
+
+    def get_payload(self, doc_key: str) -> DocumentPayload:
+        """
+        Get the compact payload (markdown and table grids) for a document.
+
+        Args:
+            doc_key: Document key (file path) from conversion
+
+        Returns:
+            DocumentPayload for the document
+        """
+        entry, markdown = self._get_markdown(doc_key)
+        if isinstance(entry.document, DocumentPayload):
+            return entry.document
+
+        return DocumentPayload.from_document(
+            doc_key, entry.document, markdown, tables=self.get_tables(doc_key)
+        )
+
+    def get_tables(self, doc_key: str) -> list[TableGrid]:
+        """
+        Get every table in a document as a row/column grid.
+
+        Grids are built from Docling's structured table cells (not the
+        markdown rendering) once per cached document.
+
+        Args:
+            doc_key: Document key (file path) from conversion
+
+        Returns:
+            TableGrid per table, in document order
+        """
+        entry = self._get_entry(doc_key)
+        if entry.tables is None:
+            if isinstance(entry.document, DocumentPayload):
+                entry.tables = entry.document.tables
+            else:
+                entry.tables = [
+                    TableGrid.from_table_item(table, i)
+                    for i, table in enumerate(entry.document.tables)
+                ]
+                entry.size_bytes += sum(table.estimate_size() for table in entry.tables)
+                self.document_cache.update_size(doc_key, entry.size_bytes)
+        return entry.tables
+
+    def add_payload(self, payload: DocumentPayload) -> str:
+        """
+        Register a payload converted elsewhere (e.g. in a worker process).
+
+        Args:
+            payload: DocumentPayload returned by a conversion worker
+
+        Returns:
+            Document key for accessing the document
+        """
+        entry = _CachedDocument(
+            payload, payload.estimate_size(), markdown=payload.markdown
+        )
+        self.document_cache.put(payload.doc_key, entry, entry.size_bytes)
+        return payload.doc_key
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get in-memory document cache size and hit/miss/eviction counters."""
+        return self.document_cache.get_stats()
+
+    @staticmethod
+    def get_ocr_cache_stats() -> dict[str, float]:
+        """Get OCR page cache hits, misses, OCR seconds spent and saved."""
+        if not Config.USE_OCR_CACHE:
+            return {"hits": 0, "misses": 0, "ocr_seconds": 0.0, "saved_seconds": 0.0}
+
+        from processors.ocr_cache import get_ocr_page_cache
+
+        return get_ocr_page_cache(Config.CACHE_DIR / "ocr").get_stats()
+
     def get_document_markdown(self, doc_key: str, max_size: int = 3000) -> str:
         """
         Export document to markdown format for analysis.
@@ -77,11 +1492,7 @@ class DocumentProcessor:
             Markdown representation of document
         """
         try:
-            if doc_key not in self.document_cache:
-                raise ValueError(f"Document {doc_key} not found in cache")
-
-            document = self.document_cache[doc_key]
-            markdown = document.export_to_markdown()
+            _, markdown = self._get_markdown(doc_key)
 
             # Optionally truncate if max_size is specified
             if max_size and len(markdown) > max_size:
@@ -194,10 +1605,17 @@ class DocumentProcessor:
             Text representation of document structure
         """
         try:
-            if doc_key not in self.document_cache:
-                raise ValueError(f"Document {doc_key} not found in cache")
+            document = self._get_document(doc_key)
+            if isinstance(document, DocumentPayload):
+                return "\n".join(
+                    [
+                        f"Document: {doc_key}",
+                        f"Page count: {document.page_count}",
+                        f"Text elements: {len(document.texts)}",
+                        f"Tables: {len(document.tables)}",
+                    ]
+                )
 
-            document = self.document_cache[doc_key]
             # Return basic structure info
             structure_parts = []
             structure_parts.append(f"Document: {doc_key}")
@@ -225,19 +1643,48 @@ class DocumentProcessor:
         Returns:
             Search results
         """
-        try:
-            if doc_key not in self.document_cache:
-                raise ValueError(f"Document {doc_key} not found in cache")
+        return self.search_texts(doc_key, [search_term])[search_term]
+
+    def search_texts(self, doc_key: str, search_terms: list[str]) -> dict[str, str]:
+        """
+        Search for several terms within a document in a single pass.
+
+        The markdown export and its lower-cased line index are built once per
+        cached document, so repeated label lookups don't re-serialize it.
+
+        Args:
+            doc_key: Document key (file path) from conversion
+            search_terms: Texts to search for
 
-            # Export to markdown and search within it
-            markdown = self.get_document_markdown(doc_key, max_size=None)
-            results = []
+        Returns:
+            Dict mapping each search term to its search results
+        """
+        try:
+            entry = self._get_line_index(doc_key)
+            lowered_terms = [(term, term.lower()) for term in search_terms]
+            matches: dict[str, list[str]] = {term: [] for term in search_terms}
 
-            for i, line in enumerate(markdown.split("\n"), 1):
-                if search_term.lower() in line.lower():
-                    results.append(f"Line {i}: {line.strip()}")
+            for i, lowered_line in enumerate(entry.lowered_lines, 1):
+                for term, lowered_term in lowered_terms:
+                    if lowered_term in lowered_line:
+                        matches[term].append(f"Line {i}: {entry.lines[i - 1].strip()}")
 
-            return "\n".join(results) if results else f"No results found for '{search_term}'"
+            return {
+                term: "\n".join(results)
+                if results
+                else f"No results found for '{term}'"
+                for term, results in matches.items()
+            }
         except Exception as e:
-            logger.error(f"Failed to search for text '{search_term}': {e}")
+            logger.error(f"Failed to search for text {search_terms}: {e}")
             raise
+
+    def _get_line_index(self, doc_key: str) -> _CachedDocument:
+        """Get a cache entry with its markdown line index built."""
+        entry, markdown = self._get_markdown(doc_key)
+        if entry.lowered_lines is None:
+            entry.lines = markdown.split("\n")
+            entry.lowered_lines = [line.lower() for line in entry.lines]
+            entry.size_bytes += len(markdown)
+            self.document_cache.update_size(doc_key, entry.size_bytes)
+        return entry
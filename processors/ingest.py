@@ -0,0 +1,98 @@
+"""Single-read PDF ingestion: each file is read once and hashed on the same pass."""
+
+import hashlib
+import logging
+import os
+from io import BytesIO
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from processors.conversion_cache import HASH_CHUNK_SIZE
+from processors.quarantine import ConversionLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+
+class SourceFile(BaseModel):
+    """
+    A PDF held in memory with its content hash.
+
+    Everything downstream (limit checks, the text-layer probe, cache keys and
+    Docling itself) works from these bytes, so a slow or flaky source mount
+    is only touched by the initial read.
+    """
+
+    path: str  # resolved path, used as the document key
+    data: bytes = Field(repr=False)
+    sha256: str
+    mtime: float
+    # Set once the PDF has been parsed, so later steps don't count pages again
+    page_count: int | None = None
+
+    @property
+    def name(self) -> str:
+        """File name (Docling names the converted document after it)."""
+        return Path(self.path).name
+
+    @property
+    def size(self) -> int:
+        """File size in bytes."""
+        return len(self.data)
+
+    def to_stream(self):
+        """
+        Wrap the bytes in a fresh Docling DocumentStream.
+
+        Docling consumes the stream, so each conversion needs its own.
+
+        Returns:
+            DocumentStream named after the file
+        """
+        from docling.datamodel.base_models import DocumentStream
+
+        return DocumentStream(name=self.name, stream=BytesIO(self.data))
+
+
+def read_source(pdf_path: str | Path, max_size_mb: float | None = None) -> SourceFile:
+    """
+    Read a PDF into memory with one buffered pass, hashing as it is read.
+
+    Size and modification time come from the open file handle, so the file
+    is opened exactly once.
+
+    Args:
+        pdf_path: Path to the PDF file
+        max_size_mb: Reject the file before reading it if it is larger
+
+    Returns:
+        SourceFile with the file's bytes and SHA-256
+
+    Raises:
+        ConversionLimitExceeded: If the file is larger than max_size_mb
+        OSError: If the file cannot be read
+    """
+    path_str = str(Path(pdf_path).resolve())
+    digest = hashlib.sha256()
+    chunks = []
+
+    with open(path_str, "rb") as f:
+        stat = os.fstat(f.fileno())
+        if max_size_mb is not None and stat.st_size > max_size_mb * 1024 * 1024:
+            raise ConversionLimitExceeded(
+                "file_size",
+                f"File size {stat.st_size / (1024 * 1024):.1f} MB exceeds limit of "
+                f"{max_size_mb} MB",
+            )
+
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            chunks.append(chunk)
+
+    logger.debug(f"Read {stat.st_size} bytes: {path_str}")
+    return SourceFile(
+        path=path_str,
+        data=b"".join(chunks),
+        sha256=digest.hexdigest(),
+        mtime=stat.st_mtime,
+    )
@@ -0,0 +1,307 @@
+"""Incremental index of cheap PDF metadata, used to plan conversions."""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from processors.ingest import SourceFile
+from processors.text_layer import PDF_READ_ERRORS
+
+logger = logging.getLogger(__name__)
+
+
+class PdfMetadata(BaseModel):
+    """What a PDF looks like before conversion, read without Docling."""
+
+    size: int
+    mtime: float
+    page_count: int = 0
+    # Fewest non-whitespace text-layer characters on any page (the scan stops
+    # at the first page without text, so this is 0 for any image-only page)
+    min_page_chars: int = 0
+    producer: str = ""
+    error: str | None = None  # set if pypdfium2 could not read the file
+
+    def has_text_layer(self, min_chars_per_page: int) -> bool:
+        """True if every page carries a usable embedded text layer."""
+        return self.page_count > 0 and self.min_page_chars >= min_chars_per_page
+
+
+def read_pdf_metadata(pdf_path: str | Path) -> PdfMetadata:
+    """
+    Read page count, producer and text-layer presence of a PDF.
+
+    Uses pypdfium2, which parses the text layer without rendering pages, so
+    this costs milliseconds per file.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        PdfMetadata for the file (with error set if it could not be parsed)
+
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    stat = os.stat(pdf_path)
+    metadata = PdfMetadata(size=stat.st_size, mtime=stat.st_mtime)
+    return _parse_pdf(str(pdf_path), metadata)
+
+
+def source_metadata(source: SourceFile) -> PdfMetadata:
+    """
+    Read page count, producer and text-layer presence of a PDF in memory.
+
+    Args:
+        source: PDF already read (e.g. ahead of its conversion)
+
+    Returns:
+        PdfMetadata for the file (with error set if it could not be parsed)
+    """
+    metadata = PdfMetadata(size=source.size, mtime=source.mtime)
+    return _parse_pdf(source.data, metadata)
+
+
+def _parse_pdf(pdf_source: str | bytes, metadata: PdfMetadata) -> PdfMetadata:
+    """Fill in the parsed fields of metadata from a PDF path or its bytes."""
+    import pypdfium2 as pdfium
+
+    try:
+        pdf = pdfium.PdfDocument(pdf_source)
+    except PDF_READ_ERRORS as e:
+        metadata.error = str(e)
+        return metadata
+
+    try:
+        metadata.page_count = len(pdf)
+        metadata.producer = pdf.get_metadata_dict().get("Producer", "")
+
+        min_chars = None
+        for page_index in range(metadata.page_count):
+            page = pdf[page_index]
+            textpage = page.get_textpage()
+            try:
+                chars = len("".join(textpage.get_text_range().split()))
+            finally:
+                textpage.close()
+                page.close()
+            min_chars = chars if min_chars is None else min(min_chars, chars)
+            if min_chars == 0:
+                break
+        metadata.min_page_chars = min_chars or 0
+    except PDF_READ_ERRORS as e:
+        metadata.error = str(e)
+    finally:
+        pdf.close()
+
+    return metadata
+
+
+class MetadataIndex:
+    """
+    PDF metadata keyed by resolved path, persisted as a JSON file.
+
+    Entries record the file's size and mtime; update() only re-reads files
+    whose size or mtime changed, so refreshing a large tree where few files
+    changed costs one stat per file.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Load the index.
+
+        Args:
+            path: JSON file backing the index (created on first update)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, PdfMetadata] = {}
+        self._unsaved = 0  # entries recorded since the last save
+
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self._entries = {
+                        key: PdfMetadata(**entry) for key, entry in json.load(f).items()
+                    }
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable metadata index {self.path}: {e}")
+
+    def get(
+        self,
+        file_path: str | Path,
+        size: int | None = None,
+        mtime: float | None = None,
+    ) -> PdfMetadata | None:
+        """
+        Get the metadata of an unchanged, readable file.
+
+        Args:
+            file_path: Path to the PDF
+            size: Current file size, if already known (stat'ed if not given)
+            mtime: Current modification time, if already known
+
+        Returns:
+            PdfMetadata, or None if the file is not indexed, has changed since
+            it was, or could not be parsed
+        """
+        key = str(Path(file_path).resolve())
+        with self._lock:
+            metadata = self._entries.get(key)
+        if metadata is None or metadata.error is not None:
+            return None
+
+        if size is None or mtime is None:
+            try:
+                stat = os.stat(key)
+            except OSError:
+                return None
+            size, mtime = stat.st_size, stat.st_mtime
+
+        if (metadata.size, metadata.mtime) != (size, mtime):
+            return None
+        return metadata
+
+    def update(self, pdf_files: Iterable[str | Path]) -> int:
+        """
+        Index new and changed files, saving the index if anything changed.
+
+        Args:
+            pdf_files: PDFs to index
+
+        Returns:
+            Number of files (re)read
+        """
+        scanned = 0
+        for pdf_path in pdf_files:
+            key = str(Path(pdf_path).resolve())
+            try:
+                stat = os.stat(key)
+            except OSError as e:
+                logger.warning(f"Cannot index {key}: {e}")
+                continue
+
+            with self._lock:
+                metadata = self._entries.get(key)
+            if metadata is not None and (metadata.size, metadata.mtime) == (
+                stat.st_size,
+                stat.st_mtime,
+            ):
+                continue
+
+            try:
+                metadata = read_pdf_metadata(key)
+            except OSError as e:
+                logger.warning(f"Cannot index {key}: {e}")
+                continue
+            if metadata.error is not None:
+                logger.warning(
+                    f"Could not read PDF metadata of {key}: {metadata.error}"
+                )
+
+            with self._lock:
+                self._entries[key] = metadata
+            scanned += 1
+
+        if scanned:
+            with self._lock:
+                self._save()
+            logger.info(f"Metadata index: read {scanned} new or changed files")
+        return scanned
+
+    def record(self, source: SourceFile) -> bool:
+        """
+        Index a file from bytes already read, if it is new or changed.
+
+        Unlike update(), this never opens the file again, so on a
+        cloud-synced folder it costs no extra download. Entries are saved
+        by save().
+
+        Args:
+            source: PDF read into memory
+
+        Returns:
+            True if the entry was (re)read
+        """
+        with self._lock:
+            metadata = self._entries.get(source.path)
+        if metadata is not None and (metadata.size, metadata.mtime) == (
+            source.size,
+            source.mtime,
+        ):
+            return False
+
+        metadata = source_metadata(source)
+        if metadata.error is not None:
+            logger.warning(
+                f"Could not read PDF metadata of {source.path}: {metadata.error}"
+            )
+        with self._lock:
+            self._entries[source.path] = metadata
+            self._unsaved += 1
+        return True
+
+    def save(self) -> None:
+        """Save entries recorded since the last save, if any."""
+        with self._lock:
+            if not self._unsaved:
+                return
+            logger.info(f"Metadata index: read {self._unsaved} new or changed files")
+            self._save()
+
+    def scan(self, root: str | Path) -> int:
+        """
+        Index every PDF under a directory and drop entries for removed files.
+
+        Args:
+            root: Directory to scan recursively
+
+        Returns:
+            Number of files (re)read
+        """
+        root_path = Path(root).resolve()
+        pdf_files = sorted(
+            path for path in root_path.rglob("*") if path.suffix.lower() == ".pdf"
+        )
+        scanned = self.update(pdf_files)
+
+        present = {str(path) for path in pdf_files}
+        with self._lock:
+            removed = [
+                key
+                for key in self._entries
+                if Path(key).is_relative_to(root_path) and key not in present
+            ]
+            for key in removed:
+                del self._entries[key]
+            if removed:
+                self._save()
+        if removed:
+            logger.info(f"Metadata index: dropped {len(removed)} removed files")
+        return scanned
+
+    def entries(self) -> dict[str, PdfMetadata]:
+        """Snapshot of all entries, keyed by resolved path."""
+        with self._lock:
+            return dict(self._entries)
+
+    def _save(self) -> None:
+        """Write the index to disk atomically (lock held)."""
+        self._unsaved = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {key: entry.model_dump() for key, entry in self._entries.items()}, f
+            )
+        os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        """Number of indexed files."""
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,222 @@
+"""OCR result cache keyed by a hash of the rendered page image."""
+
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import ClassVar, Literal
+
+from docling.datamodel.base_models import Page
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import OcrOptions
+from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.factories import get_ocr_factory
+from docling_core.types.doc.page import TextCell
+from pydantic import Field, SerializeAsAny
+
+from processors.conversion_cache import ConversionCache
+
+logger = logging.getLogger(__name__)
+
+# Rendering scale the page is hashed at; Docling's preprocessing stage
+# already renders every page at 1.0, so hashing costs no extra rendering
+HASH_IMAGE_SCALE = 1.0
+
+# Documents converted under this name always run the inner engine and are
+# never cached (model warm-up converts its sample page under it)
+UNCACHED_DOCUMENT_NAME = "ocr-cache-bypass.pdf"
+
+
+class OcrPageCache(ConversionCache):
+    """
+    On-disk cache of OCR text cells keyed by page image hash and OCR options.
+
+    Each entry records how long its OCR run took, so hits can be reported
+    as OCR time saved.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        """
+        Initialize the OCR page cache.
+
+        Args:
+            cache_dir: Directory where cached OCR results are stored
+        """
+        super().__init__(cache_dir)
+        self.ocr_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def record_timing(self, ocr_seconds: float = 0.0, saved_seconds: float = 0.0):
+        """Add OCR time spent on a miss, or OCR time a hit avoided."""
+        with self._lock:
+            self.ocr_seconds += ocr_seconds
+            self.saved_seconds += saved_seconds
+
+    def get_stats(self) -> dict[str, float]:
+        """Get hit/miss counts, OCR seconds spent on misses and saved by hits."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "ocr_seconds": self.ocr_seconds,
+                "saved_seconds": self.saved_seconds,
+            }
+
+
+_caches: dict[str, OcrPageCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_ocr_page_cache(cache_dir: str | Path) -> OcrPageCache:
+    """
+    Get the process-wide OCR page cache for a directory.
+
+    Every converter (and pipeline profile) in a process shares one cache
+    object per directory, so its counters cover all of them.
+
+    Args:
+        cache_dir: Directory where cached OCR results are stored
+
+    Returns:
+        Shared OcrPageCache
+    """
+    key = str(Path(cache_dir).resolve())
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = OcrPageCache(key)
+        return _caches[key]
+
+
+class CachedOcrOptions(OcrOptions):
+    """Options for the caching OCR engine, which wraps another engine."""
+
+    kind: ClassVar[Literal["cached"]] = "cached"
+    inner: SerializeAsAny[OcrOptions]
+    cache_dir: str = Field(exclude=True)
+
+    @classmethod
+    def wrap(cls, inner: OcrOptions, cache_dir: str | Path) -> "CachedOcrOptions":
+        """
+        Wrap an OCR engine's options with the page cache.
+
+        Args:
+            inner: Options of the OCR engine that runs on cache misses
+            cache_dir: Directory where cached OCR results are stored
+
+        Returns:
+            CachedOcrOptions mirroring the inner engine's page-level settings
+        """
+        return cls(
+            inner=inner,
+            cache_dir=str(cache_dir),
+            lang=inner.lang,
+            force_full_page_ocr=inner.force_full_page_ocr,
+            bitmap_area_threshold=inner.bitmap_area_threshold,
+        )
+
+
+class CachedOcrModel(BaseOcrModel):
+    """
+    OCR model that reuses prior results for pixel-identical pages.
+
+    Pages are keyed by a SHA-256 of the rendered page image plus the inner
+    engine's options, so different engines or settings never share results.
+    On a miss the inner engine runs and its OCR cells are stored. Documents
+    named UNCACHED_DOCUMENT_NAME skip the cache entirely.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        artifacts_path: Path | None,
+        options: CachedOcrOptions,
+        accelerator_options,
+    ):
+        super().__init__(
+            enabled=enabled,
+            artifacts_path=artifacts_path,
+            options=options,
+            accelerator_options=accelerator_options,
+        )
+        self.options: CachedOcrOptions
+        self.cache = get_ocr_page_cache(options.cache_dir)
+        self.inner = get_ocr_factory(allow_external_plugins=False).create_instance(
+            options=options.inner,
+            enabled=enabled,
+            artifacts_path=artifacts_path,
+            accelerator_options=accelerator_options,
+        )
+
+        inner_json = options.inner.model_dump_json(serialize_as_any=True)
+        self._options_hash = hashlib.sha256(
+            f"{options.inner.kind}\n{inner_json}".encode()
+        ).hexdigest()[:16]
+
+    def _page_key(self, page: Page) -> str | None:
+        """Cache key for a page: rendered image hash plus OCR options hash."""
+        image = page.get_image(scale=HASH_IMAGE_SCALE)
+        if image is None:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(f"{image.mode}{image.size}".encode())
+        digest.update(image.tobytes())
+        return self.cache.make_key(digest.hexdigest(), self._options_hash)
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        if not self.enabled:
+            yield from page_batch
+            return
+        if conv_res.input.file.name == UNCACHED_DOCUMENT_NAME:
+            yield from self.inner(conv_res, page_batch)
+            return
+
+        for page in page_batch:
+            assert page._backend is not None
+            if not page._backend.is_valid():
+                yield page
+                continue
+
+            key = self._page_key(page)
+            cached = self.cache.get(key) if key else None
+            if cached is not None:
+                cells = [TextCell.model_validate(cell) for cell in cached["cells"]]
+                self.post_process_cells(cells, page)
+                self.cache.record_timing(saved_seconds=cached.get("seconds", 0.0))
+                yield page
+                continue
+
+            start_time = time.monotonic()
+            processed_pages = list(self.inner(conv_res, [page]))
+            elapsed = time.monotonic() - start_time
+            self.cache.record_timing(ocr_seconds=elapsed)
+
+            for processed in processed_pages:
+                if key and processed.parsed_page is not None:
+                    ocr_cells = [
+                        cell.model_dump(mode="json")
+                        for cell in processed.parsed_page.textline_cells
+                        if cell.from_ocr
+                    ]
+                    self.cache.put(key, {"cells": ocr_cells, "seconds": elapsed})
+                yield processed
+
+    @classmethod
+    def get_options_type(cls) -> type[OcrOptions]:
+        return CachedOcrOptions
+
+
+def register_cached_ocr() -> None:
+    """Register the caching OCR engine with Docling's OCR factory (idempotent)."""
+    # Same call signature as the PDF pipeline, so lru_cache returns its factory
+    factory = get_ocr_factory(allow_external_plugins=False)
+    if CachedOcrOptions not in factory.classes:
+        factory.register(CachedOcrModel, "documentextraction", __name__)
+
+
+register_cached_ocr()
@@ -0,0 +1,140 @@
+"""Detection and on-host calibration of the installed Docling OCR engines."""
+
+import importlib.util
+import logging
+import shutil
+import sys
+import time
+from collections.abc import Iterable
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from config import Config
+from processors.ingest import read_source
+
+logger = logging.getLogger(__name__)
+
+# Docling OCR kinds that can be selected explicitly ("auto" defers to Docling)
+OCR_ENGINES = ("easyocr", "rapidocr", "tesserocr", "tesseract", "ocrmac")
+
+# An engine only wins calibration if it recognizes at least this share of the
+# text the most thorough engine found on the same pages
+MIN_TEXT_RATIO = 0.9
+
+
+@lru_cache(maxsize=1)
+def available_ocr_engines() -> tuple[str, ...]:
+    """
+    Find the OCR engines installed on this machine.
+
+    Python engines are detected by their package, the Tesseract CLI by its
+    executable on PATH. Nothing is imported, so this is cheap.
+
+    Returns:
+        Installed engines, in OCR_ENGINES order
+    """
+    installed = {
+        "easyocr": importlib.util.find_spec("easyocr") is not None,
+        "rapidocr": (
+            importlib.util.find_spec("rapidocr") is not None
+            or importlib.util.find_spec("rapidocr_onnxruntime") is not None
+        ),
+        "tesserocr": importlib.util.find_spec("tesserocr") is not None,
+        "tesseract": shutil.which("tesseract") is not None,
+        "ocrmac": (
+            sys.platform == "darwin" and importlib.util.find_spec("ocrmac") is not None
+        ),
+    }
+    return tuple(engine for engine in OCR_ENGINES if installed[engine])
+
+
+class EngineTiming(BaseModel):
+    """Calibration result for one OCR engine."""
+
+    engine: str
+    pages: int = 0
+    seconds: float = 0.0
+    chars: int = 0  # characters of text recognized across all pages
+    error: str | None = None
+
+    @property
+    def seconds_per_page(self) -> float | None:
+        """Conversion time per page (None if nothing was converted)."""
+        return self.seconds / self.pages if self.pages else None
+
+
+def time_ocr_engine(
+    engine: str, pdf_paths: Iterable[str | Path], max_pages: int = 2
+) -> EngineTiming:
+    """
+    Time full-page OCR conversion of sample PDFs with one engine.
+
+    The engine's models are loaded (by converting the synthetic warm-up
+    page) before timing starts, and the OCR page
+    cache is bypassed so every page is really recognized.
+
+    Args:
+        engine: Docling OCR kind
+        pdf_paths: Sample PDFs (ideally image-only, like ABox invoices)
+        max_pages: Pages converted per PDF
+
+    Returns:
+        EngineTiming for the engine (with error set if it failed)
+    """
+    from docling.datamodel.base_models import DocumentStream
+
+    from processors.document_processor import (
+        WARMUP_TEXT,
+        DocumentProcessor,
+        _make_warmup_pdf,
+    )
+    from processors.ocr_cache import CachedOcrOptions
+
+    timing = EngineTiming(engine=engine)
+    try:
+        settings = {**Config.PIPELINE_PROFILES["scanned"], "ocr_engine": engine}
+        options = DocumentProcessor._build_pipeline_options(settings, do_ocr=True)
+        if isinstance(options.ocr_options, CachedOcrOptions):
+            options.ocr_options = options.ocr_options.inner
+        converter = DocumentProcessor._make_converter(options)
+        converter.convert(
+            DocumentStream(
+                name="warmup.pdf", stream=BytesIO(_make_warmup_pdf(WARMUP_TEXT))
+            )
+        )
+
+        for pdf_path in pdf_paths:
+            source = read_source(pdf_path)
+            start_time = time.time()
+            result = converter.convert(source.to_stream(), page_range=(1, max_pages))
+            timing.seconds += time.time() - start_time
+            timing.pages += len(result.document.pages)
+            timing.chars += sum(len(item.text) for item in result.document.texts)
+    # An engine that fails for any reason is reported, not fatal
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"OCR engine {engine} failed calibration: {e}")
+        timing.error = str(e)
+
+    return timing
+
+
+def pick_ocr_engine(timings: list[EngineTiming]) -> str | None:
+    """
+    Choose the fastest engine whose recognized text is close to the best.
+
+    Args:
+        timings: Calibration results
+
+    Returns:
+        Winning engine, or None if no engine converted any pages
+    """
+    usable = [t for t in timings if t.error is None and t.pages]
+    if not usable:
+        return None
+
+    most_chars = max(t.chars for t in usable)
+    good_enough = [t for t in usable if t.chars >= MIN_TEXT_RATIO * most_chars]
+    return min(good_enough, key=lambda t: t.seconds_per_page).engine
@@ -0,0 +1,106 @@
+"""Detection and page-level repair of near-empty OCR output."""
+
+import logging
+
+from docling_core.types.doc import DoclingDocument
+
+logger = logging.getLogger(__name__)
+
+IMAGE_PLACEHOLDER = "<!-- image -->"
+
+
+class OcrFailedError(Exception):
+    """Raised when OCR produced (near-)empty text even after retries."""
+
+
+def count_page_chars(document: DoclingDocument) -> dict[int, int]:
+    """
+    Count alphanumeric characters in each page's markdown export.
+
+    Image placeholders and table/markdown punctuation are not counted, so a
+    page that OCR turned into nothing but a picture scores zero.
+
+    Args:
+        document: Converted DoclingDocument
+
+    Returns:
+        Dict mapping page number (1-based) to character count
+    """
+    counts = {}
+    for page_no in sorted(document.pages):
+        markdown = document.export_to_markdown(page_no=page_no)
+        markdown = markdown.replace(IMAGE_PLACEHOLDER, "")
+        counts[page_no] = sum(1 for ch in markdown if ch.isalnum())
+    return counts
+
+
+def find_empty_pages(document: DoclingDocument, min_chars: int) -> list[int]:
+    """
+    Find pages whose text output is below a character threshold.
+
+    Args:
+        document: Converted DoclingDocument
+        min_chars: Minimum alphanumeric characters for a page to count as read
+
+    Returns:
+        Sorted list of near-empty page numbers
+    """
+    return [
+        page_no
+        for page_no, chars in count_page_chars(document).items()
+        if chars < min_chars
+    ]
+
+
+def contiguous_runs(page_nos: list[int]) -> list[tuple[int, int]]:
+    """
+    Group sorted page numbers into inclusive (start, end) ranges.
+
+    Args:
+        page_nos: Sorted page numbers
+
+    Returns:
+        List of (first page, last page) tuples usable as Docling page ranges
+    """
+    runs: list[tuple[int, int]] = []
+    for page_no in page_nos:
+        if runs and runs[-1][1] == page_no - 1:
+            runs[-1] = (runs[-1][0], page_no)
+        else:
+            runs.append((page_no, page_no))
+    return runs
+
+
+def replace_pages(
+    document: DoclingDocument, replacements: dict[int, DoclingDocument]
+) -> DoclingDocument:
+    """
+    Build a document with some pages taken from other conversions.
+
+    Replacement documents come from page-range conversions of the same PDF,
+    so they carry the original page numbers. Consecutive pages from the same
+    source are kept together, which lets DoclingDocument.concatenate keep
+    every page number unchanged.
+
+    Args:
+        document: Original conversion
+        replacements: Dict mapping page number to the document to take that
+            page from
+
+    Returns:
+        Merged document with the original name and origin
+    """
+    chunks: list[tuple[DoclingDocument, set[int]]] = []
+    for page_no in sorted(document.pages):
+        source = replacements.get(page_no, document)
+        if chunks and chunks[-1][0] is source:
+            chunks[-1][1].add(page_no)
+        else:
+            chunks.append((source, {page_no}))
+
+    merged = DoclingDocument.concatenate(
+        [source.filter(page_nrs=page_nos) for source, page_nos in chunks]
+    )
+    merged.name = document.name
+    merged.origin = document.origin
+    return merged
@@ -0,0 +1,64 @@
+"""Cheap text-layer classification of boilerplate pages before conversion."""
+
+import re
+
+
+def is_boilerplate_page(
+    text: str,
+    boilerplate_patterns: list[str],
+    data_patterns: list[str],
+    min_chars: int = 20,
+) -> bool:
+    """
+    Decide whether a page carries no invoice data.
+
+    A page is boilerplate if its embedded text matches one of the vendor's
+    boilerplate patterns (terms and conditions, remittance slips, ...) and
+    none of the patterns marking header, line-item or total data. Pages
+    without a usable text layer can't be judged and are never boilerplate.
+
+    Args:
+        text: Embedded text layer of the page
+        boilerplate_patterns: Regexes (case-insensitive) of boilerplate pages
+        data_patterns: Regexes (case-insensitive) of invoice data
+        min_chars: Minimum non-whitespace characters for a usable text layer
+
+    Returns:
+        True if the page can be skipped
+    """
+    if len("".join(text.split())) < min_chars:
+        return False
+    if not any(re.search(p, text, re.IGNORECASE) for p in boilerplate_patterns):
+        return False
+    return not any(re.search(p, text, re.IGNORECASE) for p in data_patterns)
+
+
+def content_page_count(
+    page_texts: list[str],
+    boilerplate_patterns: list[str],
+    data_patterns: list[str],
+    min_chars: int = 20,
+) -> int:
+    """
+    Count the pages to convert once trailing boilerplate pages are dropped.
+
+    Only the run of boilerplate pages at the end of a document is dropped
+    (where vendors append their terms or remittance pages), so the pages
+    kept are always 1..N and keep their page numbers. The first page is
+    always kept.
+
+    Args:
+        page_texts: Embedded text layer of each page, in page order
+        boilerplate_patterns: Regexes (case-insensitive) of boilerplate pages
+        data_patterns: Regexes (case-insensitive) of invoice data
+        min_chars: Minimum non-whitespace characters for a usable text layer
+
+    Returns:
+        Number of leading pages to convert
+    """
+    page_count = len(page_texts)
+    while page_count > 1 and is_boilerplate_page(
+        page_texts[page_count - 1], boilerplate_patterns, data_patterns, min_chars
+    ):
+        page_count -= 1
+    return page_count
@@ -0,0 +1,44 @@
+"""Splitting long PDFs into page ranges and merging their conversions."""
+
+from docling_core.types.doc import DoclingDocument
+
+
+def split_page_ranges(page_count: int, chunk_pages: int) -> list[tuple[int, int]]:
+    """
+    Split a document's pages into consecutive inclusive ranges.
+
+    Args:
+        page_count: Number of pages in the document
+        chunk_pages: Maximum pages per range
+
+    Returns:
+        List of (first page, last page) tuples usable as Docling page ranges
+    """
+    return [
+        (start, min(start + chunk_pages - 1, page_count))
+        for start in range(1, page_count + 1, chunk_pages)
+    ]
+
+
+def merge_page_ranges(documents: list[DoclingDocument]) -> DoclingDocument:
+    """
+    Merge conversions of consecutive page ranges of one PDF.
+
+    Page-range conversions keep the original page numbers, and
+    DoclingDocument.concatenate leaves them unchanged when the ranges are
+    consecutive, so the merged document is numbered like a whole-file
+    conversion.
+
+    Args:
+        documents: Conversions of consecutive page ranges, in page order
+
+    Returns:
+        Merged document with the first conversion's name and origin
+    """
+    if len(documents) == 1:
+        return documents[0]
+
+    merged = DoclingDocument.concatenate(documents)
+    merged.name = documents[0].name
+    merged.origin = documents[0].origin
+    return merged
@@ -0,0 +1,112 @@
+"""Read-ahead of source files on a small thread pool."""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Prefetcher:
+    """
+    Load files ahead of the code consuming them, in consumption order.
+
+    On a cloud-synced folder (e.g. Dropbox "online-only" files) the first
+    open of each file blocks while it is downloaded; reading a window of
+    upcoming files in parallel overlaps those downloads with each other and
+    with the consumer's work. At most `window` files are loaded but not yet
+    consumed, which bounds the memory held by the prefetcher.
+    """
+
+    def __init__(self, load: Callable[[Path], T], window: int, workers: int):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            load: Function that reads one file (called from worker threads)
+            window: Files loaded ahead of the consumer (0 loads each file
+                only when it is consumed)
+            workers: Threads loading files in parallel
+        """
+        self.load = load
+        self.window = window
+        self.workers = workers
+        self.wait_seconds = 0.0  # consumer time blocked on loads
+        self.load_seconds = 0.0  # time spent in load across all threads
+        self._lock = threading.Lock()
+
+    def _timed_load(self, path: Path) -> T:
+        start_time = time.time()
+        try:
+            return self.load(path)
+        finally:
+            with self._lock:
+                self.load_seconds += time.time() - start_time
+
+    def _result(self, future: Future) -> tuple[T | None, Exception | None]:
+        """Wait for a load, counting the time the consumer was blocked."""
+        start_time = time.time()
+        try:
+            return future.result(), None
+        # Load errors are handed to the consumer with their path
+        except Exception as e:  # noqa: BLE001
+            return None, e
+        finally:
+            self.wait_seconds += time.time() - start_time
+
+    def iter(
+        self, paths: list[Path]
+    ) -> Iterator[tuple[Path, T | None, Exception | None]]:
+        """
+        Load files, yielding them in order as the consumer asks for them.
+
+        Args:
+            paths: Files to load, in the order they will be consumed
+
+        Yields:
+            Tuple of (path, loaded value or None, exception raised by load or
+            None)
+        """
+        if self.window <= 0 or self.workers <= 0:
+            # Load inline: the consumer waits for every read
+            for path in paths:
+                start_time = time.time()
+                try:
+                    value, error = self._timed_load(path), None
+                except Exception as e:  # noqa: BLE001
+                    value, error = None, e
+                self.wait_seconds += time.time() - start_time
+                yield path, value, error
+            return
+
+        pending: deque[tuple[Path, Future]] = deque()
+        upcoming = iter(paths)
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="prefetch"
+        ) as executor:
+
+            def fill() -> None:
+                while len(pending) < self.window:
+                    path = next(upcoming, None)
+                    if path is None:
+                        return
+                    pending.append((path, executor.submit(self._timed_load, path)))
+
+            fill()
+            while pending:
+                path, future = pending.popleft()
+                fill()
+
+                yield (path, *self._result(future))
+
+        logger.debug(
+            f"Prefetched {len(paths)} files: {self.load_seconds:.1f}s reading, "
+            f"{self.wait_seconds:.1f}s waited"
+        )
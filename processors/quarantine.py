@@ -0,0 +1,135 @@
+"""Persistent list of PDFs that exceeded conversion limits."""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ConversionLimitExceeded(Exception):
+    """Raised when a document exceeds a configured conversion limit."""
+
+    def __init__(self, limit: str, detail: str):
+        """
+        Initialize the exception.
+
+        Args:
+            limit: Which limit was hit ("wall_time", "page_count" or "file_size")
+            detail: Human-readable description of the violation
+        """
+        super().__init__(limit, detail)
+        self.limit = limit
+        self.detail = detail
+
+    def __str__(self) -> str:
+        return self.detail
+
+
+class QuarantineList:
+    """
+    Files that exceeded a conversion limit, skipped until they change.
+
+    Entries are keyed by resolved path and record the file's size and mtime;
+    a file whose size or mtime differs from the recorded values is released
+    from quarantine and converted again.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Load the quarantine list.
+
+        Args:
+            path: JSON file backing the list (created on first add)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable quarantine list {self.path}: {e}")
+
+    @staticmethod
+    def _fingerprint(file_path: str) -> dict:
+        """Size and mtime used to detect that a quarantined file changed."""
+        stat = os.stat(file_path)
+        return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    def get(self, file_path: str | Path) -> dict | None:
+        """
+        Get the quarantine entry for an unchanged file.
+
+        Args:
+            file_path: Path to the PDF
+
+        Returns:
+            Entry dict with "limit" and "detail", or None if the file is not
+            quarantined (or has changed since it was)
+        """
+        key = str(Path(file_path).resolve())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            try:
+                fingerprint = self._fingerprint(key)
+            except OSError:
+                return entry
+
+            if (entry["size"], entry["mtime"]) == (
+                fingerprint["size"],
+                fingerprint["mtime"],
+            ):
+                return entry
+
+            logger.info(f"Releasing changed file from quarantine: {key}")
+            del self._entries[key]
+            self._save()
+            return None
+
+    def add(self, file_path: str | Path, limit: str, detail: str) -> None:
+        """
+        Quarantine a file.
+
+        Args:
+            file_path: Path to the PDF
+            limit: Which limit was hit
+            detail: Human-readable description of the violation
+        """
+        key = str(Path(file_path).resolve())
+        try:
+            fingerprint = self._fingerprint(key)
+        except OSError as e:
+            logger.warning(f"Cannot quarantine missing file {key}: {e}")
+            return
+
+        with self._lock:
+            self._entries[key] = {
+                **fingerprint,
+                "limit": limit,
+                "detail": detail,
+                "quarantined_at": datetime.now().isoformat(),
+            }
+            self._save()
+        logger.warning(f"Quarantined {key}: {detail}")
+
+    def _save(self) -> None:
+        """Write the list to disk atomically (lock held)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._entries, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        """Number of quarantined files."""
+        with self._lock:
+            return len(self._entries)
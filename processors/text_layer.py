@@ -0,0 +1,206 @@
+"""Fast embedded text-layer probe for deciding whether a PDF needs OCR."""
+
+import logging
+from pathlib import Path
+from typing import Self
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+# Raised when a PDF can't be read: pypdfium2's PdfiumError is a RuntimeError,
+# and opening a path can fail with an OSError
+PDF_READ_ERRORS = (RuntimeError, OSError)
+
+
+class TextLayerProbe(BaseModel):
+    """Result of probing a PDF's embedded text layer."""
+
+    page_count: int
+    chars_per_page: list[int] = Field(default_factory=list)
+    min_chars_per_page: int
+
+    @property
+    def pages_with_text(self) -> int:
+        """Number of pages with a usable text layer."""
+        return sum(
+            1 for chars in self.chars_per_page if chars >= self.min_chars_per_page
+        )
+
+    @property
+    def has_text_layer(self) -> bool:
+        """True if every page carries a usable embedded text layer."""
+        return self.page_count > 0 and self.pages_with_text == self.page_count
+
+
+def _read_page_texts(pdf, max_pages: int | None = None) -> list[str]:
+    """
+    Read the embedded text layer of each page of an open pypdfium2 document.
+
+    Args:
+        pdf: pypdfium2 PdfDocument
+        max_pages: Only read the first N pages (all pages if None)
+
+    Returns:
+        List of page texts, in page order
+    """
+    page_count = len(pdf) if max_pages is None else min(len(pdf), max_pages)
+    texts = []
+    for page_index in range(page_count):
+        page = pdf[page_index]
+        textpage = page.get_textpage()
+        try:
+            texts.append(textpage.get_text_range())
+        finally:
+            textpage.close()
+            page.close()
+    return texts
+
+
+class PdfTextLayer:
+    """
+    A PDF's page count and embedded text, read through one pypdfium2 handle.
+
+    The PDF is parsed on first use and kept open until close(), and the page
+    texts are read once, so the checks that run before a conversion (page
+    limit, OCR probe, boilerplate pages) share a single parse of the bytes.
+    """
+
+    def __init__(self, pdf_source: str | Path | bytes):
+        """
+        Initialize without parsing the PDF.
+
+        Args:
+            pdf_source: Path to the PDF file, or its raw bytes
+        """
+        self.pdf_source = (
+            str(pdf_source) if isinstance(pdf_source, Path) else pdf_source
+        )
+        self._pdf = None
+        self._page_texts: list[str] | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """True once the PDF has been parsed (and until close())."""
+        return self._pdf is not None
+
+    def _document(self):
+        """Parse the PDF on first use."""
+        if self._pdf is None:
+            import pypdfium2 as pdfium
+
+            self._pdf = pdfium.PdfDocument(self.pdf_source)
+        return self._pdf
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages."""
+        return len(self._document())
+
+    def page_texts(self) -> list[str]:
+        """Text layer of every page, in page order (read on first call)."""
+        if self._page_texts is None:
+            self._page_texts = _read_page_texts(self._document())
+        return self._page_texts
+
+    def probe(self, min_chars_per_page: int = 20) -> TextLayerProbe:
+        """
+        Count embedded (non-OCR) text characters on each page.
+
+        Args:
+            min_chars_per_page: Minimum non-whitespace characters for a page's
+                text layer to be considered usable
+
+        Returns:
+            TextLayerProbe with per-page character counts
+        """
+        chars_per_page = [len("".join(text.split())) for text in self.page_texts()]
+        return TextLayerProbe(
+            page_count=len(chars_per_page),
+            chars_per_page=chars_per_page,
+            min_chars_per_page=min_chars_per_page,
+        )
+
+    def close(self) -> None:
+        """Release the pypdfium2 handle."""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+
+def probe_text_layer(
+    pdf_source: str | Path | bytes, min_chars_per_page: int = 20
+) -> TextLayerProbe:
+    """
+    Count embedded (non-OCR) text characters on each page of a PDF.
+
+    Uses pypdfium2 (already a Docling dependency), which reads the text layer
+    without rendering pages, so this costs milliseconds per document.
+
+    Args:
+        pdf_source: Path to the PDF file, or its raw bytes
+        min_chars_per_page: Minimum non-whitespace characters for a page's
+            text layer to be considered usable
+
+    Returns:
+        TextLayerProbe with per-page character counts
+    """
+    with PdfTextLayer(pdf_source) as pdf:
+        return pdf.probe(min_chars_per_page)
+
+
+def extract_page_texts(pdf_source: str | Path | bytes) -> list[str]:
+    """
+    Get the embedded text layer of every page.
+
+    Args:
+        pdf_source: Path to the PDF file, or its raw bytes
+
+    Returns:
+        List of page texts, in page order (empty strings for scanned pages)
+    """
+    with PdfTextLayer(pdf_source) as pdf:
+        return pdf.page_texts()
+
+
+def extract_first_page_text(pdf_source: str | Path | bytes) -> str:
+    """
+    Get the embedded text layer of the first page.
+
+    Args:
+        pdf_source: Path to the PDF file, or its raw bytes
+
+    Returns:
+        First page text (empty if the PDF has no pages or no text layer)
+    """
+    import pypdfium2 as pdfium
+
+    if isinstance(pdf_source, Path):
+        pdf_source = str(pdf_source)
+
+    pdf = pdfium.PdfDocument(pdf_source)
+    try:
+        texts = _read_page_texts(pdf, max_pages=1)
+    finally:
+        pdf.close()
+    return texts[0] if texts else ""
+
+
+def count_pages(pdf_source: str | Path | bytes) -> int:
+    """
+    Count the pages of a PDF without reading or rendering them.
+
+    Args:
+        pdf_source: Path to the PDF file, or its raw bytes
+
+    Returns:
+        Number of pages
+    """
+    with PdfTextLayer(pdf_source) as pdf:
+        return pdf.page_count
@@ -0,0 +1,137 @@
+"""Benchmark thread vs process conversion backends on a sample of invoices."""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import Config
+from processors.batch_processor import BatchProcessor
+from utils.logging_config import setup_logging
+
+# Setup logging
+setup_logging(log_level="WARNING")
+
+
+def run_backend(
+    backend: str, directory: Path, num_workers: int, max_files: int
+) -> dict:
+    """
+    Process a directory with one backend and time it.
+
+    The conversion and OCR page caches are disabled so both backends do the
+    full Docling work, and CACHE_DIR points at a temporary directory per run,
+    so no run sees another's quarantine or metadata index (or touches the
+    real ones).
+
+    Args:
+        backend: "thread" or "process"
+        directory: Directory of invoice PDFs
+        num_workers: Number of parallel workers
+        max_files: Number of files to process
+
+    Returns:
+        Dict with timing and outcome for the run
+    """
+    Config.USE_CONVERSION_CACHE = False
+    Config.USE_OCR_CACHE = False
+
+    cache_dir = Config.CACHE_DIR
+    with tempfile.TemporaryDirectory(prefix="backend-benchmark-") as run_cache_dir:
+        Config.CACHE_DIR = Path(run_cache_dir)
+        try:
+            start_time = time.time()
+            processor = BatchProcessor(
+                num_workers=num_workers, output_dir=Config.OUTPUT_DIR, backend=backend
+            )
+            result = processor.process_directory(directory, max_files=max_files)
+            elapsed = time.time() - start_time
+        finally:
+            Config.CACHE_DIR = cache_dir
+
+    stats = result.statistics
+    return {
+        "backend": backend,
+        "workers": num_workers,
+        "files": stats.total_files,
+        "successful": stats.successful,
+        "seconds": round(elapsed, 2),
+        "files_per_minute": round(stats.total_files / elapsed * 60, 2)
+        if elapsed > 0
+        else 0.0,
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compare thread and process conversion backends"
+    )
+    parser.add_argument(
+        "--vendor-dir",
+        default="Reflex",
+        help="Vendor directory under the source directory (default: Reflex)",
+    )
+    parser.add_argument(
+        "--max-files", type=int, default=16, help="Number of invoices to process"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[4, 8],
+        help="Worker counts to try (default: 4 8)",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Optional JSON file for the results table"
+    )
+    args = parser.parse_args()
+
+    try:
+        Config.load_environment()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error loading environment: {e}")
+        sys.exit(1)
+
+    directory = Config.SOURCE_DIR / args.vendor_dir
+    if not directory.exists():
+        print(f"❌ Directory not found: {directory}")
+        sys.exit(1)
+
+    rows = []
+    for num_workers in args.workers:
+        for backend in ("thread", "process"):
+            print(f"Running {backend} backend with {num_workers} workers...")
+            rows.append(run_backend(backend, directory, num_workers, args.max_files))
+
+    print()
+    print("=" * 80)
+    print("BACKEND BENCHMARK")
+    print("=" * 80)
+    print(
+        f"{'Backend':10s} {'Workers':>8s} {'Files':>6s} {'OK':>4s} "
+        f"{'Seconds':>9s} {'Files/min':>10s}"
+    )
+    print("-" * 80)
+    for row in rows:
+        print(
+            f"{row['backend']:10s} {row['workers']:8d} {row['files']:6d} "
+            f"{row['successful']:4d} {row['seconds']:9.2f} "
+            f"{row['files_per_minute']:10.2f}"
+        )
+    print()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Compare extraction on padded vs compact markdown, per vendor."""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import Config
+from models.vendor import VENDOR_DIRECTORIES
+from processors.compact_markdown import compact_markdown
+from processors.document_processor import DocumentProcessor
+from utils.logging_config import setup_logging
+
+# Setup logging
+setup_logging(log_level="WARNING")
+
+
+def time_extraction(extractor, doc_key: str, markdown: str, filename: str, repeat: int):
+    """
+    Run an extractor repeatedly on one rendering.
+
+    Args:
+        extractor: Vendor extractor
+        doc_key: Document key from conversion
+        markdown: Markdown rendering to extract from
+        filename: PDF filename
+        repeat: Number of runs (the mean is reported)
+
+    Returns:
+        Tuple of (mean seconds per extraction, extracted invoice)
+    """
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        invoice = extractor.extract(doc_key, markdown, filename)
+    return (time.perf_counter() - start_time) / repeat, invoice
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark compact markdown rendering for extraction"
+    )
+    parser.add_argument(
+        "--sample", type=int, default=10, help="Invoices per vendor (first N by name)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Extraction runs per rendering"
+    )
+    parser.add_argument("--output", type=Path, help="Write per-vendor results as JSON")
+    args = parser.parse_args()
+
+    try:
+        Config.load_environment()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error loading environment: {e}")
+        sys.exit(1)
+
+    # Imported after processors (extractors.factory imports them back)
+    from extractors.factory import ExtractorFactory
+
+    # Keep Docling's padded rendering; the compact one is derived from it
+    Config.COMPACT_MARKDOWN = False
+    processor = DocumentProcessor()
+    factory = ExtractorFactory(processor)
+
+    rows = []
+    for vendor, dirname in VENDOR_DIRECTORIES.items():
+        extractor = factory.get_extractor(vendor)
+        directory = Config.SOURCE_DIR / dirname
+        if extractor is None or not directory.exists():
+            continue
+
+        row = {
+            "vendor": vendor.value,
+            "files": 0,
+            "padded_chars": 0,
+            "compact_chars": 0,
+            "padded_seconds": 0.0,
+            "compact_seconds": 0.0,
+            "mismatches": [],
+        }
+        for pdf_path in sorted(directory.glob("*.pdf"))[: args.sample]:
+            try:
+                doc_key = processor.convert_document(pdf_path)
+            except Exception as e:  # noqa: BLE001
+                print(f"⚠️  Could not convert {pdf_path.name}: {e}")
+                continue
+
+            padded = processor.get_document_markdown(doc_key, max_size=None)
+            compact = compact_markdown(padded)
+            padded_seconds, padded_invoice = time_extraction(
+                extractor, doc_key, padded, pdf_path.name, args.repeat
+            )
+            compact_seconds, compact_invoice = time_extraction(
+                extractor, doc_key, compact, pdf_path.name, args.repeat
+            )
+
+            row["files"] += 1
+            row["padded_chars"] += len(padded)
+            row["compact_chars"] += len(compact)
+            row["padded_seconds"] += padded_seconds
+            row["compact_seconds"] += compact_seconds
+            if padded_invoice.model_dump() != compact_invoice.model_dump():
+                row["mismatches"].append(pdf_path.name)
+
+        if row["files"]:
+            rows.append(row)
+        processor.document_cache.clear()
+
+    print()
+    print("=" * 80)
+    print("COMPACT MARKDOWN BENCHMARK")
+    print("=" * 80)
+    print(
+        f"{'Vendor':24s} {'Files':>5s} {'Padded KB':>10s} {'Compact KB':>10s} "
+        f"{'Size':>6s} {'Extract ms':>11s} {'Compact ms':>11s} {'Same':>5s}"
+    )
+    print("-" * 80)
+    for row in rows:
+        size_ratio = (
+            row["compact_chars"] / row["padded_chars"] if row["padded_chars"] else 0
+        )
+        print(
+            f"{row['vendor'][:24]:24s} {row['files']:5d} "
+            f"{row['padded_chars'] / 1024:10.1f} {row['compact_chars'] / 1024:10.1f} "
+            f"{size_ratio:6.0%} "
+            f"{row['padded_seconds'] * 1000 / row['files']:11.2f} "
+            f"{row['compact_seconds'] * 1000 / row['files']:11.2f} "
+            f"{'yes' if not row['mismatches'] else 'NO':>5s}"
+        )
+    print()
+
+    mismatches = [(row["vendor"], name) for row in rows for name in row["mismatches"]]
+    if mismatches:
+        print("⚠️  Extraction differs on compact markdown:")
+        for vendor, name in mismatches:
+            print(f"  {vendor}: {name}")
+        print()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""Benchmark a matrix of Docling pipeline settings on a fixed sample per vendor."""
+
+import argparse
+import csv
+import itertools
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import Config
+from models.batch_result import ProcessingStatus
+from models.vendor import DIRECTORY_TO_VENDOR, VENDOR_DIRECTORIES
+from utils.logging_config import setup_logging
+
+# Invoice fields counted as "populated" in the outcome columns
+OUTCOME_FIELDS = (
+    "invoice_date",
+    "invoice_number",
+    "po_number",
+    "line_items",
+    "subtotal",
+    "sales_tax",
+    "total",
+)
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB (None if unavailable)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+def run_setting(
+    config_settings: dict,
+    settings: dict,
+    vendor_dir: str,
+    num_workers: int,
+    sample_size: int,
+) -> dict:
+    """
+    Process a vendor's sample with one pipeline setting.
+
+    Runs in a fresh worker process (see main), so the peak RSS reported is
+    this setting's alone. Models are warmed up before timing starts, and
+    the conversion and OCR page caches are disabled so every run does the
+    full Docling work. CACHE_DIR points at a temporary directory, so the
+    run's quarantine and metadata index never touch the real ones.
+
+    Args:
+        config_settings: Config snapshot from Config.export_settings() in the
+            parent, so the run sees the loaded environment even under "spawn"
+        settings: Pipeline profile overrides (ocr_engine, force_full_page_ocr,
+            table_mode, images_scale, ocr)
+        vendor_dir: Vendor directory name under Config.SOURCE_DIR
+        num_workers: Number of parallel workers
+        sample_size: Number of invoices to process (first N by name)
+
+    Returns:
+        Dict with timing, memory and extraction outcome for the run
+    """
+    from processors.batch_processor import BatchProcessor
+    from processors.text_layer import PDF_READ_ERRORS, count_pages
+
+    Config.apply_settings(config_settings)
+    setup_logging(log_level="WARNING")
+    Config.USE_CONVERSION_CACHE = False
+    Config.USE_OCR_CACHE = False
+    Config.WARMUP_MODELS = False
+    Config.PIPELINE_PROFILES = {
+        name: {**profile, **settings}
+        for name, profile in Config.PIPELINE_PROFILES.items()
+    }
+
+    directory = Config.SOURCE_DIR / vendor_dir
+    vendor = DIRECTORY_TO_VENDOR[vendor_dir.lower()]
+    profile = Config.get_pipeline_profile(vendor)
+
+    with tempfile.TemporaryDirectory(prefix="pipeline-benchmark-") as cache_dir:
+        Config.CACHE_DIR = Path(cache_dir)
+        processor = BatchProcessor(
+            num_workers=num_workers,
+            output_dir=Config.OUTPUT_DIR / "benchmarks",
+            backend="thread",
+        )
+        warmup_start = time.time()
+        processor.document_processor.warmup(profiles=[profile])
+        warmup_seconds = time.time() - warmup_start
+
+        start_time = time.time()
+        result = processor.process_directory(directory, max_files=sample_size)
+        elapsed = time.time() - start_time
+
+    peak_rss_mb = _peak_rss_mb()
+    pages = 0
+    for invoice_result in result.results:
+        try:
+            pages += count_pages(invoice_result.file_path)
+        except PDF_READ_ERRORS:
+            continue
+
+    invoices = [
+        r.invoice
+        for r in result.results
+        if r.status == ProcessingStatus.SUCCESS and r.invoice is not None
+    ]
+    fields_populated = [
+        sum(1 for field in OUTCOME_FIELDS if getattr(invoice, field))
+        for invoice in invoices
+    ]
+
+    return {
+        "vendor": vendor.value,
+        "profile": profile,
+        **settings,
+        "workers": num_workers,
+        "files": result.statistics.total_files,
+        "pages": pages,
+        "successful": result.statistics.successful,
+        "seconds": round(elapsed, 2),
+        "seconds_per_page": round(elapsed / pages, 3) if pages else None,
+        "warmup_seconds": round(warmup_seconds, 2),
+        "peak_rss_mb": round(peak_rss_mb, 1) if peak_rss_mb else None,
+        "mean_confidence": round(
+            sum(i.extraction_confidence for i in invoices) / len(invoices), 3
+        )
+        if invoices
+        else None,
+        "mean_fields_populated": round(sum(fields_populated) / len(fields_populated), 2)
+        if fields_populated
+        else None,
+    }
+
+
+def build_matrix(args: argparse.Namespace) -> list[dict]:
+    """
+    Expand the command-line options into one settings dict per combination.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        List of pipeline profile overrides
+    """
+    return [
+        {
+            "ocr": ocr,
+            "ocr_engine": engine,
+            "force_full_page_ocr": force_full_page,
+            "table_mode": table_mode,
+            "images_scale": images_scale,
+        }
+        for ocr, engine, force_full_page, table_mode, images_scale in (
+            itertools.product(
+                args.ocr,
+                args.ocr_engines,
+                args.force_full_page_ocr,
+                args.table_modes,
+                args.images_scales,
+            )
+        )
+    ]
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a true/false command-line value."""
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise argparse.ArgumentTypeError(f"Expected true or false, got {value}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark Docling pipeline settings per vendor"
+    )
+    parser.add_argument(
+        "--vendors",
+        nargs="+",
+        default=list(VENDOR_DIRECTORIES.values()),
+        help="Vendor directories under the source directory (default: all)",
+    )
+    parser.add_argument(
+        "--sample", type=int, default=5, help="Invoices per vendor (first N by name)"
+    )
+    parser.add_argument(
+        "--ocr",
+        nargs="+",
+        default=["auto"],
+        choices=["auto", "always", "never"],
+        help="OCR modes (default: auto)",
+    )
+    parser.add_argument(
+        "--ocr-engines",
+        nargs="+",
+        default=["auto"],
+        help="Docling OCR engines, e.g. auto easyocr tesseract rapidocr",
+    )
+    parser.add_argument(
+        "--force-full-page-ocr",
+        nargs="+",
+        type=_parse_bool,
+        default=[True],
+        help="force_full_page_ocr values (default: true)",
+    )
+    parser.add_argument(
+        "--table-modes",
+        nargs="+",
+        default=["accurate", "fast"],
+        choices=["accurate", "fast"],
+        help="TableFormer modes (default: accurate fast)",
+    )
+    parser.add_argument(
+        "--images-scales",
+        nargs="+",
+        type=float,
+        default=[1.0],
+        help="Page image scales (default: 1.0)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[Config.MAX_WORKERS],
+        help="Worker counts to try",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("pipeline_benchmark.csv"),
+        help="Results table (.csv or .json)",
+    )
+    args = parser.parse_args()
+
+    setup_logging(log_level="WARNING")
+    try:
+        Config.load_environment()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error loading environment: {e}")
+        sys.exit(1)
+
+    unknown = [d for d in args.vendors if d not in VENDOR_DIRECTORIES.values()]
+    if unknown:
+        print(f"❌ Unknown vendor directories: {', '.join(unknown)}")
+        sys.exit(1)
+
+    matrix = build_matrix(args)
+    runs = [
+        (settings, vendor_dir, num_workers)
+        for vendor_dir in args.vendors
+        if (Config.SOURCE_DIR / vendor_dir).exists()
+        for settings in matrix
+        for num_workers in args.workers
+    ]
+    print(f"Running {len(runs)} benchmark runs ({len(matrix)} settings)")
+
+    rows = []
+    for i, (settings, vendor_dir, num_workers) in enumerate(runs, 1):
+        print(f"[{i}/{len(runs)}] {vendor_dir} {settings} workers={num_workers}")
+        # A fresh process per run isolates model memory and peak RSS
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            try:
+                rows.append(
+                    executor.submit(
+                        run_setting,
+                        Config.export_settings(),
+                        settings,
+                        vendor_dir,
+                        num_workers,
+                        args.sample,
+                    ).result()
+                )
+            # A failed setting is recorded and the sweep moves on
+            except Exception as e:  # noqa: BLE001
+                print(f"  ❌ Failed: {e}")
+                rows.append(
+                    {
+                        "vendor": DIRECTORY_TO_VENDOR[vendor_dir.lower()].value,
+                        **settings,
+                        "workers": num_workers,
+                        "error": str(e),
+                    }
+                )
+
+    print()
+    print("=" * 80)
+    print("PIPELINE BENCHMARK")
+    print("=" * 80)
+    print(
+        f"{'Vendor':22s} {'OCR':6s} {'Engine':10s} {'Full':>5s} {'Table':9s} "
+        f"{'Scale':>5s} {'Wkr':>3s} {'s/page':>7s} {'RSS MB':>7s} "
+        f"{'OK':>5s} {'Conf':>5s} {'Fields':>6s}"
+    )
+    print("-" * 80)
+    for row in rows:
+        if "error" in row:
+            print(f"{row['vendor']:22s} failed: {row['error']}")
+            continue
+        print(
+            f"{row['vendor'][:22]:22s} {row['ocr']:6s} {row['ocr_engine']:10s} "
+            f"{str(row['force_full_page_ocr'])[0]:>5s} {row['table_mode']:9s} "
+            f"{row['images_scale']:5.1f} {row['workers']:3d} "
+            f"{row['seconds_per_page'] or 0:7.3f} {row['peak_rss_mb'] or 0:7.0f} "
+            f"{row['successful']:2d}/{row['files']:<2d} "
+            f"{row['mean_confidence'] or 0:5.2f} "
+            f"{row['mean_fields_populated'] or 0:6.1f}"
+        )
+    print()
+
+    if args.output.suffix == ".json":
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+    else:
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        with open(args.output, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Export or import conversion cache bundles to share conversions between machines."""
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import Config
+from processors.conversion_cache import (
+    ConversionCache,
+    hash_file,
+    match_fingerprints,
+)
+from utils.logging_config import setup_logging
+
+# Setup logging
+setup_logging(log_level="WARNING")
+
+# Conversions of a document's leading pages are matched up to this many pages
+MAX_PARTIAL_PAGES = 1000
+
+
+def find_pdfs(paths: list[Path]) -> list[Path]:
+    """
+    Expand files and directories into the PDFs they contain.
+
+    Args:
+        paths: PDF files and/or directories (searched recursively)
+
+    Returns:
+        Sorted list of PDF paths
+    """
+    pdf_files = set()
+    for path in paths:
+        if path.is_dir():
+            pdf_files.update(p for p in path.rglob("*") if p.suffix.lower() == ".pdf")
+        elif path.exists():
+            pdf_files.add(path)
+        else:
+            print(f"⚠️  Skipping missing path: {path}")
+    return sorted(pdf_files)
+
+
+def export_bundle(cache: ConversionCache, bundle: Path, paths: list[Path]) -> None:
+    """Export the cached conversions of the given PDFs."""
+    pdf_files = find_pdfs(paths or [Config.SOURCE_DIR])
+    print(f"Hashing {len(pdf_files)} PDFs...")
+
+    hashes = []
+    for pdf_path in pdf_files:
+        try:
+            hashes.append(hash_file(pdf_path))
+        except OSError as e:
+            print(f"⚠️  Could not read {pdf_path}: {e}")
+
+    exported = cache.export_bundle(bundle, hashes)
+    converted = sum(1 for h in set(hashes) if cache.keys_for(h))
+    print(f"✅ Exported {exported} conversions of {converted} files to {bundle}")
+    print(f"   Bundle size: {bundle.stat().st_size / (1024 * 1024):.1f} MB")
+    if converted < len(set(hashes)):
+        print(f"   {len(set(hashes)) - converted} files have no cached conversion")
+
+
+def import_bundle(cache: ConversionCache, bundle: Path) -> None:
+    """Import a bundle and check its entries match this machine's pipelines."""
+    from processors.document_processor import DocumentProcessor
+
+    added, manifest = cache.import_bundle(bundle)
+    keys = manifest.get("keys", [])
+    print(f"✅ Imported {added} new conversions ({len(keys)} in bundle)")
+    print(f"   Created with Docling {manifest.get('docling_version', 'unknown')}")
+
+    # Entries are only used if this machine builds the same pipelines
+    local = match_fingerprints(
+        DocumentProcessor(use_conversion_cache=False).get_pipeline_fingerprints(),
+        max(Config.MAX_PAGES or 0, MAX_PARTIAL_PAGES),
+    )
+    by_pipelines = Counter()
+    unmatched = Counter()
+    for key in keys:
+        fingerprint = key.rsplit("-", 1)[1]
+        if fingerprint in local:
+            by_pipelines[", ".join(local[fingerprint])] += 1
+        else:
+            unmatched[fingerprint] += 1
+
+    for pipelines, count in sorted(by_pipelines.items()):
+        print(f"   {count:5d} entries for {pipelines}")
+    for fingerprint, count in sorted(unmatched.items()):
+        print(
+            f"   {count:5d} entries for pipeline {fingerprint}, which does not "
+            "match any pipeline here (check ocr_engine, profiles and Docling "
+            "version)"
+        )
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Share converted documents between environments"
+    )
+    parser.add_argument("--env", help="Environment to load")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser(
+        "export", help="Write cached conversions of PDFs to a bundle"
+    )
+    export_parser.add_argument("bundle", type=Path, help="Bundle file to write")
+    export_parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="PDFs or directories to export (default: the source directory)",
+    )
+
+    import_parser = subparsers.add_parser(
+        "import", help="Add the conversions in a bundle to the cache"
+    )
+    import_parser.add_argument("bundle", type=Path, help="Bundle file to read")
+
+    args = parser.parse_args()
+
+    try:
+        Config.load_environment(args.env)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error loading environment: {e}")
+        sys.exit(1)
+
+    cache = ConversionCache(Config.CACHE_DIR / "conversions")
+    if args.command == "export":
+        export_bundle(cache, args.bundle, args.paths)
+    else:
+        if not args.bundle.exists():
+            print(f"❌ Bundle not found: {args.bundle}")
+            sys.exit(1)
+        import_bundle(cache, args.bundle)
+
+
+if __name__ == "__main__":
+    main()
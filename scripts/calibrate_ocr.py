@@ -0,0 +1,109 @@
+"""Time the installed OCR engines on ABox pages and save the winner."""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import Config
+from models.vendor import VendorType
+from processors.ocr_engines import (
+    OCR_ENGINES,
+    available_ocr_engines,
+    pick_ocr_engine,
+    time_ocr_engine,
+)
+from utils.logging_config import setup_logging
+
+# Setup logging
+setup_logging(log_level="WARNING")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Calibrate the OCR engine for this machine"
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=OCR_ENGINES,
+        help="Engines to time (default: all installed)",
+    )
+    parser.add_argument(
+        "--files", type=int, default=3, help="Sample ABox invoices (first N by name)"
+    )
+    parser.add_argument(
+        "--pages", type=int, default=2, help="Pages converted per invoice"
+    )
+    parser.add_argument(
+        "--env", help="Environment to update (default: the current environment)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report the winner without saving it to environments.json",
+    )
+    args = parser.parse_args()
+
+    try:
+        env_name = Config.load_environment(args.env)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error loading environment: {e}")
+        sys.exit(1)
+
+    directory = Config.get_vendor_directory(VendorType.ABOX)
+    samples = sorted(directory.glob("*.pdf"))[: args.files]
+    if not samples:
+        print(f"❌ No ABox invoices found in {directory}")
+        sys.exit(1)
+
+    engines = args.engines or list(available_ocr_engines())
+    if not engines:
+        print("❌ No OCR engines installed")
+        sys.exit(1)
+
+    print(f"Environment: {env_name}")
+    print(f"Samples:     {len(samples)} ABox invoices, up to {args.pages} pages each")
+    print(f"Engines:     {', '.join(engines)}")
+    print()
+
+    timings = []
+    for engine in engines:
+        print(f"Timing {engine}...")
+        timings.append(time_ocr_engine(engine, samples, max_pages=args.pages))
+
+    print()
+    print("=" * 60)
+    print("OCR ENGINE CALIBRATION")
+    print("=" * 60)
+    print(f"{'Engine':12s} {'Pages':>6s} {'s/page':>8s} {'Chars':>8s}")
+    print("-" * 60)
+    for timing in timings:
+        if timing.error:
+            print(f"{timing.engine:12s} failed: {timing.error}")
+            continue
+        print(
+            f"{timing.engine:12s} {timing.pages:6d} "
+            f"{timing.seconds_per_page or 0:8.2f} {timing.chars:8d}"
+        )
+    print()
+
+    winner = pick_ocr_engine(timings)
+    if winner is None:
+        print("❌ No engine converted the samples, keeping the current setting")
+        sys.exit(1)
+
+    print(f"Fastest engine with full text: {winner}")
+    if args.dry_run:
+        return
+
+    Config.update_environment({"ocr_engine": winner}, env_name=env_name)
+    print(f"✅ Saved ocr_engine={winner} to environment '{env_name}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -102,11 +102,9 @@ def scan_invoices(directory: Path, max_invoices: int = None) -> List[Dict]:
 
     for pdf_path in tqdm(pdf_files, desc="Scanning invoices"):
         try:
-            # Convert document
-            doc_key = processor.convert_document(pdf_path)
-
-            # Get markdown for vendor detection
-            markdown = processor.get_document_markdown(doc_key, max_size=3000)
+            # Vendor patterns only need the letterhead, so probe the first page
+            # instead of converting the whole document
+            markdown = processor.probe_first_page(pdf_path)
 
             # Identify vendor
             vendor, confidence = identify_vendor_from_markdown(markdown, pdf_path.name)
@@ -117,7 +115,7 @@ def scan_invoices(directory: Path, max_invoices: int = None) -> List[Dict]:
                 "path": str(pdf_path),
                 "vendor": vendor.value,
                 "confidence": round(confidence, 2),
-                "doc_key": doc_key,
+                "doc_key": str(pdf_path.resolve()),
             }
 
             results.append(result)
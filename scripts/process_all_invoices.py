@@ -11,6 +11,7 @@ from config import Config  # noqa: E402
 from exporters import CSVExporter, SummaryGenerator  # noqa: E402
 from processors.batch_processor import BatchProcessor  # noqa: E402
 from utils.logging_config import setup_logging  # noqa: E402
+from utils.resource_budget import ResourceBudget
 import time  # noqa: E402
 
 # Setup logging
@@ -44,11 +45,28 @@ def main():
     print(f"Output Directory: {combined_run_dir}")
     print()
 
+    # Split the CPU budget between workers and model threads before any
+    # Docling models are loaded
+    budget = ResourceBudget.from_config().apply()
+    print(budget.report())
+    print()
+
     # Initialize batch processor
-    processor = BatchProcessor(num_workers=8, output_dir=Config.OUTPUT_DIR)
+    processor = BatchProcessor(num_workers=budget.workers, output_dir=Config.OUTPUT_DIR)
     # Set the run directory explicitly to prevent creating subdirectories
     processor.run_dir = combined_run_dir
 
+    # Load models up front so the first bill isn't charged for them
+    if Config.WARMUP_MODELS:
+        warmup_start = time.time()
+        timings = processor.warmup()
+        if timings:
+            print(
+                f"Model Warm-up:    {time.time() - warmup_start:.1f}s "
+                f"({len(timings)} pipelines)"
+            )
+            print()
+
     # Start timing
     start_time = time.time()
 
@@ -111,6 +129,32 @@ def main():
         print("⚠️  No files were processed. Check vendor directories.")
         sys.exit(1)
 
+    total_duplicates = sum(r.statistics.duplicates for r in all_results)
+    if total_duplicates:
+        print(f"Duplicates:           {total_duplicates} (byte-identical, converted once)")
+
+    cache_hits = sum(r.statistics.cache_hits for r in all_results)
+    cache_misses = sum(r.statistics.cache_misses for r in all_results)
+    if cache_hits or cache_misses:
+        print(f"Conversion Cache:     {cache_hits} hits / {cache_misses} misses")
+
+    ocr_hits = sum(r.statistics.ocr_cache_hits for r in all_results)
+    ocr_misses = sum(r.statistics.ocr_cache_misses for r in all_results)
+    if ocr_hits or ocr_misses:
+        ocr_saved = sum(r.statistics.ocr_seconds_saved for r in all_results)
+        print(
+            f"OCR Page Cache:       {ocr_hits} hits / {ocr_misses} misses "
+            f"({ocr_saved:.1f}s OCR saved)"
+        )
+
+    source_wait = sum(r.statistics.source_wait_seconds for r in all_results)
+    source_read = sum(r.statistics.source_read_seconds for r in all_results)
+    if source_read:
+        print(
+            f"Source Files:         {source_wait:.1f}s waiting / "
+            f"{source_read:.1f}s reading (read ahead in parallel)"
+        )
+
     print()
 
     # Collect all successful invoices
@@ -0,0 +1,85 @@
+"""Pre-scan the Bills tree into the PDF metadata index and summarize it."""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import Config
+from processors.document_processor import DocumentProcessor
+from processors.metadata_index import MetadataIndex
+from utils.logging_config import setup_logging
+
+# Setup logging
+setup_logging(log_level="WARNING")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Index page counts and text layers of every PDF without Docling"
+    )
+    parser.add_argument(
+        "--directory",
+        type=Path,
+        help="Directory to scan (default: the environment's source directory)",
+    )
+    parser.add_argument("--env", help="Environment to load")
+    args = parser.parse_args()
+
+    try:
+        Config.load_environment(args.env)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error loading environment: {e}")
+        sys.exit(1)
+
+    directory = args.directory or Config.SOURCE_DIR
+    if not directory.exists():
+        print(f"❌ Directory does not exist: {directory}")
+        sys.exit(1)
+
+    index = MetadataIndex(Config.CACHE_DIR / "metadata_index.json")
+    start_time = time.time()
+    scanned = index.scan(directory)
+    elapsed = time.time() - start_time
+
+    root = str(directory.resolve())
+    entries = {
+        path: metadata
+        for path, metadata in index.entries().items()
+        if path.startswith(root)
+    }
+    readable = [m for m in entries.values() if m.error is None]
+    with_text = [m for m in readable if m.has_text_layer(Config.TEXT_LAYER_MIN_CHARS)]
+    producers = Counter(m.producer or "(none)" for m in readable)
+
+    processor = DocumentProcessor(use_conversion_cache=False)
+    processor.metadata_index = index
+    estimates = [processor.estimate_seconds(path) for path in entries]
+    estimated = sum(seconds for seconds in estimates if seconds is not None)
+
+    print("=" * 60)
+    print("PDF METADATA INDEX")
+    print("=" * 60)
+    print(f"Directory:        {directory}")
+    print(f"Files:            {len(entries)} ({scanned} new or changed)")
+    print(f"Scan Time:        {elapsed:.2f}s")
+    print(f"Unreadable:       {len(entries) - len(readable)}")
+    print(f"Pages:            {sum(m.page_count for m in readable)}")
+    print(f"Text Layer:       {len(with_text)}/{len(readable)} files")
+    print(f"Estimated Time:   {estimated / 60:.1f} min to convert everything")
+    print()
+    print("Top Producers:")
+    for producer, count in producers.most_common(5):
+        print(f"  {count:5d}  {producer}")
+    print()
+    print(f"Index saved to {index.path}")
+
+
+if __name__ == "__main__":
+    main()
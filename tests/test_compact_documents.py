@@ -0,0 +1,74 @@
+"""Test reducing converted documents to compact records."""
+
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    ProvenanceItem,
+    Size,
+    TableCell,
+    TableData,
+)
+
+from processors.document_payload import DocumentPayload
+from processors.document_processor import DocumentProcessor
+
+
+def _make_document() -> DoclingDocument:
+    """A two-page invoice with a heading, a total and a line-item table."""
+    document = DoclingDocument(name="invoice")
+    for page_no in (1, 2):
+        document.add_page(page_no=page_no, size=Size(width=612, height=792))
+
+    def prov(page_no: int, top: float) -> ProvenanceItem:
+        return ProvenanceItem(
+            page_no=page_no,
+            bbox=BoundingBox(l=72, t=top, r=300, b=top + 14),
+            charspan=(0, 0),
+        )
+
+    document.add_text(label=DocItemLabel.TITLE, text="INVOICE 1001", prov=prov(1, 40))
+    document.add_text(label=DocItemLabel.TEXT, text="Total 52.50", prov=prov(2, 600))
+    cells = [
+        TableCell(
+            text=text,
+            start_row_offset_idx=row,
+            end_row_offset_idx=row + 1,
+            start_col_offset_idx=col,
+            end_col_offset_idx=col + 1,
+            column_header=row == 0,
+        )
+        for row, values in enumerate([["Item", "Amount"], ["Labels", "40.00"]])
+        for col, text in enumerate(values)
+    ]
+    document.add_table(
+        data=TableData(num_rows=2, num_cols=2, table_cells=cells), prov=prov(1, 200)
+    )
+    return document
+
+
+def test_payload_keeps_text_provenance_in_flat_arrays():
+    """Each text keeps its label, page and bbox by index."""
+    document = _make_document()
+    payload = DocumentPayload.from_document(
+        "invoice.pdf", document, document.export_to_markdown()
+    )
+
+    assert payload.page_count == 2
+    assert payload.texts == ["INVOICE 1001", "Total 52.50"]
+    assert payload.text_labels == ["title", "text"]
+    assert payload.text_pages == [1, 2]
+    assert payload.text_bbox(1) == (72, 600, 300, 614)
+    assert payload.texts_on_page(2) == ["Total 52.50"]
+    assert payload.tables[0].records() == [{"Item": "Labels", "Amount": "40.00"}]
+
+
+def test_compact_cache_entry_serves_extractor_lookups():
+    """Compacted documents still answer markdown, table and search lookups."""
+    processor = DocumentProcessor(use_conversion_cache=False, compact_documents=True)
+    processor._cache_document("invoice.pdf", _make_document())
+
+    assert isinstance(processor._get_document("invoice.pdf"), DocumentPayload)
+    assert "INVOICE 1001" in processor.get_document_markdown("invoice.pdf")
+    assert processor.get_tables("invoice.pdf")[0].headers == ["Item", "Amount"]
+    assert "Total 52.50" in processor.search_text("invoice.pdf", "total")
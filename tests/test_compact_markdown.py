@@ -0,0 +1,270 @@
+"""Test the compact markdown rendering used for extraction."""
+
+import importlib
+
+import pytest
+from docling_core.types.doc import DocItemLabel, DoclingDocument, TableCell, TableData
+
+from processors.compact_markdown import compact_markdown
+
+# Docling-style markdown with every cell padded to its column's width
+PADDED_REFLEX = """\
+## REFLEX MEDICAL CORP
+
+| Date       |   Invoice # |
+|------------|-------------|
+| 10/22/2024 |       62935 |
+
+|     | P.O. No.   | Terms    | Due Date   | Rep   |
+|-----|------------|----------|------------|-------|
+|     | RF45533    | Net 60   | 12/21/24   |       |
+
+|     | Item           | Description                          | Qty      | Rate     | Amount     |
+|-----|----------------|--------------------------------------|----------|----------|------------|
+|     | STY001-BM9MM   | STY001-BM9MM 9MM Cap    White        | 61,525   | 0.045    | 2,768.63   |
+|     | STY001-SS-06   | STY001-SS-06 Shrink Sleeve           | 1,257    | 1.22     | 1,533.54   |
+
+| Total        | $4,302.17   |
+|--------------|-------------|
+| Balance Due  | $4,302.17   |
+"""
+
+
+def test_cell_padding_is_trimmed_and_structure_kept():
+    """Cells lose their padding; empty cells and separators survive."""
+    compact = compact_markdown(PADDED_REFLEX)
+    lines = compact.split("\n")
+
+    assert len(lines) == len(PADDED_REFLEX.split("\n"))
+    assert "| 10/22/2024 | 62935 |" in lines
+    assert "|  | RF45533 | Net 60 | 12/21/24 |  |" in lines
+    assert "|---|---|---|---|---|" in lines
+    assert (
+        "|  | STY001-BM9MM | STY001-BM9MM 9MM Cap    White | 61,525 | 0.045 | 2,768.63 |"
+        in lines
+    )
+    assert len(compact) < len(PADDED_REFLEX) * 0.7
+
+
+def test_aligned_separators_and_escaped_pipes():
+    """Alignment colons count as separators; escaped pipes are cell text."""
+    compact = compact_markdown("| a \\| b   | c  |\n|:----|---:|\n")
+
+    assert compact == "| a \\| b | c |\n|---|---|\n"
+
+
+def test_text_is_kept():
+    """Only padding is trimmed; text, spacing inside it and line breaks stay."""
+    markdown = "Invoice   No.   1001   \n\n\n  - Total:    $52.50  "
+
+    assert (
+        compact_markdown(markdown) == "Invoice   No.   1001\n\n\n  - Total:    $52.50"
+    )
+
+
+def _render(*blocks) -> str:
+    """Export text and tables (lists of rows) through Docling's markdown export."""
+    document = DoclingDocument(name="invoice")
+    for block in blocks:
+        if isinstance(block, str):
+            document.add_text(label=DocItemLabel.TEXT, text=block)
+            continue
+        cells = [
+            TableCell(
+                text=text,
+                start_row_offset_idx=row,
+                end_row_offset_idx=row + 1,
+                start_col_offset_idx=col,
+                end_col_offset_idx=col + 1,
+                column_header=row == 0,
+            )
+            for row, values in enumerate(block)
+            for col, text in enumerate(values)
+        ]
+        document.add_table(
+            data=TableData(
+                num_rows=len(block), num_cols=len(block[0]), table_cells=cells
+            )
+        )
+    return document.export_to_markdown()
+
+
+# One invoice per extractor that reads markdown tables, laid out the way each
+# parser expects and padded by Docling's own renderer
+VENDOR_MARKDOWN = {
+    "reflex_medical.ReflexMedicalExtractor": PADDED_REFLEX,
+    "wolverine_printing.WolverinePrintingExtractor": _render(
+        [
+            [
+                "Quantity Ordered",
+                "Quantity Shipped",
+                "Order Number or Job",
+                "Description",
+                "Unit Price",
+                "Unit of Measure",
+                "Amount",
+            ],
+            [
+                "1,500",
+                "1,500",
+                "110201",
+                "Labels 4x6 Gloss",
+                "0.1200",
+                "Each",
+                "180.00",
+            ],
+            ["500", "500", "110202", "Labels 2x3 Matte", "0.2000", "Each", "100.00"],
+            ["", "", "", "UPS to Grand Rapids", "", "", "21.56"],
+            ["", "", "", "", "Sales:", "", "280.00"],
+            ["", "", "", "", "Total:", "", "301.56"],
+        ],
+        "Invoice Number: 110458",
+        "Invoice Date: 08/01/24",
+    ),
+    "sunset_press.SunsetPressExtractor": _render(
+        [["Date", "Invoice #"], ["10/15/2024", "4417"]],
+        [["P.O. Number", "Terms", "Ship Date"], ["PO-8812", "Net 30", "10/14/2024"]],
+        [
+            ["Quantity", "Item Code", "Description", "Price Each", "Amount"],
+            [
+                "2,700 1",
+                "1002-Package 1002-Package",
+                "Shipping boxes printed",
+                "1.28 87.00",
+                "3,456.00 87.00",
+            ],
+        ],
+        [
+            ["Subtotal", "$3,543.00"],
+            ["Sales Tax (0.0%)", "$0.00"],
+            ["Total", "$3,543.00"],
+            ["Balance Due", "$3,543.00"],
+        ],
+    ),
+    "pride_printing.PridePrintingExtractor": _render(
+        "INVOICE #",
+        "20871",
+        "DATE",
+        "09/03/2024",
+        "P.O. NUMBER",
+        "5521",
+        [
+            ["PRODUCT", "DESCRIPTION", "", "QTY", "RATE", "AMOUNT"],
+            ["Labels", "Roll labels 3x5", "", "5000", "0.05", "250.00"],
+            ["Freight", "UPS ground", "", "1", "18.40", "18.40"],
+            ["", "SUBTOTAL", "", "", "", "268.40"],
+            ["", "TAX", "", "", "", "0.00"],
+            ["", "TOTAL", "", "", "", "268.40"],
+        ],
+        "BALANCEDUE $268.40",
+    ),
+    "omico.OmicoExtractor": _render(
+        "Invoice Number: 330187",
+        "Invoice Date: 07/22/2024",
+        [["Customer PO", "Terms"], ["4410", "Net 30"]],
+        [
+            ["Qty", "Part Number", "Description", "Unit Price", "Amount"],
+            ["1,200", "OM2231", "Drink pouch 12oz", "0.4500", "540.00"],
+            ["800", "OM2232", "Drink pouch 16oz", "0.5000", "400.00"],
+        ],
+        [
+            ["Subtotal", "", "940.00"],
+            ["Sales Tax", "", "0.00"],
+            ["TOTAL", "USD", "940.00"],
+        ],
+    ),
+    "stolzle_lausitz.StolzleLausitzExtractor": _render(
+        "Invoice No: #22-2621",
+        "Date created: 12-09-2024",
+        [
+            ["QTY", "NAME", "DATE", "DISCOUNT", "PRICE"],
+            [
+                "60 x",
+                "Revolution Tumbler 16 oz - Set of six. SKU: 3580016-6",
+                "12-09-2024",
+                "1432.80 USD",
+                "23.88 USD",
+            ],
+            ["Shipping Freight", "", "", "320.00 USD", ""],
+            ["Total Tax", "", "", "0.00 USD", ""],
+            ["NET", "", "", "1432.80 USD", ""],
+            ["TOTAL DUE", "", "", "1752.80 USD", ""],
+        ],
+    ),
+    "abox.ABoxExtractor": _render(
+        [["Number", "Date"], ["201038", "06/20/2025"]],
+        [
+            [
+                "Line #",
+                "Order No.",
+                "Shipper #",
+                "PO/Rel",
+                "Customer Part #",
+                "Count",
+                "Price",
+                "UOM",
+                "Amount",
+            ],
+            [
+                "1",
+                "1235060",
+                "60995",
+                "1039",
+                "",
+                "5,250",
+                "$1394.72",
+                "1000",
+                "$7322.28",
+            ],
+            [
+                "2",
+                "1235061",
+                "60996",
+                "1039",
+                "Tray insert",
+                "400",
+                "$1.50",
+                "",
+                "$600.00",
+            ],
+        ],
+        "Total",
+        "$7,922.28",
+    ),
+    "yes_solutions.YesSolutionsExtractor": _render(
+        "LOAD #: 25716",
+        [["INVOICE #", "25716"], ["Invoice Date:", "03/11/2024"], ["Terms:", "Net 15"]],
+        "Description: Freeze Packs 42660",
+        "Line Haul $672.00",
+        "Total Rate: $672.00 USD",
+    ),
+}
+
+
+class _NoTablesProcessor:
+    """Has no table cells, so extractors read line items from the markdown."""
+
+    def get_tables(self, doc_key):
+        return []
+
+
+@pytest.mark.parametrize("extractor_path", sorted(VENDOR_MARKDOWN))
+def test_extraction_is_identical_on_compact_markdown(extractor_path):
+    """Extractor regexes read the compact rendering like the padded one."""
+    # Imported here: extractors import processors, which import them back
+    module_name, class_name = extractor_path.rsplit(".", 1)
+    extractor_class = getattr(
+        importlib.import_module(f"extractors.{module_name}"), class_name
+    )
+    extractor = extractor_class(_NoTablesProcessor())
+    markdown = VENDOR_MARKDOWN[extractor_path]
+
+    padded = extractor.extract("invoice.pdf", markdown, "invoice.pdf")
+    compact = extractor.extract(
+        "invoice.pdf", compact_markdown(markdown), "invoice.pdf"
+    )
+
+    assert compact_markdown(markdown) != markdown
+    assert padded.invoice_number
+    assert padded.line_items
+    assert compact.model_dump() == padded.model_dump()
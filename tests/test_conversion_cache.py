@@ -0,0 +1,156 @@
+"""Test the persistent conversion cache."""
+
+import gzip
+from typing import ClassVar
+
+from pydantic import BaseModel, SerializeAsAny
+
+from processors.conversion_cache import (
+    ConversionCache,
+    hash_file,
+    match_fingerprints,
+    partial_fingerprint,
+    pipeline_fingerprint,
+)
+
+
+class FakePipelineOptions(BaseModel):
+    """Stand-in for Docling pipeline options."""
+
+    do_ocr: bool = True
+    images_scale: float = 1.0
+
+
+class FakeOcrOptions(BaseModel):
+    """Stand-in for a Docling OCR engine's options."""
+
+    kind: ClassVar[str] = "easyocr"
+    lang: list[str] = ["en"]
+
+
+class FakeTesseractOptions(FakeOcrOptions):
+    """Stand-in for a second OCR engine with its own settings."""
+
+    kind: ClassVar[str] = "tesseract"
+    path: str = "tesseract"
+
+
+class FakeCachedOcrOptions(FakeOcrOptions):
+    """Stand-in for the OCR page cache wrapper."""
+
+    kind: ClassVar[str] = "cached"
+    inner: SerializeAsAny[FakeOcrOptions]
+
+
+class FakeOcrPipelineOptions(BaseModel):
+    """Stand-in for Docling pipeline options with OCR settings."""
+
+    ocr_options: FakeOcrOptions = FakeOcrOptions()
+
+
+def test_hash_file_is_content_addressed(tmp_path):
+    """Files with identical bytes hash the same regardless of name."""
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    other = tmp_path / "c.pdf"
+    first.write_bytes(b"%PDF-1.4 same")
+    second.write_bytes(b"%PDF-1.4 same")
+    other.write_bytes(b"%PDF-1.4 different")
+
+    assert hash_file(first) == hash_file(second)
+    assert hash_file(first) != hash_file(other)
+
+
+def test_fingerprint_changes_with_options():
+    """Changing pipeline options produces a different fingerprint."""
+    base = pipeline_fingerprint(FakePipelineOptions())
+
+    assert base == pipeline_fingerprint(FakePipelineOptions())
+    assert base != pipeline_fingerprint(FakePipelineOptions(do_ocr=False))
+
+
+def test_fingerprint_distinguishes_ocr_engines():
+    """OCR engines are fingerprinted by concrete class, not the declared type."""
+    easyocr = pipeline_fingerprint(FakeOcrPipelineOptions())
+    tesseract = pipeline_fingerprint(
+        FakeOcrPipelineOptions(ocr_options=FakeTesseractOptions())
+    )
+
+    assert easyocr != tesseract
+
+
+def test_fingerprint_ignores_ocr_page_cache_wrapper():
+    """Wrapping the OCR engine with the page cache keeps the fingerprint."""
+    plain = pipeline_fingerprint(FakeOcrPipelineOptions())
+    wrapped = pipeline_fingerprint(
+        FakeOcrPipelineOptions(ocr_options=FakeCachedOcrOptions(inner=FakeOcrOptions()))
+    )
+
+    assert plain == wrapped
+
+
+def test_put_get_roundtrip_and_stats(tmp_path):
+    """Stored entries are returned on later lookups and counted as hits."""
+    cache = ConversionCache(tmp_path)
+    key = cache.make_key("abc123", "fp")
+
+    assert cache.get(key) is None
+    cache.put(key, {"name": "invoice", "texts": ["Total $1.00"]})
+
+    # A fresh cache instance sees the persisted entry
+    reopened = ConversionCache(tmp_path)
+    assert reopened.get(key) == {"name": "invoice", "texts": ["Total $1.00"]}
+
+    assert cache.get_stats() == {"hits": 0, "misses": 1}
+    assert reopened.get_stats() == {"hits": 1, "misses": 0}
+
+
+def test_corrupt_entry_is_treated_as_miss(tmp_path):
+    """Unreadable entries are discarded instead of raising."""
+    cache = ConversionCache(tmp_path)
+    key = cache.make_key("deadbeef", "fp")
+    entry_path = cache._entry_path(key)
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(entry_path, "wt") as f:
+        f.write("{not json")
+
+    assert cache.get(key) is None
+    assert not entry_path.exists()
+
+
+def test_bundle_moves_conversions_between_caches(tmp_path):
+    """Exported entries of the chosen files import into another cache."""
+    wanted, other = "a" * 64, "b" * 64
+    source = ConversionCache(tmp_path / "work_mac")
+    for content_hash in (wanted, other):
+        for fingerprint in ("0" * 16, "1" * 16):
+            source.put(
+                source.make_key(content_hash, fingerprint), {"name": content_hash}
+            )
+
+    bundle = tmp_path / "bundle.tar"
+    assert source.export_bundle(bundle, [wanted]) == 2
+
+    target = ConversionCache(tmp_path / "home_mac")
+    added, manifest = target.import_bundle(bundle)
+
+    assert added == 2
+    assert manifest["keys"] == source.keys_for(wanted)
+    assert target.get(target.make_key(wanted, "1" * 16)) == {"name": wanted}
+    assert target.keys_for(other) == []
+
+    # Importing again keeps existing entries
+    assert target.import_bundle(bundle)[0] == 0
+
+
+def test_partial_fingerprints_match_their_pipeline():
+    """Leading-page conversions in a bundle are traced to their pipeline."""
+    fingerprints = {"fast/ocr": "0123456789abcdef", "fast/text": "fedcba9876543210"}
+
+    local = match_fingerprints(fingerprints, max_pages=40)
+
+    assert local["0123456789abcdef"] == ["fast/ocr"]
+    assert local[partial_fingerprint("fedcba9876543210", 3)] == [
+        "fast/text (leading pages)"
+    ]
+    assert partial_fingerprint("0123456789abcdef", 41) not in local
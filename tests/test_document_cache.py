@@ -0,0 +1,66 @@
+"""Test the memory-bounded LRU document cache."""
+
+from processors.document_cache import DocumentCache
+
+
+def test_evicts_least_recently_used():
+    """Entries beyond the byte budget are evicted oldest-first."""
+    cache = DocumentCache(max_bytes=100)
+    cache.put("a", "doc-a", 40)
+    cache.put("b", "doc-b", 40)
+
+    # Touch "a" so "b" becomes the least recently used entry
+    assert cache.get("a") == "doc-a"
+    cache.put("c", "doc-c", 40)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.size_bytes == 80
+
+
+def test_stats_track_hits_misses_and_evictions():
+    """Counters reflect lookups and evictions."""
+    cache = DocumentCache(max_bytes=50)
+    cache.put("a", "doc-a", 30)
+    cache.get("a")
+    cache.get("missing")
+    cache.put("b", "doc-b", 30)
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 1
+    assert stats["size_bytes"] == 30
+
+
+def test_oversized_entry_is_kept():
+    """A single entry larger than the budget is still cached."""
+    cache = DocumentCache(max_bytes=10)
+    cache.put("big", "doc-big", 50)
+
+    assert cache.get("big") == "doc-big"
+    assert len(cache) == 1
+
+
+def test_replacing_entry_updates_size():
+    """Re-inserting a key replaces its size rather than adding to it."""
+    cache = DocumentCache(max_bytes=100)
+    cache.put("a", "v1", 30)
+    cache.put("a", "v2", 50)
+
+    assert cache.size_bytes == 50
+    assert cache.get("a") == "v2"
+
+
+def test_update_size_evicts_when_memo_grows():
+    """Growing an entry (e.g. memoized markdown) can push older entries out."""
+    cache = DocumentCache(max_bytes=100)
+    cache.put("a", "doc-a", 40)
+    cache.put("b", "doc-b", 40)
+    cache.update_size("b", 70)
+
+    assert "a" not in cache
+    assert "b" in cache
+    assert cache.size_bytes == 70
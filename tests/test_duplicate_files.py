@@ -0,0 +1,187 @@
+"""Test that byte-identical PDFs are converted once and linked as duplicates."""
+
+from decimal import Decimal
+from pathlib import Path
+
+from config import Config
+from models.batch_result import InvoiceResult, ProcessingStatus
+from models.invoice import Invoice
+from models.vendor import VendorType
+from processors.batch_processor import BatchProcessor
+from processors.ingest import read_source
+
+
+class _FakeDocumentProcessor:
+    """Just enough of DocumentProcessor for BatchProcessor bookkeeping."""
+
+    conversion_cache = None
+    metadata_index = None
+
+    def __init__(self):
+        self.loaded = []
+
+    def load_source(self, pdf_path):
+        self.loaded.append(pdf_path)
+        return read_source(pdf_path)
+
+    def take_source(self, pdf_path):
+        return None
+
+    def release_sources(self):
+        pass
+
+    def estimate_seconds(self, pdf_path):
+        return None
+
+    def get_source_read_seconds(self):
+        return 0.0
+
+    def get_cache_stats(self):
+        return {
+            "entries": 0,
+            "size_bytes": 0,
+            "max_bytes": 1,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    def get_ocr_cache_stats(self):
+        return {"hits": 0, "misses": 0, "ocr_seconds": 0.0, "saved_seconds": 0.0}
+
+
+def _make_processor(tmp_path, monkeypatch, processed: list):
+    """BatchProcessor whose per-file processing records what it was given."""
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    processor = BatchProcessor(
+        document_processor=_FakeDocumentProcessor(), output_dir=tmp_path / "out"
+    )
+
+    def fake_iter_results(pdf_files):
+        for pdf_path in pdf_files:
+            processed.append(pdf_path)
+            yield InvoiceResult(
+                filename=pdf_path.name,
+                file_path=str(pdf_path),
+                status=ProcessingStatus.SUCCESS,
+                vendor_type=VendorType.REFLEX_MEDICAL,
+                invoice=Invoice(
+                    vendor=VendorType.REFLEX_MEDICAL,
+                    invoice_number=pdf_path.stem,
+                    total=Decimal("10.00"),
+                    source_file=pdf_path.name,
+                ),
+            )
+
+    monkeypatch.setattr(processor, "_iter_results", fake_iter_results)
+    return processor
+
+
+def test_identical_files_are_processed_once(tmp_path, monkeypatch):
+    """A copy reuses the original's result and both invoices are linked."""
+    bills = tmp_path / "bills"
+    bills.mkdir()
+    (bills / "a.pdf").write_bytes(b"%PDF-1.4 invoice 1001")
+    (bills / "b.pdf").write_bytes(b"%PDF-1.4 invoice 1001")
+    (bills / "c.pdf").write_bytes(b"%PDF-1.4 invoice 1002")
+
+    processed = []
+    processor = _make_processor(tmp_path, monkeypatch, processed)
+    result = processor.process_directory(bills)
+
+    assert [path.name for path in processed] == ["a.pdf", "c.pdf"]
+    assert result.statistics.total_files == 3
+    assert result.statistics.duplicates == 1
+
+    by_name = {r.filename: r for r in result.results}
+    assert by_name["a.pdf"].invoice.duplicate_files == [str(bills / "b.pdf")]
+    copy = by_name["b.pdf"]
+    assert copy.duplicate_of == str(bills / "a.pdf")
+    assert copy.invoice.is_duplicate
+    assert copy.invoice.source_file == "b.pdf"
+    assert copy.invoice.duplicate_of == str(bills / "a.pdf")
+
+
+def test_copies_are_matched_across_directories(tmp_path, monkeypatch):
+    """A copy in a second vendor directory reuses the earlier conversion."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / "a.pdf").write_bytes(b"%PDF-1.4 invoice 1001")
+    (second / "copy.pdf").write_bytes(b"%PDF-1.4 invoice 1001")
+
+    processed = []
+    processor = _make_processor(tmp_path, monkeypatch, processed)
+    first_result = processor.process_directory(first)
+    second_result = processor.process_directory(second)
+
+    assert [path.name for path in processed] == ["a.pdf"]
+    assert second_result.results[0].duplicate_of == str(first / "a.pdf")
+    assert first_result.results[0].invoice.duplicate_files == [
+        str(second / "copy.pdf")
+    ]
+
+
+def test_quarantined_files_are_not_read(tmp_path, monkeypatch):
+    """Files quarantined by an earlier run are skipped before the read-ahead."""
+    bills = tmp_path / "bills"
+    bills.mkdir()
+    (bills / "a.pdf").write_bytes(b"%PDF-1.4 invoice 1001")
+    (bills / "huge.pdf").write_bytes(b"%PDF-1.4 huge scan")
+
+    processed = []
+    processor = _make_processor(tmp_path, monkeypatch, processed)
+    processor.quarantine.add(bills / "huge.pdf", "wall_time", "Conversion too slow")
+    result = processor.process_directory(bills)
+
+    assert [path.name for path in processed] == ["a.pdf"]
+    assert [path.name for path in processor.document_processor.loaded] == ["a.pdf"]
+    statuses = {r.filename: r.status for r in result.results}
+    assert statuses["huge.pdf"] == ProcessingStatus.QUARANTINED
+
+
+def test_files_are_read_as_workers_take_them(tmp_path, monkeypatch):
+    """Reads follow the workers instead of finishing before conversion."""
+    bills = tmp_path / "bills"
+    bills.mkdir()
+    for name in ("a", "b", "c"):
+        (bills / f"{name}.pdf").write_bytes(f"%PDF-1.4 invoice {name}".encode())
+
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(Config, "PREFETCH_WORKERS", 0)
+    events = []
+    document_processor = _FakeDocumentProcessor()
+    load_source = document_processor.load_source
+
+    def recording_load(pdf_path):
+        events.append(f"read {Path(pdf_path).name}")
+        return load_source(pdf_path)
+
+    document_processor.load_source = recording_load
+    processor = BatchProcessor(
+        document_processor=document_processor,
+        num_workers=1,
+        output_dir=tmp_path / "out",
+        backend="thread",
+    )
+
+    def fake_process(pdf_path):
+        events.append(f"convert {pdf_path.name}")
+        return InvoiceResult(
+            filename=pdf_path.name,
+            file_path=str(pdf_path),
+            status=ProcessingStatus.SUCCESS,
+        )
+
+    monkeypatch.setattr(processor, "_process_single_file", fake_process)
+    processor.process_directory(bills)
+
+    assert events == [
+        "read a.pdf",
+        "convert a.pdf",
+        "read b.pdf",
+        "convert b.pdf",
+        "read c.pdf",
+        "convert c.pdf",
+    ]
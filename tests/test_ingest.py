@@ -0,0 +1,52 @@
+"""Test single-read PDF ingestion."""
+
+import pytest
+
+from config import Config
+from processors.conversion_cache import hash_file
+from processors.document_processor import DocumentProcessor
+from processors.ingest import read_source
+from processors.quarantine import ConversionLimitExceeded
+
+
+def test_read_hashes_the_bytes_it_reads(tmp_path):
+    """The content hash matches hash_file, computed from the same read."""
+    pdf = tmp_path / "invoice.pdf"
+    pdf.write_bytes(b"%PDF-1.4 " + b"x" * (3 * 1024 * 1024))
+
+    source = read_source(pdf)
+
+    assert source.data == pdf.read_bytes()
+    assert source.sha256 == hash_file(pdf)
+    assert source.size == pdf.stat().st_size
+    assert source.name == "invoice.pdf"
+    assert source.path == str(pdf.resolve())
+
+
+def test_oversized_file_is_rejected_before_reading(tmp_path):
+    """Files over the size limit raise a quarantinable error."""
+    pdf = tmp_path / "scan.pdf"
+    pdf.write_bytes(b"%PDF-1.4 " + b"x" * (2 * 1024 * 1024))
+
+    with pytest.raises(ConversionLimitExceeded) as exc_info:
+        read_source(pdf, max_size_mb=1)
+
+    assert exc_info.value.limit == "file_size"
+
+
+def test_read_ahead_is_held_until_conversion_takes_it(tmp_path, monkeypatch):
+    """Files read ahead are never dropped in favour of later reads."""
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    processor = DocumentProcessor(use_conversion_cache=False)
+    paths = []
+    for index in range(6):
+        pdf = tmp_path / f"f{index}.pdf"
+        pdf.write_bytes(b"%PDF-1.4 " + bytes([index]) * (300 * 1024))
+        paths.append(pdf)
+        processor.load_source(pdf)
+
+    assert processor.take_source(paths[0]).data == paths[0].read_bytes()
+    assert processor.take_source(paths[0]) is None
+
+    processor.release_sources()
+    assert processor.take_source(paths[5]) is None
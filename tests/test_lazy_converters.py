@@ -0,0 +1,38 @@
+"""Test that converters are built on first use and the warm-up sample."""
+
+import pytest
+
+from processors.document_processor import (
+    WARMUP_TEXT,
+    DocumentProcessor,
+    _make_warmup_pdf,
+)
+
+
+def test_constructor_builds_no_converters():
+    """Creating a processor loads no Docling converters or models."""
+    processor = DocumentProcessor(use_conversion_cache=False)
+
+    assert processor._converters == {}
+    assert processor._probe_converter is None
+
+
+def test_unknown_pipeline_is_rejected():
+    """Pipeline keys are validated when a converter is first requested."""
+    processor = DocumentProcessor(use_conversion_cache=False)
+
+    with pytest.raises(ValueError):
+        processor._get_converter("missing/ocr")
+
+
+def test_warmup_sample_has_a_text_layer(tmp_path):
+    """The synthetic warm-up invoice is a valid one-page PDF with text."""
+    pytest.importorskip("pypdfium2")
+    from processors.text_layer import extract_first_page_text
+
+    sample = tmp_path / "warmup.pdf"
+    sample.write_bytes(_make_warmup_pdf(WARMUP_TEXT))
+
+    text = extract_first_page_text(sample)
+    assert "INVOICE 1001" in text
+    assert "Total 10.00" in " ".join(text.split())
@@ -0,0 +1,118 @@
+"""Test the incremental PDF metadata index and cost-ordered scheduling."""
+
+from pathlib import Path
+
+from config import Config
+from processors import metadata_index
+from processors.batch_processor import BatchProcessor
+from processors.document_processor import (
+    WARMUP_TEXT,
+    DocumentProcessor,
+    _make_warmup_pdf,
+)
+from processors.ingest import read_source
+from processors.metadata_index import MetadataIndex, PdfMetadata
+
+
+def _write_pdf(path: Path, lines: list[str]) -> Path:
+    path.write_bytes(_make_warmup_pdf(lines))
+    return path
+
+
+def test_metadata_is_read_without_docling(tmp_path):
+    """Page count and text-layer presence come from pypdfium2."""
+    pdf_path = _write_pdf(tmp_path / "invoice.pdf", WARMUP_TEXT)
+    index = MetadataIndex(tmp_path / "index.json")
+
+    assert index.update([pdf_path]) == 1
+
+    metadata = index.get(pdf_path)
+    assert metadata.page_count == 1
+    assert metadata.size == pdf_path.stat().st_size
+    assert metadata.has_text_layer(min_chars_per_page=20)
+    assert not metadata.has_text_layer(min_chars_per_page=10_000)
+
+
+def test_update_only_reads_new_or_changed_files(tmp_path):
+    """Unchanged files are skipped, and the index survives a reload."""
+    first = _write_pdf(tmp_path / "a.pdf", WARMUP_TEXT)
+    second = _write_pdf(tmp_path / "b.pdf", WARMUP_TEXT)
+    index = MetadataIndex(tmp_path / "index.json")
+    assert index.update([first, second]) == 2
+
+    reloaded = MetadataIndex(tmp_path / "index.json")
+    assert reloaded.update([first, second]) == 0
+
+    _write_pdf(second, WARMUP_TEXT + ["Freight  5.00"])
+    assert reloaded.get(second) is None  # stale entry is not trusted
+    assert reloaded.update([first, second]) == 1
+    assert reloaded.get(second) is not None
+
+
+def test_read_ahead_bytes_are_indexed_without_reopening(tmp_path, monkeypatch):
+    """Files read for conversion are indexed from the same bytes."""
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    pdf_path = _write_pdf(tmp_path / "invoice.pdf", WARMUP_TEXT)
+    processor = DocumentProcessor(use_conversion_cache=False)
+
+    opened = []
+    monkeypatch.setattr(
+        metadata_index, "read_pdf_metadata", lambda path: opened.append(path)
+    )
+    processor.load_source(pdf_path)
+    processor.metadata_index.save()
+
+    assert opened == []
+    reloaded = MetadataIndex(Config.CACHE_DIR / "metadata_index.json")
+    assert reloaded.get(pdf_path).page_count == 1
+    assert not reloaded.record(read_source(pdf_path))
+
+
+def test_scan_drops_removed_files(tmp_path):
+    """Files deleted from the tree are removed from the index."""
+    bills = tmp_path / "bills"
+    (bills / "Vendor").mkdir(parents=True)
+    kept = _write_pdf(bills / "Vendor" / "a.pdf", WARMUP_TEXT)
+    removed = _write_pdf(bills / "Vendor" / "b.pdf", WARMUP_TEXT)
+    index = MetadataIndex(tmp_path / "index.json")
+    assert index.scan(bills) == 2
+
+    removed.unlink()
+    assert index.scan(bills) == 0
+    assert list(index.entries()) == [str(kept.resolve())]
+
+
+def test_unreadable_pdf_is_recorded_but_not_trusted(tmp_path):
+    """Files pypdfium2 cannot parse are indexed with an error and skipped."""
+    pdf_path = tmp_path / "broken.pdf"
+    pdf_path.write_bytes(b"not a pdf")
+    index = MetadataIndex(tmp_path / "index.json")
+
+    assert index.update([pdf_path]) == 1
+    assert index.entries()[str(pdf_path.resolve())].error is not None
+    assert index.get(pdf_path) is None
+
+
+def test_image_only_page_needs_ocr():
+    """One page without text means the document has no usable text layer."""
+    metadata = PdfMetadata(size=1, mtime=0.0, page_count=3, min_page_chars=0)
+
+    assert not metadata.has_text_layer(min_chars_per_page=20)
+
+
+def test_expensive_files_are_scheduled_first(tmp_path, monkeypatch):
+    """Unknown costs go first, then files by descending estimate."""
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    estimates = {"small.pdf": 2.0, "large.pdf": 40.0, "new.pdf": None}
+
+    class _Estimator:
+        def estimate_seconds(self, pdf_path):
+            return estimates[Path(pdf_path).name]
+
+    processor = BatchProcessor.__new__(BatchProcessor)
+    processor.document_processor = _Estimator()
+    files = [Path(name) for name in ("small.pdf", "large.pdf", "new.pdf")]
+
+    ordered = processor._order_by_cost(files)
+
+    assert [path.name for path in ordered] == ["new.pdf", "large.pdf", "small.pdf"]
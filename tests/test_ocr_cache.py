@@ -0,0 +1,65 @@
+"""Test the OCR page cache's counters and Docling engine registration."""
+
+from pathlib import PurePath
+from types import SimpleNamespace
+
+from docling.datamodel.pipeline_options import OcrAutoOptions
+from docling.models.factories import get_ocr_factory
+
+from processors.ocr_cache import (
+    UNCACHED_DOCUMENT_NAME,
+    CachedOcrModel,
+    CachedOcrOptions,
+    OcrPageCache,
+)
+
+
+def test_hits_report_saved_ocr_time(tmp_path):
+    """Misses record OCR time spent; hits record the time they avoided."""
+    cache = OcrPageCache(tmp_path)
+    key = cache.make_key("page-image-hash", "options-hash")
+
+    assert cache.get(key) is None
+    cache.record_timing(ocr_seconds=2.5)
+    cache.put(key, {"cells": [], "seconds": 2.5})
+
+    cached = cache.get(key)
+    cache.record_timing(saved_seconds=cached["seconds"])
+
+    assert cache.get_stats() == {
+        "hits": 1,
+        "misses": 1,
+        "ocr_seconds": 2.5,
+        "saved_seconds": 2.5,
+    }
+
+
+def test_cached_engine_is_registered(tmp_path):
+    """The pipeline's OCR factory resolves the wrapper to the caching model."""
+    options = CachedOcrOptions.wrap(OcrAutoOptions(lang=["en"]), tmp_path)
+
+    assert options.lang == ["en"]
+    assert "cache_dir" not in options.model_dump()
+    assert (
+        get_ocr_factory(allow_external_plugins=False).classes[CachedOcrOptions]
+        is CachedOcrModel
+    )
+
+
+def test_uncached_document_always_runs_the_engine(tmp_path):
+    """The warm-up sample runs the inner engine and writes no cache entry."""
+    calls = []
+    model = CachedOcrModel.__new__(CachedOcrModel)
+    model.enabled = True
+    model.cache = OcrPageCache(tmp_path)
+    model.inner = lambda conv_res, pages: calls.extend(pages) or pages
+    conv_res = SimpleNamespace(
+        input=SimpleNamespace(file=PurePath(UNCACHED_DOCUMENT_NAME))
+    )
+
+    for _ in range(2):
+        assert list(model(conv_res, ["page"])) == ["page"]
+
+    assert calls == ["page", "page"]
+    assert model.cache.get_stats()["misses"] == 0
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,76 @@
+"""Test OCR engine detection, calibration scoring and saving the winner."""
+
+import json
+
+from config import Config
+from processors import ocr_engines
+from processors.ocr_engines import EngineTiming, available_ocr_engines, pick_ocr_engine
+
+
+def test_fastest_engine_with_full_text_wins():
+    """A faster engine that misses text loses to a slower, thorough one."""
+    timings = [
+        EngineTiming(engine="easyocr", pages=4, seconds=20.0, chars=1000),
+        EngineTiming(engine="rapidocr", pages=4, seconds=8.0, chars=950),
+        EngineTiming(engine="tesseract", pages=4, seconds=4.0, chars=600),
+    ]
+
+    assert pick_ocr_engine(timings) == "rapidocr"
+
+
+def test_failed_engines_are_ignored():
+    """Engines that errored or converted nothing cannot win."""
+    timings = [
+        EngineTiming(engine="easyocr", error="model download failed"),
+        EngineTiming(engine="tesseract", pages=0),
+    ]
+
+    assert pick_ocr_engine(timings) is None
+
+
+def test_detection_uses_packages_and_tesseract_binary(monkeypatch):
+    """Engines are reported in preference order when their package exists."""
+    monkeypatch.setattr(
+        ocr_engines.importlib.util,
+        "find_spec",
+        lambda name: object() if name == "rapidocr_onnxruntime" else None,
+    )
+    monkeypatch.setattr(ocr_engines.shutil, "which", lambda name: "/usr/bin/tesseract")
+    available_ocr_engines.cache_clear()
+    try:
+        assert available_ocr_engines() == ("rapidocr", "tesseract")
+    finally:
+        available_ocr_engines.cache_clear()
+
+
+def test_update_environment_saves_setting(tmp_path, monkeypatch):
+    """The calibrated engine is written to the environment and loaded back."""
+    config_file = tmp_path / "environments.json"
+    config_file.write_text(
+        json.dumps(
+            {
+                "environments": {"laptop": {"source_dir": str(tmp_path)}},
+                "default": "laptop",
+            }
+        )
+    )
+    monkeypatch.setattr(Config, "CURRENT_ENVIRONMENT", None)
+    monkeypatch.setattr(Config, "OCR_ENGINE", "auto")
+    monkeypatch.delenv("INVOICE_ENV", raising=False)
+    monkeypatch.delenv("OCR_ENGINE", raising=False)
+    for name in (
+        "SOURCE_DIR",
+        "OUTPUT_DIR",
+        "MAX_WORKERS",
+        "CPU_BUDGET",
+        "MODEL_THREADS",
+    ):
+        monkeypatch.setattr(Config, name, getattr(Config, name))
+
+    assert (
+        Config.update_environment({"ocr_engine": "rapidocr"}, config_file=config_file)
+        == "laptop"
+    )
+
+    Config.load_environment(config_file=config_file)
+    assert Config.OCR_ENGINE == "rapidocr"
@@ -0,0 +1,138 @@
+"""Test detection and page-level repair of near-empty OCR output."""
+
+import pytest
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    ProvenanceItem,
+    Size,
+)
+
+from config import Config
+from processors import document_processor
+from processors.document_processor import DocumentProcessor
+from processors.ingest import SourceFile
+from processors.ocr_recovery import (
+    OcrFailedError,
+    contiguous_runs,
+    find_empty_pages,
+    replace_pages,
+)
+
+
+def _make_document(page_texts: dict[int, str]) -> DoclingDocument:
+    """Build a document with one text item (or a picture) per page."""
+    document = DoclingDocument(name="invoice")
+    for page_no, text in page_texts.items():
+        document.add_page(page_no=page_no, size=Size(width=612, height=792))
+        prov = ProvenanceItem(
+            page_no=page_no,
+            bbox=BoundingBox(l=0, t=0, r=100, b=20),
+            charspan=(0, len(text)),
+        )
+        if text:
+            document.add_text(label=DocItemLabel.TEXT, text=text, prov=prov)
+        else:
+            document.add_picture(prov=prov)
+    return document
+
+
+def test_contiguous_runs():
+    """Page numbers are grouped into inclusive ranges."""
+    assert contiguous_runs([]) == []
+    assert contiguous_runs([1, 2, 3, 5, 7, 8]) == [(1, 3), (5, 5), (7, 8)]
+
+
+def test_image_only_pages_are_empty():
+    """Pages holding only image placeholders count as empty."""
+    document = _make_document(
+        {1: "Invoice 201038 dated 06/20/2025", 2: "", 3: "Total 1,234.00 USD"}
+    )
+
+    assert find_empty_pages(document, min_chars=10) == [2]
+
+
+def test_replace_pages_keeps_page_numbers():
+    """Recovered pages are spliced in without renumbering any page."""
+    original = _make_document({1: "Page one text", 2: "", 3: "", 4: "Page four text"})
+    retried = _make_document({2: "Recovered page two", 3: ""})
+
+    merged = replace_pages(original, {2: retried})
+
+    assert sorted(merged.pages) == [1, 2, 3, 4]
+    assert merged.name == "invoice"
+    texts = {item.prov[0].page_no: item.text for item in merged.texts}
+    assert texts == {
+        1: "Page one text",
+        2: "Recovered page two",
+        4: "Page four text",
+    }
+    assert find_empty_pages(merged, min_chars=10) == [3]
+
+
+def test_retries_only_use_other_installed_engines(monkeypatch):
+    """A retry with the first pass's own engine would just read the same."""
+    monkeypatch.setattr(Config, "OCR_ENGINE", "easyocr")
+    monkeypatch.setattr(
+        Config,
+        "OCR_RETRY_ATTEMPTS",
+        [
+            {"ocr_engine": "easyocr"},
+            {"ocr_engine": "ocrmac"},
+            {"ocr_engine": "tesseract"},
+        ],
+    )
+    monkeypatch.setattr(
+        document_processor,
+        "available_ocr_engines",
+        lambda: frozenset({"easyocr", "tesseract"}),
+    )
+
+    assert DocumentProcessor._retry_attempts("default") == [
+        (2, {"ocr_engine": "tesseract"})
+    ]
+
+
+def test_cache_hits_reuse_the_stored_empty_page_check(tmp_path, monkeypatch):
+    """The empty-page check is cached with OCR output, not recounted on a hit."""
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(Config, "USE_METADATA_INDEX", False)
+    monkeypatch.setattr(Config, "MAX_PAGES", None)
+    processor = DocumentProcessor(use_conversion_cache=True)
+    monkeypatch.setattr(processor, "_select_pipeline", lambda *args: "default/ocr")
+    monkeypatch.setattr(processor, "_get_fingerprint", lambda pipeline: "0" * 16)
+
+    def skip_retries(source, pipeline, document):
+        return document, find_empty_pages(document, Config.OCR_EMPTY_PAGE_MIN_CHARS)
+
+    monkeypatch.setattr(processor, "_recover_empty_pages", skip_retries)
+    readable = SourceFile(
+        path="/bills/readable.pdf", data=b"%PDF", sha256="1" * 64, mtime=0.0
+    )
+    blank = SourceFile(
+        path="/bills/blank.pdf", data=b"%PDF", sha256="2" * 64, mtime=0.0
+    )
+
+    _, _, cache_key, _ = processor._load_cached(readable)
+    processor._store_converted(
+        readable,
+        "default/ocr",
+        _make_document({1: "INVOICE 1001 Total 52.50", 2: ""}),
+        cache_key,
+    )
+    _, _, cache_key, _ = processor._load_cached(blank)
+    with pytest.raises(OcrFailedError):
+        processor._store_converted(
+            blank, "default/ocr", _make_document({1: "", 2: ""}), cache_key
+        )
+
+    def recount(document, min_chars):
+        raise AssertionError("empty pages recounted on a cache hit")
+
+    monkeypatch.setattr(document_processor, "find_empty_pages", recount)
+
+    _, _, _, entry = processor._load_cached(readable)
+    assert entry is not None
+    with pytest.raises(OcrFailedError):
+        processor._load_cached(blank)
@@ -0,0 +1,89 @@
+"""Test skipping trailing boilerplate pages before conversion."""
+
+from config import Config
+from models.vendor import VendorType
+from processors import document_processor
+from processors.conversion_cache import partial_fingerprint
+from processors.document_processor import DocumentProcessor
+from processors.ingest import SourceFile
+from processors.page_classifier import content_page_count, is_boilerplate_page
+
+BOILERPLATE = Config.DEFAULT_BOILERPLATE_PATTERNS
+DATA = Config.INVOICE_DATA_PATTERNS
+
+INVOICE_PAGE = "INVOICE 1001\nItem Description Qty Rate Amount\nLabels 40 1.00 40.00"
+TERMS_PAGE = "TERMS AND CONDITIONS OF SALE\n1. Payment is due within 30 days."
+REMITTANCE_PAGE = "Remittance Advice - please detach and return with your payment"
+TOTALS_AND_TERMS_PAGE = (
+    "Sales: 1,250.00\nTotal: $1,250.00\nAmount Due $1,250.00\n"
+    "Terms and Conditions\n1. Payment is due within 30 days."
+)
+
+
+def test_boilerplate_needs_a_match_and_no_invoice_data():
+    """Terms pages are skipped, but not when they also carry invoice data."""
+    assert is_boilerplate_page(TERMS_PAGE, BOILERPLATE, DATA)
+    assert is_boilerplate_page(REMITTANCE_PAGE, BOILERPLATE, DATA)
+    assert not is_boilerplate_page(INVOICE_PAGE, BOILERPLATE, DATA)
+    assert not is_boilerplate_page(
+        INVOICE_PAGE + "\nSubject to our terms and conditions", BOILERPLATE, DATA
+    )
+
+
+def test_trailing_page_with_totals_is_kept():
+    """Terms text printed under the totals doesn't make the page skippable."""
+    assert not is_boilerplate_page(TOTALS_AND_TERMS_PAGE, BOILERPLATE, DATA)
+    assert not is_boilerplate_page("Invoice # 1001\n" + TERMS_PAGE, BOILERPLATE, DATA)
+    assert (
+        content_page_count([INVOICE_PAGE, TOTALS_AND_TERMS_PAGE], BOILERPLATE, DATA)
+        == 2
+    )
+
+
+def test_pages_without_text_layer_are_kept():
+    """Scanned pages can't be classified from their text, so they're kept."""
+    assert not is_boilerplate_page("Terms & conditions", BOILERPLATE, DATA)
+    assert content_page_count([INVOICE_PAGE, ""], BOILERPLATE, DATA) == 2
+
+
+def test_only_trailing_boilerplate_is_dropped():
+    """Pages stay 1..N: boilerplate between invoice pages is converted."""
+    pages = [INVOICE_PAGE, TERMS_PAGE, INVOICE_PAGE, TERMS_PAGE, REMITTANCE_PAGE]
+
+    assert content_page_count(pages, BOILERPLATE, DATA) == 3
+    assert content_page_count([TERMS_PAGE, TERMS_PAGE], BOILERPLATE, DATA) == 1
+    assert content_page_count(pages, [], DATA) == 5
+
+
+def test_processor_converts_leading_content_pages(monkeypatch):
+    """Selected pages are converted as one range and cached apart."""
+    source = SourceFile(
+        path="/bills/Unknown/invoice.pdf", data=b"%PDF", sha256="0" * 64, mtime=0.0
+    )
+    monkeypatch.setattr(
+        document_processor,
+        "extract_page_texts",
+        lambda data: [INVOICE_PAGE, INVOICE_PAGE, TERMS_PAGE],
+    )
+    monkeypatch.setattr(Config, "PAGE_SPLIT_MIN_PAGES", None)
+
+    # Skipping is opt-in per vendor
+    assert DocumentProcessor._select_pages(source) is None
+    monkeypatch.setattr(
+        Config, "VENDOR_BOILERPLATE_PATTERNS", {VendorType.UNKNOWN: BOILERPLATE}
+    )
+    assert DocumentProcessor._select_pages(source) == 2
+    assert DocumentProcessor._page_ranges(source, 2) == [(1, 2)]
+    assert DocumentProcessor._page_ranges(source) == [None]
+
+    monkeypatch.setattr(Config, "SKIP_BOILERPLATE_PAGES", False)
+    assert DocumentProcessor._select_pages(source) is None
+
+
+def test_partial_conversions_have_their_own_fingerprint():
+    """A conversion of pages 1..N never matches the whole-document entry."""
+    fingerprint = "0123456789abcdef"
+
+    assert partial_fingerprint(fingerprint, 2) != fingerprint
+    assert partial_fingerprint(fingerprint, 2) != partial_fingerprint(fingerprint, 3)
+    assert len(partial_fingerprint(fingerprint, 2)) == len(fingerprint)
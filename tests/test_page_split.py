@@ -0,0 +1,88 @@
+"""Test splitting long PDFs into page ranges and merging the results."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from docling.datamodel.base_models import ConversionStatus
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    ProvenanceItem,
+    Size,
+)
+
+from config import Config
+from processors import document_processor
+from processors.document_processor import DocumentProcessor
+from processors.ingest import SourceFile
+from processors.page_split import merge_page_ranges, split_page_ranges
+from processors.quarantine import ConversionLimitExceeded
+
+
+def _convert_range(start: int, end: int) -> DoclingDocument:
+    """Stand-in for a page-range conversion (keeps original page numbers)."""
+    document = DoclingDocument(name="statement")
+    for page_no in range(start, end + 1):
+        document.add_page(page_no=page_no, size=Size(width=612, height=792))
+        document.add_text(
+            label=DocItemLabel.TEXT,
+            text=f"Page {page_no}",
+            prov=ProvenanceItem(
+                page_no=page_no,
+                bbox=BoundingBox(l=0, t=0, r=100, b=20),
+                charspan=(0, 6),
+            ),
+        )
+    return document
+
+
+def test_split_page_ranges():
+    """Ranges cover every page once, the last one possibly shorter."""
+    assert split_page_ranges(10, 4) == [(1, 4), (5, 8), (9, 10)]
+    assert split_page_ranges(4, 4) == [(1, 4)]
+
+
+def test_merged_ranges_keep_page_numbers():
+    """Merging range conversions matches a whole-file conversion."""
+    merged = merge_page_ranges(
+        [_convert_range(start, end) for start, end in split_page_ranges(10, 4)]
+    )
+
+    assert sorted(merged.pages) == list(range(1, 11))
+    assert merged.name == "statement"
+    assert [item.prov[0].page_no for item in merged.texts] == list(range(1, 11))
+    assert [item.text for item in merged.texts][-1] == "Page 10"
+
+
+def test_page_ranges_share_one_deadline(monkeypatch):
+    """Ranges not started by the document's deadline are never converted."""
+    calls = []
+
+    class SlowConverter:
+        def convert(self, stream, page_range=None):
+            calls.append(page_range)
+            time.sleep(0.2)
+            return SimpleNamespace(
+                status=ConversionStatus.SUCCESS,
+                errors=[],
+                document=_convert_range(*page_range),
+            )
+
+    monkeypatch.setattr(Config, "MAX_CONVERSION_SECONDS", 0.1)
+    monkeypatch.setattr(Config, "PAGE_SPLIT_MIN_PAGES", 8)
+    monkeypatch.setattr(Config, "PAGE_SPLIT_CHUNK_PAGES", 4)
+    monkeypatch.setattr(Config, "PAGE_SPLIT_WORKERS", 2)
+    monkeypatch.setattr(document_processor, "count_pages", lambda data: 16)
+    processor = DocumentProcessor(use_conversion_cache=False)
+    monkeypatch.setattr(processor, "_get_converter", lambda pipeline: SlowConverter())
+    source = SourceFile(
+        path="/bills/statement.pdf", data=b"%PDF", sha256="0" * 64, mtime=0.0
+    )
+
+    with pytest.raises(ConversionLimitExceeded) as exc_info:
+        processor._convert_source(source, "fast/text")
+
+    assert exc_info.value.limit == "wall_time"
+    assert sorted(calls) == [(1, 4), (5, 8)]
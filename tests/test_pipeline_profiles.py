@@ -0,0 +1,23 @@
+"""Test per-vendor Docling pipeline profile configuration."""
+
+from config import Config
+from models.vendor import VendorType
+
+
+def test_every_vendor_maps_to_a_defined_profile():
+    """Each VendorType resolves to a profile that exists in PIPELINE_PROFILES."""
+    for vendor in VendorType:
+        assert Config.get_pipeline_profile(vendor) in Config.PIPELINE_PROFILES
+
+
+def test_simple_vendors_skip_accurate_table_model():
+    """Trivially simple layouts use the fast TableFormer model."""
+    for vendor in (VendorType.AMANDA_ANDREWS, VendorType.STOLZLE_LAUSITZ):
+        profile = Config.PIPELINE_PROFILES[Config.get_pipeline_profile(vendor)]
+        assert profile["table_mode"] == "fast"
+
+
+def test_scanned_vendor_always_runs_ocr():
+    """Image-only ABox scans never skip OCR."""
+    profile = Config.PIPELINE_PROFILES[Config.get_pipeline_profile(VendorType.ABOX)]
+    assert profile["ocr"] == "always"
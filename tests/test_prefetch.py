@@ -0,0 +1,67 @@
+"""Test read-ahead of source files."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from processors.prefetch import Prefetcher
+
+
+def test_files_are_yielded_in_order_with_errors():
+    """Results come back in consumption order, with load errors attached."""
+
+    def load(path: Path) -> str:
+        if path.name == "missing.pdf":
+            raise FileNotFoundError(path)
+        return path.stem
+
+    paths = [Path("a.pdf"), Path("missing.pdf"), Path("c.pdf")]
+    results = list(Prefetcher(load, window=2, workers=2).iter(paths))
+
+    assert [(path.name, value) for path, value, _ in results] == [
+        ("a.pdf", "a"),
+        ("missing.pdf", None),
+        ("c.pdf", "c"),
+    ]
+    assert isinstance(results[1][2], FileNotFoundError)
+
+
+def test_slow_reads_overlap():
+    """Reads in the window run in parallel, so waiting is less than reading."""
+
+    def load(path: Path) -> str:
+        time.sleep(0.05)
+        return path.stem
+
+    prefetcher = Prefetcher(load, window=4, workers=4)
+    list(prefetcher.iter([Path(f"{i}.pdf") for i in range(8)]))
+
+    assert prefetcher.load_seconds == pytest.approx(0.4, abs=0.1)
+    assert prefetcher.wait_seconds < prefetcher.load_seconds / 2
+
+
+def test_read_ahead_is_bounded_by_window():
+    """No more than window files are loaded ahead of the consumer."""
+    lock = threading.Lock()
+    loaded = []
+
+    def load(path: Path) -> str:
+        with lock:
+            loaded.append(path)
+        return path.stem
+
+    paths = [Path(f"{i}.pdf") for i in range(10)]
+    for consumed, _ in enumerate(Prefetcher(load, window=3, workers=2).iter(paths)):
+        time.sleep(0.01)
+        with lock:
+            assert len(loaded) <= consumed + 1 + 3
+
+
+def test_window_zero_loads_inline():
+    """Without read-ahead every read is time spent waiting."""
+    prefetcher = Prefetcher(lambda path: path.stem, window=0, workers=4)
+
+    assert [value for _, value, _ in prefetcher.iter([Path("a.pdf")])] == ["a"]
+    assert prefetcher.wait_seconds >= prefetcher.load_seconds
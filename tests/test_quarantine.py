@@ -0,0 +1,54 @@
+"""Test the persistent quarantine list for files exceeding conversion limits."""
+
+import os
+import pickle
+
+from processors.quarantine import ConversionLimitExceeded, QuarantineList
+
+
+def test_quarantined_file_persists_across_instances(tmp_path):
+    """A quarantined file is still quarantined when the list is reloaded."""
+    pdf_path = tmp_path / "statement.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 big scan")
+    list_path = tmp_path / "quarantine.json"
+
+    QuarantineList(list_path).add(pdf_path, "page_count", "Page count 60 exceeds 40")
+
+    entry = QuarantineList(list_path).get(pdf_path)
+    assert entry is not None
+    assert entry["limit"] == "page_count"
+    assert entry["detail"] == "Page count 60 exceeds 40"
+
+
+def test_changed_file_is_released(tmp_path):
+    """Changing a quarantined file releases it from quarantine."""
+    pdf_path = tmp_path / "statement.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 big scan")
+    quarantine = QuarantineList(tmp_path / "quarantine.json")
+    quarantine.add(pdf_path, "wall_time", "Conversion exceeded limit of 300s")
+
+    pdf_path.write_bytes(b"%PDF-1.4 replaced with a smaller file")
+    stat = pdf_path.stat()
+    os.utime(pdf_path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert quarantine.get(pdf_path) is None
+    assert len(quarantine) == 0
+    assert QuarantineList(tmp_path / "quarantine.json").get(pdf_path) is None
+
+
+def test_unknown_file_is_not_quarantined(tmp_path):
+    """Files never added are not quarantined."""
+    pdf_path = tmp_path / "invoice.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    assert QuarantineList(tmp_path / "quarantine.json").get(pdf_path) is None
+
+
+def test_limit_exception_survives_pickling():
+    """Limit violations cross process-pool boundaries intact."""
+    error = pickle.loads(
+        pickle.dumps(ConversionLimitExceeded("file_size", "File size 80.0 MB"))
+    )
+
+    assert error.limit == "file_size"
+    assert str(error) == "File size 80.0 MB"
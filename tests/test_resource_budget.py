@@ -0,0 +1,49 @@
+"""Test splitting the CPU budget between workers and model threads."""
+
+import os
+
+from config import Config
+from utils.resource_budget import THREAD_ENV_VARS, ResourceBudget
+
+
+def test_threads_default_to_an_even_share():
+    """Each worker gets an equal share of the cores."""
+    budget = ResourceBudget.from_config(total_cores=16, workers=4)
+
+    assert (budget.workers, budget.model_threads) == (4, 4)
+
+
+def test_oversubscription_is_capped():
+    """Workers never exceed the cores, and requested threads are trimmed."""
+    assert ResourceBudget.from_config(total_cores=4, workers=8).workers == 4
+
+    budget = ResourceBudget.from_config(total_cores=16, workers=8, model_threads=4)
+    assert budget.model_threads == 2
+
+
+def test_apply_updates_config_and_environment(monkeypatch):
+    """The split is written to Config and the thread-pool variables."""
+    monkeypatch.setattr(Config, "MAX_WORKERS", 4)
+    monkeypatch.setattr(Config, "MODEL_THREADS", 0)
+    for name in THREAD_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+    ResourceBudget.from_config(total_cores=6, workers=3).apply()
+
+    assert (Config.MAX_WORKERS, Config.MODEL_THREADS) == (3, 2)
+    assert os.environ["OMP_NUM_THREADS"] == "2"
+    assert os.environ["DOCLING_NUM_THREADS"] == "2"
+
+
+def test_page_range_threads_share_the_budget(monkeypatch):
+    """Range threads use leftover cores, or shrink each thread's share."""
+    monkeypatch.setattr(Config, "MODEL_THREADS", 0)
+    monkeypatch.setattr(Config, "PAGE_SPLIT_WORKERS", 0)
+    budget = ResourceBudget.from_config(total_cores=16, workers=2, model_threads=2)
+    assert budget.page_split_workers == 4
+
+    budget = ResourceBudget.from_config(total_cores=16, workers=4, page_split_workers=2)
+    assert (budget.page_split_workers, budget.model_threads) == (2, 2)
+
+    budget = ResourceBudget.from_config(total_cores=8, workers=4, page_split_workers=8)
+    assert (budget.page_split_workers, budget.model_threads) == (2, 1)
@@ -0,0 +1,96 @@
+"""Test the stream backend's bulk conversion with a stubbed Docling converter."""
+
+from types import SimpleNamespace
+
+from docling.datamodel.base_models import ConversionStatus
+from docling.datamodel.settings import settings
+
+from config import Config
+from processors.document_processor import DocumentProcessor
+from processors.ocr_recovery import OcrFailedError
+from processors.quarantine import ConversionLimitExceeded
+
+
+class _FakeConverter:
+    """Docling converter stand-in that fails documents named "broken"."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def convert_all(self, streams, raises_on_error=True):
+        self.batch_sizes.append(
+            (settings.perf.doc_batch_size, settings.perf.page_batch_size)
+        )
+        for stream in streams:
+            if stream.name.startswith("broken"):
+                yield SimpleNamespace(
+                    status=ConversionStatus.FAILURE,
+                    errors=[SimpleNamespace(error_message="unreadable page")],
+                )
+            else:
+                yield SimpleNamespace(
+                    status=ConversionStatus.SUCCESS, errors=[], document=stream.name
+                )
+
+
+def _make_processor(tmp_path, monkeypatch, converter):
+    """DocumentProcessor whose conversions go through the fake converter."""
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(Config, "PAGE_SPLIT_MIN_PAGES", None)
+    processor = DocumentProcessor(use_conversion_cache=False)
+
+    def fake_load_cached(source, profile=None, compact=None):
+        if source.path.endswith("huge.pdf"):
+            raise ConversionLimitExceeded("page_count", "Too many pages")
+        return "fast/ocr", None, None, None
+
+    def fake_store_converted(source, pipeline, document, cache_key, compact=None):
+        if document.startswith("blank"):
+            raise OcrFailedError("OCR produced no text")
+
+    monkeypatch.setattr(processor, "_load_cached", fake_load_cached)
+    monkeypatch.setattr(processor, "_store_converted", fake_store_converted)
+    monkeypatch.setattr(processor, "_get_converter", lambda pipeline: converter)
+    return processor
+
+
+def test_failures_are_yielded_per_document(tmp_path, monkeypatch):
+    """Limits, failed conversions and OCR failures don't stop the stream."""
+    converter = _FakeConverter()
+    processor = _make_processor(tmp_path, monkeypatch, converter)
+    names = ["good.pdf", "huge.pdf", "broken.pdf", "blank.pdf", "missing.pdf"]
+    for name in names[:-1]:
+        (tmp_path / name).write_bytes(b"%PDF-1.4 " + name.encode())
+
+    results = {
+        path.name: (doc_key, error)
+        for path, doc_key, error in processor.convert_documents(
+            tmp_path / name for name in names
+        )
+    }
+
+    assert sorted(results) == sorted(names)
+    assert results["good.pdf"] == (str((tmp_path / "good.pdf").resolve()), None)
+    assert isinstance(results["huge.pdf"][1], ConversionLimitExceeded)
+    assert "unreadable page" in str(results["broken.pdf"][1])
+    assert isinstance(results["blank.pdf"][1], OcrFailedError)
+    assert isinstance(results["missing.pdf"][1], RuntimeError)
+    assert [name for name, (doc_key, _) in results.items() if doc_key] == ["good.pdf"]
+
+
+def test_docling_batch_sizes_are_restored(tmp_path, monkeypatch):
+    """Batch sizes apply during the stream and are put back afterwards."""
+    converter = _FakeConverter()
+    processor = _make_processor(tmp_path, monkeypatch, converter)
+    (tmp_path / "good.pdf").write_bytes(b"%PDF-1.4")
+    monkeypatch.setattr(settings.perf, "doc_batch_size", 2)
+    monkeypatch.setattr(settings.perf, "page_batch_size", 4)
+
+    stream = processor.convert_documents(
+        [tmp_path / "good.pdf"] * 3, doc_batch_size=7, page_batch_size=9
+    )
+    next(stream)
+    stream.close()
+
+    assert converter.batch_sizes == [(7, 9)]
+    assert (settings.perf.doc_batch_size, settings.perf.page_batch_size) == (2, 4)
@@ -0,0 +1,82 @@
+"""Test building row/column grids from Docling tables."""
+
+from docling_core.types.doc import (
+    BoundingBox,
+    DoclingDocument,
+    ProvenanceItem,
+    TableCell,
+    TableData,
+)
+
+from models.table_grid import TableGrid
+
+
+def _make_table(rows: list[list[str]], header_rows: int = 0):
+    """Add a table with one cell per grid position to a new document."""
+    cells = [
+        TableCell(
+            text=text,
+            bbox=BoundingBox(l=col * 50, t=row * 10, r=col * 50 + 40, b=row * 10 + 8),
+            start_row_offset_idx=row,
+            end_row_offset_idx=row + 1,
+            start_col_offset_idx=col,
+            end_col_offset_idx=col + 1,
+            column_header=row < header_rows,
+        )
+        for row, values in enumerate(rows)
+        for col, text in enumerate(values)
+    ]
+    document = DoclingDocument(name="invoice")
+    return document.add_table(
+        data=TableData(num_rows=len(rows), num_cols=len(rows[0]), table_cells=cells),
+        prov=ProvenanceItem(
+            page_no=2,
+            bbox=BoundingBox(l=0, t=0, r=200, b=100),
+            charspan=(0, 0),
+        ),
+    )
+
+
+def test_marked_header_rows_and_provenance():
+    """Docling's column-header flags define the header; cells keep provenance."""
+    table = _make_table(
+        [
+            ["Qty", "Description", "Amount"],
+            ["2", "Labels", "40.00"],
+            ["1", "Freight", "12.50"],
+        ],
+        header_rows=1,
+    )
+
+    grid = TableGrid.from_table_item(table, index=0)
+
+    assert grid.header_rows == 1
+    assert grid.headers == ["Qty", "Description", "Amount"]
+    assert grid.body == [["2", "Labels", "40.00"], ["1", "Freight", "12.50"]]
+    assert grid.records()[0] == {"Qty": "2", "Description": "Labels", "Amount": "40.00"}
+    assert grid.find_column("amount") == 2
+
+    amount = next(cell for cell in grid.cells if cell.text == "12.50")
+    assert (amount.row, amount.col) == (2, 2)
+    assert amount.page_no == 2
+    assert amount.bbox == (100, 20, 140, 28)
+
+
+def test_unmarked_header_is_detected():
+    """A row of labels above numeric rows is treated as the header."""
+    grid = TableGrid.from_table_item(
+        _make_table([["Item", "Price"], ["Labels", "40.00"]]), index=0
+    )
+
+    assert grid.header_rows == 1
+    assert grid.headers == ["Item", "Price"]
+
+
+def test_numeric_first_row_is_not_a_header():
+    """Tables that start with data have no header."""
+    grid = TableGrid.from_table_item(
+        _make_table([["1", "Labels", "40.00"], ["2", "Boxes", "10.00"]]), index=0
+    )
+
+    assert grid.header_rows == 0
+    assert grid.find_row("boxes") == 1
@@ -0,0 +1,75 @@
+"""Test text-layer probe result logic."""
+
+import pypdfium2
+
+from config import Config
+from models.vendor import VendorType
+from processors.document_processor import (
+    WARMUP_TEXT,
+    DocumentProcessor,
+    _make_warmup_pdf,
+)
+from processors.ingest import SourceFile
+from processors.text_layer import TextLayerProbe
+
+
+def test_all_pages_with_text():
+    """Born-digital PDFs have a usable text layer on every page."""
+    probe = TextLayerProbe(
+        page_count=2, chars_per_page=[850, 120], min_chars_per_page=20
+    )
+
+    assert probe.pages_with_text == 2
+    assert probe.has_text_layer
+
+
+def test_scanned_page_requires_ocr():
+    """A single image-only page means the document needs OCR."""
+    probe = TextLayerProbe(
+        page_count=3, chars_per_page=[850, 0, 400], min_chars_per_page=20
+    )
+
+    assert probe.pages_with_text == 2
+    assert not probe.has_text_layer
+
+
+def test_empty_document_has_no_text_layer():
+    """Documents with no pages are never treated as born-digital."""
+    probe = TextLayerProbe(page_count=0, chars_per_page=[], min_chars_per_page=20)
+
+    assert not probe.has_text_layer
+
+
+def test_one_parse_serves_every_check(tmp_path, monkeypatch):
+    """Page limit, OCR probe, boilerplate pages and page ranges share one open."""
+    opened = []
+    pdf_document = pypdfium2.PdfDocument
+
+    def counting_pdf_document(*args, **kwargs):
+        opened.append(args)
+        return pdf_document(*args, **kwargs)
+
+    monkeypatch.setattr(pypdfium2, "PdfDocument", counting_pdf_document)
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(Config, "USE_METADATA_INDEX", False)
+    monkeypatch.setattr(Config, "MAX_PAGES", 10)
+    monkeypatch.setattr(
+        Config, "VENDOR_BOILERPLATE_PATTERNS", {VendorType.UNKNOWN: ["terms"]}
+    )
+    monkeypatch.setattr(Config, "PAGE_SPLIT_MIN_PAGES", 1)
+    monkeypatch.setattr(Config, "PAGE_SPLIT_WORKERS", 2)
+    processor = DocumentProcessor(use_conversion_cache=False)
+    source = SourceFile(
+        path="/bills/Unknown/invoice.pdf",
+        data=_make_warmup_pdf(WARMUP_TEXT),
+        sha256="0" * 64,
+        mtime=0.0,
+    )
+
+    pipeline, last_page, _, _ = processor._load_cached(source, profile="default")
+
+    assert pipeline == "default/text"
+    assert last_page is None
+    assert source.page_count == 1
+    assert processor._page_ranges(source) == [None]
+    assert len(opened) == 1
@@ -0,0 +1,89 @@
+"""Test Wolverine Printing line items read from table cells."""
+
+from decimal import Decimal
+
+from models.table_grid import TableGrid
+
+HEADER = [
+    "Quantity Ordered",
+    "Quantity Shipped",
+    "Order Number or Job",
+    "Description",
+    "Unit Price",
+    "Unit of Measure",
+    "Amount",
+]
+FIRST_PAGE = [
+    HEADER,
+    ["1,500", "1,500", "110201", "Labels 4x6 Gloss", "0.1200", "Each", "180.00"],
+    ["500", "500", "110202", "Labels 2x3 Matte", "0.2000", "Each", "100.00"],
+]
+# The table continues on page 2 as a second Docling table, without a header
+SECOND_PAGE = [
+    ["250", "250", "110203", "Hang Tags", "0.4000", "Each", "100.00"],
+    ["", "", "", "UPS to Grand Rapids", "", "", "21.56"],
+    ["", "", "", "", "Sales:", "", "380.00"],
+    ["9", "9", "110204", "Not an item", "1.0000", "Each", "9.00"],
+]
+
+
+class _FakeDocumentProcessor:
+    """Serves fixed table grids for any document."""
+
+    def __init__(self, tables: list[list[list[str]]]):
+        self.tables = [
+            TableGrid(index=index, num_rows=len(rows), num_cols=len(rows[0]), rows=rows)
+            for index, rows in enumerate(tables)
+        ]
+
+    def get_tables(self, doc_key):
+        return self.tables
+
+
+def _to_markdown(tables: list[list[list[str]]]) -> str:
+    """Render tables the way Docling's markdown export lays them out."""
+    blocks = []
+    for rows in tables:
+        lines = ["| " + " | ".join(row) + " |" for row in rows]
+        lines.insert(1, "|" + "---|" * len(rows[0]))
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+def _line_items(tables: list[list[list[str]]], markdown: str) -> list:
+    # Imported here: extractors import processors, which import them back
+    from extractors.wolverine_printing import WolverinePrintingExtractor
+    from models.vendor import VendorType
+
+    extractor = WolverinePrintingExtractor(_FakeDocumentProcessor(tables))
+    invoice = extractor._create_base_invoice(VendorType.WOLVERINE_PRINTING, "x.pdf")
+    extractor._extract_line_items("x.pdf", markdown, invoice)
+    return invoice.line_items
+
+
+def test_items_continue_into_the_next_pages_table():
+    """Rows of a table split across pages are read up to the totals."""
+    items = _line_items([FIRST_PAGE, SECOND_PAGE], markdown="")
+
+    assert [item.item_code for item in items] == ["110201", "110202", "110203"]
+    assert [item.amount for item in items] == [
+        Decimal("180.00"),
+        Decimal("100.00"),
+        Decimal("100.00"),
+    ]
+    assert items[0].quantity == Decimal(1500)
+    assert items[0].description == "Labels 4x6 Gloss"
+
+
+def test_cells_match_the_markdown_parser():
+    """The cells path reads the same items as the markdown fallback."""
+    tables = [FIRST_PAGE, [HEADER] + SECOND_PAGE]
+    markdown = _to_markdown(tables)
+
+    from_cells = _line_items(tables, markdown)
+    from_markdown = _line_items([], markdown)
+
+    assert len(from_cells) == 3
+    assert [item.model_dump() for item in from_cells] == [
+        item.model_dump() for item in from_markdown
+    ]
@@ -0,0 +1,169 @@
+"""CPU budget split between batch workers and per-worker model threads."""
+
+import logging
+import os
+
+from pydantic import BaseModel
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Thread-pool size variables read by OpenMP (torch, Tesseract), BLAS
+# libraries, numexpr and Docling's own AcceleratorOptions
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OMP_THREAD_LIMIT",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "DOCLING_NUM_THREADS",
+)
+
+
+def apply_thread_limits(num_threads: int) -> list[str]:
+    """
+    Cap the intra-op thread pools of the model libraries in this process.
+
+    Environment variables cover libraries not yet initialized and child
+    processes; torch and OpenCV are also capped directly since they may
+    already be loaded.
+
+    Args:
+        num_threads: Threads each model call may use
+
+    Returns:
+        Names of the libraries capped directly
+    """
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(num_threads)
+
+    applied = []
+    try:
+        import torch
+
+        torch.set_num_threads(num_threads)
+        applied.append("torch")
+    except ImportError:
+        pass
+
+    try:
+        import cv2
+
+        cv2.setNumThreads(num_threads)
+        applied.append("opencv")
+    except ImportError:
+        pass
+
+    return applied
+
+
+class ResourceBudget(BaseModel):
+    """
+    How the CPU budget is split between workers and model threads.
+
+    Every worker converts page ranges of long documents on
+    page_split_workers threads, each running Docling models with
+    model_threads intra-op threads, so
+    workers * page_split_workers * model_threads is kept within total_cores.
+    """
+
+    total_cores: int
+    workers: int
+    model_threads: int
+    page_split_workers: int = 1
+    libraries: list[str] = []  # libraries capped directly by apply()
+
+    @classmethod
+    def from_config(
+        cls,
+        total_cores: int | None = None,
+        workers: int | None = None,
+        model_threads: int | None = None,
+        page_split_workers: int | None = None,
+    ) -> "ResourceBudget":
+        """
+        Split the CPU budget.
+
+        Args:
+            total_cores: Cores to use (defaults to Config.CPU_BUDGET, or all
+                cores if that is 0)
+            workers: Parallel workers (defaults to Config.MAX_WORKERS, capped
+                at total_cores)
+            model_threads: Threads per worker (defaults to Config.MODEL_THREADS,
+                or an even share of total_cores if that is 0)
+            page_split_workers: Page-range threads per worker (defaults to
+                Config.PAGE_SPLIT_WORKERS, or the cores each worker has left
+                over after its model threads if that is 0)
+
+        Returns:
+            ResourceBudget with
+            workers * page_split_workers * model_threads <= total_cores
+        """
+        total_cores = total_cores or Config.CPU_BUDGET or os.cpu_count() or 1
+        workers = max(1, min(workers or Config.MAX_WORKERS, total_cores))
+
+        worker_cores = max(1, total_cores // workers)
+        page_split_workers = page_split_workers or Config.PAGE_SPLIT_WORKERS
+        if page_split_workers:
+            page_split_workers = max(1, min(page_split_workers, worker_cores))
+
+        share = max(1, worker_cores // (page_split_workers or 1))
+        model_threads = model_threads or Config.MODEL_THREADS or share
+        if model_threads > share:
+            logger.warning(
+                f"{workers} workers x {page_split_workers or 1} page-range "
+                f"threads x {model_threads} model threads exceeds "
+                f"{total_cores} cores, using {share} model threads"
+            )
+            model_threads = share
+
+        if not page_split_workers:
+            page_split_workers = max(1, worker_cores // model_threads)
+
+        return cls(
+            total_cores=total_cores,
+            workers=workers,
+            model_threads=model_threads,
+            page_split_workers=page_split_workers,
+        )
+
+    def apply(self) -> "ResourceBudget":
+        """
+        Apply the budget to Config and this process's model libraries.
+
+        Config.MAX_WORKERS, Config.MODEL_THREADS and Config.PAGE_SPLIT_WORKERS
+        are updated so the DocumentProcessor and worker processes pick up the
+        same split.
+
+        Returns:
+            This budget
+        """
+        Config.MAX_WORKERS = self.workers
+        Config.MODEL_THREADS = self.model_threads
+        Config.PAGE_SPLIT_WORKERS = self.page_split_workers
+        self.libraries = apply_thread_limits(self.model_threads)
+        logger.info(
+            f"Resource budget: {self.workers} workers x "
+            f"{self.page_split_workers} page-range threads x "
+            f"{self.model_threads} model threads on {self.total_cores} cores"
+        )
+        return self
+
+    def report(self) -> str:
+        """Format the effective split for printing at startup."""
+        libraries = ", ".join(["env"] + self.libraries)
+        return "\n".join(
+            [
+                f"CPU Budget:       {self.total_cores} cores",
+                f"Workers:          {self.workers}",
+                f"Page Ranges:      {self.page_split_workers} threads per worker",
+                (
+                    f"Model Threads:    {self.model_threads} per thread "
+                    f"({self.workers * self.page_split_workers * self.model_threads}"
+                    " total)"
+                ),
+                f"Thread Limits:    {libraries}",
+            ]
+        )